@@ -1,12 +1,17 @@
 import json
 import streamlit as st
 from datetime import datetime
-from utils.api import get_candidate_interviews
+from utils.api import get_candidate_interviews, get_interview_feedback, feedback_is_complete
+from utils.background import run_job, gather
 from utils.logger import setup_logger, log_user_action
 
 # Setup logger
 logger = setup_logger("dashboard")
 
+# Newest interviews whose feedback is loaded along with the list, so the
+# list can tell which feedback is ready and View Feedback opens from the cache
+FEEDBACK_PREFETCH_COUNT = 5
+
 # Config
 st.set_page_config(page_title="Dashboard", layout="wide")
 
@@ -65,7 +70,7 @@ def section(title, content):
     """Display content section with proper error handling."""
     try:
         if not content or (isinstance(content, list) and all(not str(i).strip() for i in content)):
-            logger.debug(f"Skipping empty section: {title}")
+            logger.debug("Skipping empty section: %s", title)
             return
         
         with st.expander(f"{title}", expanded=True):
@@ -76,9 +81,9 @@ def section(title, content):
             else:
                 st.markdown(content)
         
-        logger.debug(f"Successfully displayed section: {title}")
+        logger.debug("Successfully displayed section: %s", title)
     except Exception as e:
-        logger.error(f"Error displaying section {title}: {str(e)}")
+        logger.error("Error displaying section %s: %s", title, e)
         st.error(f"Error displaying {title} section")
 
 
@@ -87,7 +92,7 @@ def inline_section(title, items):
     """Display inline section with proper error handling."""
     try:
         if not items or not any(str(i).strip() for i in items):
-            logger.debug(f"Skipping empty inline section: {title}")
+            logger.debug("Skipping empty inline section: %s", title)
             return
         
         with st.expander(f"{title}", expanded=True):
@@ -97,22 +102,37 @@ def inline_section(title, items):
                     st.markdown(f'<li>{item}</li>', unsafe_allow_html=True)
             st.markdown('</ul>', unsafe_allow_html=True)
         
-        logger.debug(f"Successfully displayed inline section: {title}")
+        logger.debug("Successfully displayed inline section: %s", title)
     except Exception as e:
-        logger.error(f"Error displaying inline section {title}: {str(e)}")
+        logger.error("Error displaying inline section %s: %s", title, e)
         st.error(f"Error displaying {title} section")
 
 
+# Helper: Interview history, run as a background job
+def load_history(email):
+    """Fetch the interview list, then the feedback of the newest interviews all at once.
+    
+    Runs as a background job. Returns the interviews response and the feedback
+    responses by interview id.
+    """
+    response = get_candidate_interviews(email)
+    interviews = response.get("interviews", []) if isinstance(response, dict) else []
+    recent = sorted((interview for interview in interviews if isinstance(interview, dict) and interview.get("id")),
+                    key=lambda x: x.get("created_at", ""), reverse=True)[:FEEDBACK_PREFETCH_COUNT]
+    feedback = gather("interview_feedback", *[(get_interview_feedback, interview["id"]) for interview in recent])
+    return response, {interview["id"]: result for interview, result in zip(recent, feedback)}
+
+
 # Display sections with error handling
 try:
-    logger.info(f"Displaying profile sections for user: {email}")
+    logger.info("Displaying profile sections for user: %s", email)
     section("🎓 Education", education)
     section("🛠 Skills", skills)
     section("📁 Projects", projects)
     section("🏆 Achievements", achievements)
     section("💼 Experience", experience)
 except Exception as e:
-    logger.error(f"Error displaying profile sections: {str(e)}")
+    logger.error("Error displaying profile sections: %s", e)
     st.error("Error loading profile information")
 
 # CTA
@@ -125,25 +145,27 @@ try:
         log_user_action(logger, "Start Interview button clicked", email)
         st.switch_page("pages/interview.py")
 except Exception as e:
-    logger.error(f"Error with interview navigation: {str(e)}")
+    logger.error("Error with interview navigation: %s", e)
     st.error("Error loading interview page")
 
 st.subheader("🗂️ Previous Interviews")
 
 # Fetch and display previous interviews with comprehensive error handling
 try:
-    logger.info(f"Fetching interview history for user: {email}")
-    response = get_candidate_interviews(email)
+    if "history_job" not in st.session_state:
+        logger.info("Fetching interview history for user: %s", email)
+    response, feedback_by_id = run_job("history_job", "history", load_history, email,
+                                       text="Loading your previous interviews...")
     
     if response is None:
-        logger.warning(f"No response received from API for user: {email}")
+        logger.warning("No response received from API for user: %s", email)
         st.warning("Unable to connect to the server. Please try again later.")
     elif not isinstance(response, dict):
-        logger.error(f"Invalid response format received for user {email}: {type(response)}")
+        logger.error("Invalid response format received for user %s: %s", email, type(response))
         st.error("Received invalid data from server.")
     else:
         interviews = response.get("interviews", [])
-        logger.info(f"Found {len(interviews)} interviews for user: {email}")
+        logger.info("Found %s interviews for user: %s", len(interviews), email)
         if interviews:
             try:
                 # Sort interviews by creation date
@@ -153,7 +175,7 @@ try:
                     try:
                         # Validate interview data
                         if not isinstance(interview, dict):
-                            logger.warning(f"Invalid interview data at index {idx} for user {email}")
+                            logger.warning("Invalid interview data at index %s for user %s", idx, email)
                             continue
                         
                         interview_id = interview.get("id", "unknown")
@@ -170,7 +192,7 @@ try:
                                     formatted_date = datetime.fromisoformat(created_at).strftime('%b %d, %Y %I:%M %p')
                                     st.markdown(f"📅 {formatted_date}")
                                 except (ValueError, TypeError) as e:
-                                    logger.warning(f"Invalid date format for interview {interview_id}: {created_at}")
+                                    logger.warning("Invalid date format for interview %s: %s", interview_id, created_at)
                                     st.markdown(f"📅 {created_at}")
                             else:
                                 st.markdown("📅 Date not available")
@@ -179,6 +201,8 @@ try:
                             st.markdown(f"**📝 Summary:** {summary}")
                         
                         with col2:
+                            if interview_id in feedback_by_id and not feedback_is_complete(feedback_by_id[interview_id]):
+                                st.caption("⏳ Feedback in progress")
                             # Store interview ID in session state for feedback viewing
                             if st.button(f"🔍 View Feedback", key=f"feedback_{interview_id}_{idx}"):
                                 st.session_state["selected_interview_id"] = interview_id
@@ -188,20 +212,20 @@ try:
                         st.markdown("---")
                         
                     except Exception as e:
-                        logger.error(f"Error displaying interview {idx} for user {email}: {str(e)}")
+                        logger.error("Error displaying interview %s for user %s: %s", idx, email, e)
                         st.error(f"Error displaying interview data")
                         continue
                         
             except Exception as e:
-                logger.error(f"Error processing interviews list for user {email}: {str(e)}")
+                logger.error("Error processing interviews list for user %s: %s", email, e)
                 st.error("Error processing interview history")
         else:
-            logger.info(f"No interviews found for user: {email}")
+            logger.info("No interviews found for user: %s", email)
             st.info("No previous interviews found.")
 
 except Exception as e:
-    logger.error(f"Unexpected error loading interviews for user {email}: {str(e)}")
+    logger.error("Unexpected error loading interviews for user %s: %s", email, e)
     st.error("An unexpected error occurred while loading your interview history. Please try refreshing the page.")
 
 # Log page completion
-logger.info(f"Dashboard page loaded successfully for user: {email}")
\ No newline at end of file
+logger.info("Dashboard page loaded successfully for user: %s", email)
@@ -1,5 +1,6 @@
 import streamlit as st
 from utils.api import login_user
+from utils.background import start_job, await_job
 from utils.logger import setup_logger, log_user_action
 
 # Setup logger
@@ -90,49 +91,58 @@ if submitted:
         logger.warning("Login attempt with empty email")
         st.warning("Please enter a valid email address.")
     else:
+        logger.info("Login attempt for email: %s", email)
+        log_user_action(logger, "Login attempt", email)
+        st.session_state.login_email = email
         try:
-            logger.info(f"Login attempt for email: {email}")
-            log_user_action(logger, "Login attempt", email)
-            
-            response = login_user(email)
-
-            if response is None:
-                logger.warning(f"Login failed - no response from API for email: {email}")
-                st.error("❌ Unable to connect to the server. Please try again later.")
-            elif not isinstance(response, dict):
-                logger.error(f"Login failed - invalid response format for email: {email}")
-                st.error("❌ Received invalid response from server.")
-            elif response.get("status"):
-                data = response.get("data", {})
-                
-                # Validate required data fields
-                if not data.get("name"):
-                    logger.warning(f"Login successful but missing name data for email: {email}")
-                
-                st.session_state.update({
-                    "email": email,
-                    "logged_in": True,
-                    "role": data.get("role", ""),
-                    "name": data.get("name", "User"),
-                    "skills": data.get("skills", []),
-                    "projects": data.get("projects", []),
-                    "education": data.get("education", []),
-                    "achievements": data.get("achievements", []),
-                    "experience": data.get("experience", [])
-                })
-
-                logger.info(f"Login successful for email: {email}")
-                log_user_action(logger, "Login successful", email, role=data.get("role", ""))
-                
-                st.success("✅ Logged in successfully. Redirecting...")
-                st.switch_page("pages/dashboard.py")
-            else:
-                logger.info(f"Login failed - user not found for email: {email}")
-                log_user_action(logger, "Login failed - user not found", email)
-                st.error("❌ User not found. Redirecting to registration...")
-                st.switch_page("pages/new_user.py")
-                
+            start_job("login_job", "login", login_user, email)
         except Exception as e:
-            logger.error(f"Unexpected error during login for email {email}: {str(e)}")
-            st.error("❌ An unexpected error occurred. Please try again later.")
-            # Optionally provide a way to retry or go to registration
+            logger.error("Could not start login for email %s: %s", email, e)
+            st.error("❌ The server is busy. Please try again in a moment.")
+
+# The login call runs in the background; its result is picked up here on a later run
+if "login_job" in st.session_state:
+    email = st.session_state.login_email
+    try:
+        response = await_job("login_job", "Logging in...")
+
+        if response is None:
+            logger.warning("Login failed - no response from API for email: %s", email)
+            st.error("❌ Unable to connect to the server. Please try again later.")
+        elif not isinstance(response, dict):
+            logger.error("Login failed - invalid response format for email: %s", email)
+            st.error("❌ Received invalid response from server.")
+        elif response.get("status"):
+            data = response.get("data", {})
+            
+            # Validate required data fields
+            if not data.get("name"):
+                logger.warning("Login successful but missing name data for email: %s", email)
+            
+            st.session_state.update({
+                "email": email,
+                "logged_in": True,
+                "role": data.get("role", ""),
+                "name": data.get("name", "User"),
+                "skills": data.get("skills", []),
+                "projects": data.get("projects", []),
+                "education": data.get("education", []),
+                "achievements": data.get("achievements", []),
+                "experience": data.get("experience", [])
+            })
+
+            logger.info("Login successful for email: %s", email)
+            log_user_action(logger, "Login successful", email, role=data.get("role", ""))
+            
+            st.success("✅ Logged in successfully. Redirecting...")
+            st.switch_page("pages/dashboard.py")
+        else:
+            logger.info("Login failed - user not found for email: %s", email)
+            log_user_action(logger, "Login failed - user not found", email)
+            st.error("❌ User not found. Redirecting to registration...")
+            st.switch_page("pages/new_user.py")
+            
+    except Exception as e:
+        logger.error("Unexpected error during login for email %s: %s", email, e)
+        st.error("❌ An unexpected error occurred. Please try again later.")
+        # Optionally provide a way to retry or go to registration
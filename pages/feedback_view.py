@@ -24,13 +24,13 @@ log_user_action(logger, "Feedback view accessed", email)
 interview_id = st.session_state.get("selected_interview_id", 1)  # Default to 1 for testing
 
 if not interview_id:
-    logger.warning(f"No interview ID provided for user: {email}")
+    logger.warning("No interview ID provided for user: %s", email)
     st.error("No interview ID provided. Please select an interview from the dashboard.")
     if st.button("← Back to Dashboard"):
         st.switch_page("pages/dashboard.py")
     st.stop()
 
-logger.info(f"Loading feedback for interview ID: {interview_id}, user: {email}")
+logger.info("Loading feedback for interview ID: %s, user: %s", interview_id, email)
 
 # --- Show loading spinner while fetching ---
 with st.spinner("Loading feedback..."):
@@ -38,7 +38,7 @@ with st.spinner("Loading feedback..."):
         response = get_interview_feedback(interview_id)
         
         if response is None:
-            logger.error(f"Failed to fetch feedback for interview {interview_id}: No response from API")
+            logger.error("Failed to fetch feedback for interview %s: No response from API", interview_id)
             st.error("Unable to connect to the server. Please try again later.")
             if st.button("🔄 Retry"):
                 st.rerun()
@@ -55,7 +55,7 @@ with st.spinner("Loading feedback..."):
         #     logger.warning(f"Could not save feedback to file: {str(save_error)}")
         
         if not isinstance(response, dict):
-            logger.error(f"Invalid response format for interview {interview_id}: {type(response)}")
+            logger.error("Invalid response format for interview %s: %s", interview_id, type(response))
             st.error("Received invalid data format from server.")
             if st.button("← Back to Dashboard"):
                 st.switch_page("pages/dashboard.py")
@@ -63,17 +63,17 @@ with st.spinner("Loading feedback..."):
             
         if response.get("status") != "success":
             error_msg = response.get("message", "Unknown error")
-            logger.error(f"API returned error for interview {interview_id}: {error_msg}")
+            logger.error("API returned error for interview %s: %s", interview_id, error_msg)
             st.error(f"Failed to fetch feedback: {error_msg}")
             if st.button("← Back to Dashboard"):
                 st.switch_page("pages/dashboard.py")
             st.stop()
             
         data = response.get("data", {})
-        logger.info(f"Successfully loaded feedback for interview {interview_id}")
+        logger.info("Successfully loaded feedback for interview %s", interview_id)
         
     except Exception as e:
-        logger.error(f"Unexpected error fetching feedback for interview {interview_id}: {str(e)}")
+        logger.error("Unexpected error fetching feedback for interview %s: %s", interview_id, e)
         st.error(f"An unexpected error occurred while loading feedback.")
         if st.button("🔄 Retry"):
             st.rerun()
@@ -82,7 +82,7 @@ with st.spinner("Loading feedback..."):
         st.stop()
 
 if not data:
-    logger.warning(f"No feedback data available for interview {interview_id}")
+    logger.warning("No feedback data available for interview %s", interview_id)
     st.warning("No feedback data available for this interview.")
     if st.button("← Back to Dashboard"):
         st.switch_page("pages/dashboard.py")
@@ -94,7 +94,7 @@ overall_q_summary = question_block.get("overall_analysis")
 
 # Validate data structure
 if not overall and not questions:
-    logger.warning(f"Empty feedback data for interview {interview_id}")
+    logger.warning("Empty feedback data for interview %s", interview_id)
     st.warning("Feedback data appears to be incomplete.")
 
 # --- SECTION: Overall Evaluation ---
@@ -138,7 +138,7 @@ try:
     st.divider()
 
 except Exception as e:
-    logger.error(f"Error displaying overall feedback for interview {interview_id}: {str(e)}")
+    logger.error("Error displaying overall feedback for interview %s: %s", interview_id, e)
     st.error("Error displaying overall feedback section.")
 
 # --- SECTION: Feedback by Question ---
@@ -186,12 +186,12 @@ try:
                         st.info("No detailed analysis available for this question.")
                         
             except Exception as e:
-                logger.error(f"Error displaying question {i} feedback for interview {interview_id}: {str(e)}")
+                logger.error("Error displaying question %s feedback for interview %s: %s", i, interview_id, e)
                 st.error(f"Error displaying feedback for question {i}")
                 continue
 
 except Exception as e:
-    logger.error(f"Error displaying question feedback section for interview {interview_id}: {str(e)}")
+    logger.error("Error displaying question feedback section for interview %s: %s", interview_id, e)
     st.error("Error displaying detailed question feedback.")
 
 # Add navigation back to dashboard
@@ -201,4 +201,4 @@ if st.button("← Back to Dashboard", key="back_to_dashboard"):
     st.switch_page("pages/dashboard.py")
 
 # Log successful page completion
-logger.info(f"Feedback view completed successfully for interview {interview_id}, user: {email}")
+logger.info("Feedback view completed successfully for interview %s, user: %s", interview_id, email)
@@ -1,5 +1,6 @@
 import streamlit as st
 from utils.api import get_feedback
+from utils.background import run_job
 from utils.logger import setup_logger, log_user_action
 
 # Setup logger
@@ -22,43 +23,46 @@ if not email:
 #         st.switch_page("pages/dashboard.py")
 #     st.stop()
 
-logger.info(f"Final feedback page accessed by user: {email}")
+logger.info("Final feedback page accessed by user: %s", email)
 log_user_action(logger, "Final feedback page accessed", email)
 
 # --- Fetch Feedback ---
-with st.spinner("🔄 Fetching your interview feedback... Please wait."):
-    try:
-        logger.info(f"Fetching final feedback for user: {email}")
-        feedback = get_feedback(email)
-        
-        if feedback is None:
-            logger.error(f"Failed to fetch feedback for user {email}: No response from API")
-            st.error("Unable to connect to the server. Please try again later.")
-            if st.button("🔄 Retry"):
-                st.rerun()
-            if st.button("← Go to Dashboard"):
-                st.switch_page("pages/dashboard.py")
-            st.stop()
-            
-        if not isinstance(feedback, dict):
-            logger.error(f"Invalid feedback response format for user {email}: {type(feedback)}")
-            st.error("Received invalid data format from server.")
-            if st.button("← Go to Dashboard"):
-                st.switch_page("pages/dashboard.py")
-            st.stop()
-            
-    except Exception as e:
-        logger.error(f"Unexpected error fetching feedback for user {email}: {str(e)}")
-        st.error("An unexpected error occurred while loading your feedback.")
+# Generating feedback can take minutes; it runs as a background job and this
+# run stops at run_job until the job's progress fragment reruns the page
+try:
+    if "final_feedback_job" not in st.session_state:
+        logger.info("Fetching final feedback for user: %s", email)
+    feedback = run_job("final_feedback_job", "final_feedback", get_feedback, email,
+                       text="🔄 Fetching your interview feedback... Please wait.")
+    
+    if feedback is None:
+        logger.error("Failed to fetch feedback for user %s: No response from API", email)
+        st.error("Unable to connect to the server. Please try again later.")
         if st.button("🔄 Retry"):
             st.rerun()
         if st.button("← Go to Dashboard"):
             st.switch_page("pages/dashboard.py")
         st.stop()
+        
+    if not isinstance(feedback, dict):
+        logger.error("Invalid feedback response format for user %s: %s", email, type(feedback))
+        st.error("Received invalid data format from server.")
+        if st.button("← Go to Dashboard"):
+            st.switch_page("pages/dashboard.py")
+        st.stop()
+        
+except Exception as e:
+    logger.error("Unexpected error fetching feedback for user %s: %s", email, e)
+    st.error("An unexpected error occurred while loading your feedback.")
+    if st.button("🔄 Retry"):
+        st.rerun()
+    if st.button("← Go to Dashboard"):
+        st.switch_page("pages/dashboard.py")
+    st.stop()
 
 if feedback.get("status") != "success":
     error_msg = feedback.get("message", "Unknown error")
-    logger.warning(f"API returned error for feedback request by user {email}: {error_msg}")
+    logger.warning("API returned error for feedback request by user %s: %s", email, error_msg)
     st.warning(f"No feedback found or failed to load: {error_msg}")
     if st.button("← Go to Dashboard"):
         st.switch_page("pages/dashboard.py")
@@ -66,13 +70,13 @@ if feedback.get("status") != "success":
 
 data = feedback.get("data", {})
 if not data:
-    logger.warning(f"Empty feedback data for user: {email}")
+    logger.warning("Empty feedback data for user: %s", email)
     st.warning("No feedback data available.")
     if st.button("← Go to Dashboard"):
         st.switch_page("pages/dashboard.py")
     st.stop()
 
-logger.info(f"Successfully loaded feedback for user: {email}")
+logger.info("Successfully loaded feedback for user: %s", email)
 overall = data.get("overall_feedback", {})
 question_block = data.get("feedback_by_question", {})
 questions = question_block.get("question_analysis", [])
@@ -119,7 +123,7 @@ try:
     st.divider()
 
 except Exception as e:
-    logger.error(f"Error displaying overall feedback for user {email}: {str(e)}")
+    logger.error("Error displaying overall feedback for user %s: %s", email, e)
     st.error("Error displaying overall feedback section.")
 
 # --- SECTION: Feedback by Question ---
@@ -167,18 +171,18 @@ try:
                         st.info("No detailed analysis available for this question.")
                         
             except Exception as e:
-                logger.error(f"Error displaying question {i} feedback for user {email}: {str(e)}")
+                logger.error("Error displaying question %s feedback for user %s: %s", i, email, e)
                 st.error(f"Error displaying feedback for question {i}")
                 continue
 
 except Exception as e:
-    logger.error(f"Error displaying question feedback section for user {email}: {str(e)}")
+    logger.error("Error displaying question feedback section for user %s: %s", email, e)
     st.error("Error displaying detailed question feedback.")
 
 # Mark feedback as viewed and add navigation
 try:
     st.session_state.interview_state = "feedback_viewed"
-    logger.info(f"Interview state updated to feedback_viewed for user: {email}")
+    logger.info("Interview state updated to feedback_viewed for user: %s", email)
     
     st.markdown("---")
     st.markdown("### 🎉 Interview Complete!")
@@ -196,9 +200,9 @@ try:
             st.switch_page("pages/interview.py")
 
     # Log successful page completion
-    logger.info(f"Final feedback page completed successfully for user: {email}")
+    logger.info("Final feedback page completed successfully for user: %s", email)
     
 except Exception as e:
-    logger.error(f"Error updating interview state for user {email}: {str(e)}")
+    logger.error("Error updating interview state for user %s: %s", email, e)
     st.error("Error completing the feedback process.")
 
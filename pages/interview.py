@@ -10,8 +10,15 @@ import streamlit as st
 import streamlit.components.v1 as components
 import time
 import requests
-from utils.api import get_initial_question, get_next_question, upload_audio_response
-from utils.text_to_speech_util import speak_question
+from utils.background import submit_job, await_job, gather, JobQueueFull
+from utils.audio_codec import encode_audio
+from utils.audio_processing import preprocess_for_upload, load_wav_mono, to_upload_wav, trim_silence, analyze_quality
+from utils.api import get_initial_question, get_next_question, upload_audio_response, get_upload_status, invalidate_user_cache, PUBLIC_API_BASE, UPLOAD_PATH, CHUNK_UPLOAD_PATH
+from utils.upload_token import create_upload_token, direct_upload_enabled, UPLOAD_TOKEN_TTL
+from utils.direct_recorder import direct_recorder
+from utils.audio_stream import AudioStreamUploader
+from utils.text_to_speech_util import speak_question, replay_question
+from utils.speech_synthesis import synthesize_question, cached_question_audio, get_synthesis_pool, DEFAULT_TTS_RATE
 from utils.logger import setup_logger, log_user_action
 from streamlit_mic_recorder import mic_recorder
 import datetime
@@ -21,7 +28,46 @@ logger = setup_logger("interview")
 
 # Configuration
 MAX_QUESTIONS = 6
-BACKEND_URL = "http://65.0.75.215:8081"
+# Upload answers as a background job and fetch the next question as soon as
+# the upload is accepted, instead of after the success banner and a rerun.
+PREFETCH_NEXT_QUESTION = True
+# Seconds between polls of a running upload job
+UPLOAD_POLL_INTERVAL = 0.5
+# Encoding applied to answers before upload: "opus" (smallest), "flac" (lossless)
+# or "wav" (send the recording unchanged)
+UPLOAD_AUDIO_FORMAT = "opus"
+UPLOAD_AUDIO_BITRATE = 32000
+# Downmix and resample answers to 16 kHz mono before encoding
+RESAMPLE_BEFORE_UPLOAD = True
+# Cut silence before and after the answer, and shorten pauses longer than
+# MAX_PAUSE_SECONDS (None keeps every pause)
+TRIM_SILENCE = True
+MAX_PAUSE_SECONDS = 2.0
+# Check level, clipping, speech and duration locally and refuse answers that
+# would only waste a backend transcription pass
+QUALITY_GATE = True
+# How answers are recorded: "mic_recorder" passes the audio through this server
+# (quality gate, trimming and encoding above apply); "direct" records in the
+# browser and uploads straight to the backend with a signed token, which needs
+# DIRECT_UPLOAD_SECRET set to the secret the backend verifies tokens with;
+# "chunked" is "direct" but sends the answer while the candidate is speaking;
+# "webrtc" streams the microphone to this server over WebRTC, which resamples
+# it to 16 kHz and forwards it to the backend ingest endpoint as it arrives
+RECORDING_MODE = "mic_recorder"
+# Milliseconds of audio per chunk in "chunked" mode
+CHUNK_INTERVAL_MS = 1000
+WEBRTC_RTC_CONFIGURATION = {"iceServers": [{"urls": ["stun:stun.l.google.com:19302"]}]}
+# Renew a direct upload token when it has less than this many seconds left
+DIRECT_UPLOAD_TOKEN_MARGIN = 120
+# How questions are read out: "browser" uses the candidate's browser voices;
+# "server" synthesizes them here with pyttsx3 (cached on disk, so a question
+# already asked is never synthesized again) and falls back to "browser" on failure
+TTS_MODE = "browser"
+TTS_VOICE = None  # pyttsx3 voice id, None for the engine default
+TTS_RATE = DEFAULT_TTS_RATE
+# Question audio URLs remembered per session; the next question's audio is
+# synthesized while the answer is uploaded, so only a few are ever needed
+QUESTION_AUDIO_ENTRIES = 3
 
 def initialize_interview_state():
     """Initialize session state for interview"""
@@ -34,6 +80,9 @@ def initialize_interview_state():
         st.session_state.interview_completed = False
         st.session_state.question_spoken = False
         st.session_state.recording_start_time = None
+        if TTS_MODE == "server":
+            # Start the speech engines now so they are warm by the first question
+            get_synthesis_pool()
 
 def add_custom_css():
     """Add custom CSS for professional and appealing design"""
@@ -216,37 +265,48 @@ def fetch_question(is_first_question=False):
     email = st.session_state.get('email')
     try:
         if is_first_question:
-            logger.info(f"Fetching initial question for user: {email}")
+            logger.info("Fetching initial question for user: %s", email)
             response = get_initial_question(email)
         else:
-            logger.info(f"Fetching next question for user: {email}")
+            logger.info("Fetching next question for user: %s", email)
             response = get_next_question()
         
+        return apply_question_response(response, is_first_question)
+        
+    except Exception as e:
+        logger.error("Unexpected error fetching question for user %s: %s", email, e)
+        st.markdown('<div class="error-alert">❌ An unexpected error occurred while fetching the question.</div>', unsafe_allow_html=True)
+        return None
+
+def apply_question_response(response, is_first_question=False):
+    """Validate a question API response and make it the current question"""
+    email = st.session_state.get('email')
+    try:
         if response is None:
-            logger.error(f"No response received when fetching question for user: {email}")
+            logger.error("No response received when fetching question for user: %s", email)
             st.markdown('<div class="error-alert">❌ Unable to connect to server. Please check your connection.</div>', unsafe_allow_html=True)
             return None
             
         if not isinstance(response, dict):
-            logger.error(f"Invalid response format when fetching question for user {email}: {type(response)}")
+            logger.error("Invalid response format when fetching question for user %s: %s", email, type(response))
             st.markdown('<div class="error-alert">❌ Received invalid response from server.</div>', unsafe_allow_html=True)
             return None
         
         if response.get("status") != "success":
             error_msg = response.get("message", "Unknown error")
-            logger.error(f"API error fetching question for user {email}: {error_msg}")
+            logger.error("API error fetching question for user %s: %s", email, error_msg)
             st.markdown(f'<div class="error-alert">❌ Failed to fetch question: {error_msg}</div>', unsafe_allow_html=True)
             return None
         
         question_data = response.get("data", {})
         if not isinstance(question_data, dict):
-            logger.error(f"Invalid question data format for user {email}: {type(question_data)}")
+            logger.error("Invalid question data format for user %s: %s", email, type(question_data))
             st.markdown('<div class="error-alert">❌ Invalid question data received.</div>', unsafe_allow_html=True)
             return None
             
         question = question_data.get("question", "")
         if not question.strip():
-            logger.error(f"Empty question received for user: {email}")
+            logger.error("Empty question received for user: %s", email)
             st.markdown('<div class="error-alert">❌ No question received from server.</div>', unsafe_allow_html=True)
             return None
         
@@ -254,11 +314,11 @@ def fetch_question(is_first_question=False):
         if is_first_question:
             st.session_state.current_question_index = 1
             st.session_state.total_questions_asked = 1
-            logger.info(f"Initial question loaded for user {email}: {question[:50]}...")
+            logger.info("Initial question loaded for user %s: %s...", email, question[:50])
         else:
             st.session_state.current_question_index += 1
             st.session_state.total_questions_asked += 1
-            logger.info(f"Next question ({st.session_state.current_question_index}) loaded for user {email}: {question[:50]}...")
+            logger.info("Next question (%s) loaded for user %s: %s...", st.session_state.current_question_index, email, question[:50])
         
         st.session_state.current_question = question
         st.session_state.interview_state = 'asking'
@@ -271,58 +331,219 @@ def fetch_question(is_first_question=False):
             'question_index': st.session_state.current_question_index
         })
         
-        log_user_action(logger, f"Question {st.session_state.current_question_index} fetched", email, 
+        log_user_action(logger, "Question fetched", email, question_index=st.session_state.current_question_index,
                        question_type="initial" if is_first_question else "next")
         
         return question
         
     except Exception as e:
-        logger.error(f"Unexpected error fetching question for user {email}: {str(e)}")
+        logger.error("Unexpected error applying question for user %s: %s", email, e)
         st.markdown('<div class="error-alert">❌ An unexpected error occurred while fetching the question.</div>', unsafe_allow_html=True)
         return None
 
-def upload_audio_to_backend(audio_bytes, question_text):
-    """Sends the recorded audio bytes and question to the backend."""
+def prepare_answer_audio(audio_bytes):
+    """Decode a recorded answer, check its quality and trim its silence before upload.
+    
+    Returns the decoded (samples, sample_rate) pair, the recording unchanged if
+    it cannot be decoded, or None if the quality gate rejected it. Quality and
+    duration stats are kept on the current question's entry in
+    questions_responses; warnings go to st.session_state.answer_warnings.
+    """
     email = st.session_state.get('email')
+    try:
+        samples, rate = load_wav_mono(audio_bytes)
+    except ValueError as e:
+        logger.warning("Could not decode answer for user %s, sending as recorded: %s", email, e)
+        return audio_bytes
+    
+    if QUALITY_GATE:
+        report = analyze_quality(samples, rate)
+        if st.session_state.questions_responses:
+            st.session_state.questions_responses[-1]['audio_quality'] = report
+        messages = " ".join(issue['message'] for issue in report['issues'])
+        if report['verdict'] == 'reject':
+            logger.warning("Answer rejected by quality gate for user %s: %s", email, messages)
+            log_user_action(logger, "Answer rejected before upload", email, duration=report['duration_seconds'],
+                            rms_db=report['rms_db'], speech_ratio=report['speech_ratio'])
+            st.markdown(f'<div class="error-alert">🎙️ {messages} Please record your answer again.</div>', unsafe_allow_html=True)
+            return None
+        if report['verdict'] == 'warn':
+            logger.info("Answer quality warning for user %s: %s", email, messages)
+            st.session_state.answer_warnings = [issue['message'] for issue in report['issues']]
+    
+    if TRIM_SILENCE:
+        samples, stats = trim_silence(samples, rate, max_pause=MAX_PAUSE_SECONDS)
+        if st.session_state.questions_responses:
+            st.session_state.questions_responses[-1]['audio_stats'] = stats
+        log_user_action(logger, "Answer silence trimmed", email, **stats)
+    
+    return samples, rate
+
+def _encode_answer(answer_audio, email):
+    """Resample and compress an answer for upload, falling back to the raw recording on failure"""
+    if isinstance(answer_audio, tuple):
+        samples, rate = answer_audio
+        audio_bytes = to_upload_wav(samples, rate) if RESAMPLE_BEFORE_UPLOAD else to_upload_wav(samples, rate, rate)
+    else:
+        audio_bytes = answer_audio
+        if RESAMPLE_BEFORE_UPLOAD:
+            try:
+                audio_bytes = preprocess_for_upload(audio_bytes)
+            except Exception as e:
+                logger.warning("Could not resample answer for user %s, sending as recorded: %s", email, e)
+    try:
+        return encode_audio(audio_bytes, UPLOAD_AUDIO_FORMAT, bitrate=UPLOAD_AUDIO_BITRATE)
+    except Exception as e:
+        logger.warning("Could not encode answer as %s for user %s, sending WAV: %s", UPLOAD_AUDIO_FORMAT, email, e)
+        return audio_bytes, "response.wav", "audio/wav"
+
+def _upload_answer(answer_audio, question_text, email, progress=None):
+    """Upload one answer and return the parsed response. Safe to run off the script thread."""
+    audio_data, filename, content_type = _encode_answer(answer_audio, email)
+    response = upload_audio_response(question_text, audio_data, email=email, progress=progress,
+                                     filename=filename, content_type=content_type)
+    response.raise_for_status()
+    return response.json()
+
+def _fetch_next_question(job, email):
+    """Fetch the next question for a job and publish it as job.values['next_question']."""
+    logger.info("Prefetching next question for user: %s", email)
+    response = get_next_question()
+    _start_question_audio(job, response)
+    job.update(next_question=response)
+    return response
+
+def _submit_with_next_question(job, submit_answer, email, prefetch_next, next_question=None):
+    """Run submit_answer() and, with prefetch_next, the next-question fetch at the same time.
+    
+    next_question is a question already fetched by an earlier attempt whose
+    upload failed; it is used instead of fetching another one. Returns the
+    next-question response, or None without prefetch.
+    """
+    if not prefetch_next:
+        submit_answer()
+        return None
+    if next_question is not None:
+        submit_answer()
+        return next_question
+    return gather("next_question", (submit_answer,), (_fetch_next_question, job, email))[1]
+
+def _answer_upload_job(job, answer_audio, question_text, email, prefetch_next, next_question=None):
+    """Background job: upload the answer while fetching the next question.
+    
+    The upload result is published as job.values['upload'] as soon as it is known,
+    so the page can show it while the next question is still being fetched.
+    The job's result is the next-question response, or None without prefetch.
+    """
+    def report_progress(sent, total):
+        if total:
+            job.update(0.05 + 0.85 * sent / total,
+                       f"Uploading your response... {sent // 1024} of {total // 1024} KB")
+    
+    def upload():
+        result = _upload_answer(answer_audio, question_text, email, progress=report_progress)
+        job.update(0.9, "Response submitted", upload=result)
+    
+    job.update(0.05, "Uploading your response...")
+    return _submit_with_next_question(job, upload, email, prefetch_next, next_question)
+
+def _describe_upload_error(error):
+    """Map an upload exception to the message shown to the candidate."""
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Upload timeout. Please check your connection and try again."
+    if isinstance(error, requests.exceptions.RequestException):
+        return f"Upload Failed: Could not send audio to the backend. Error: {error}"
+    return "An unexpected error occurred during upload."
+
+def upload_audio_to_backend(answer_audio, question_text, prefetch_next=False):
+    """Starts sending the recorded audio and question to the backend.
     
-    if not audio_bytes:
-        logger.warning(f"No audio data to upload for user: {email}")
+    answer_audio is the recording's bytes or the (samples, sample_rate) pair
+    from prepare_answer_audio. The upload runs on the shared background executor and this returns its job
+    handle immediately; the page polls it in show_upload_progress. With
+    prefetch_next the same job fetches the next question while the answer
+    uploads, reusing one fetched by a failed earlier attempt.
+    """
+    email = st.session_state.get('email')
+    
+    if not answer_audio:
+        logger.warning("No audio data to upload for user: %s", email)
         st.markdown('<div class="error-alert">No audio data to upload.</div>', unsafe_allow_html=True)
         return None
     
     try:
-        logger.info(f"Uploading audio response for user {email}, question: {question_text[:50]}...")
-        
-        files = {'audio_file': ('response.wav', audio_bytes, 'audio/wav')}
-        payload = {'question': question_text}
-        
-        url = f"{BACKEND_URL}/interview/responses/upload"
-        response = requests.post(url, files=files, data=payload, timeout=30)
-        response.raise_for_status()
-        
-        result = response.json()
-        logger.info(f"Audio upload successful for user: {email}")
-        log_user_action(logger, "Audio response uploaded", email, question_length=len(question_text))
-        
-        return result
-        
-    except requests.exceptions.Timeout as e:
-        logger.error(f"Upload timeout for user {email}: {str(e)}")
-        st.markdown('<div class="error-alert">Upload timeout. Please check your connection and try again.</div>', unsafe_allow_html=True)
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Upload request failed for user {email}: {str(e)}")
-        st.markdown(f'<div class="error-alert">Upload Failed: Could not send audio to the backend. Error: {e}</div>', unsafe_allow_html=True)
+        logger.info("Uploading audio response for user %s, question: %s...", email, question_text[:50])
+        job = submit_job("answer_upload", _answer_upload_job, answer_audio, question_text, email, prefetch_next,
+                         st.session_state.get('unused_next_question'))
+        st.session_state.pop('unused_next_question', None)
+        return job
+    except JobQueueFull as e:
+        logger.error("Upload queue full for user %s: %s", email, e)
+        st.markdown('<div class="error-alert">The server is busy right now. Please submit your answer again in a moment.</div>', unsafe_allow_html=True)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error during upload for user {email}: {str(e)}")
+        logger.error("Unexpected error starting upload for user %s: %s", email, e)
         st.markdown('<div class="error-alert">An unexpected error occurred during upload.</div>', unsafe_allow_html=True)
         return None
 
+@st.fragment(run_every=UPLOAD_POLL_INTERVAL)
+def show_upload_progress():
+    """Poll the running upload job and move the interview on once it finishes"""
+    email = st.session_state.get('email')
+    job = st.session_state.get('upload_job')
+    if job is None:
+        st.session_state.interview_state = 'asking'
+        st.rerun()
+    
+    if job.done() and job.failed:
+        logger.error("Upload failed for user %s: %s", email, job.error)
+        st.session_state.upload_error = _describe_upload_error(job.error)
+        if job.values.get('next_question') is not None:
+            # Fetched alongside the failed upload; the retry uses it rather than skip a question
+            st.session_state.unused_next_question = job.values['next_question']
+        st.session_state.interview_state = 'asking'
+        del st.session_state['upload_job']
+        st.session_state.pop('answer_warnings', None)
+        st.rerun()
+    
+    if 'upload' in job.values:
+        st.markdown('<div class="success-alert">✅ Response submitted successfully!</div>', unsafe_allow_html=True)
+    st.progress(job.progress, text=f"{job.message or 'Waiting to upload...'} ({job.elapsed:.0f}s)")
+    
+    if not job.done():
+        return
+    
+    logger.info("Audio upload successful for user: %s", email)
+    log_user_action(logger, "Audio response uploaded", email, question_length=len(st.session_state.current_question),
+                    upload_seconds=round(job.elapsed, 2))
+    if st.session_state.questions_responses:
+        st.session_state.questions_responses[-1]['response_status'] = 'RECORDED'
+    
+    del st.session_state['upload_job']
+    st.session_state.pop('answer_warnings', None)
+    if st.session_state.current_question_index >= MAX_QUESTIONS:
+        st.session_state.interview_state = 'complete'
+    else:
+        if PREFETCH_NEXT_QUESTION:
+            st.session_state.prefetched_question = job
+        st.session_state.interview_state = 'loading_next'
+    st.rerun()
+
+def display_upload_status():
+    """Show the upload screen while the answer is sent in the background"""
+    add_custom_css()
+    
+    st.progress(st.session_state.current_question_index / MAX_QUESTIONS,
+                text=f"Question {st.session_state.current_question_index} of {MAX_QUESTIONS}")
+    st.markdown("### 🔄 Processing your response...")
+    for warning in st.session_state.get('answer_warnings', []):
+        st.warning(f"🎙️ {warning}")
+    show_upload_progress()
+
 def start_interview():
     """Initialize the interview"""
     email = st.session_state.get('email')
-    logger.info(f"Starting interview for user: {email}")
+    logger.info("Starting interview for user: %s", email)
     log_user_action(logger, "Interview started", email)
     
     add_custom_css()
@@ -402,6 +623,7 @@ def display_question_and_record():
 
     with col3:
         if st.button("🛑 End Interview", type="secondary"):
+            discard_audio_stream()
             st.session_state.interview_state = 'complete'
             st.rerun()
 
@@ -427,52 +649,299 @@ def display_question_and_record():
     if f'is_recording_{recorder_key}' not in st.session_state:
         st.session_state[f'is_recording_{recorder_key}'] = False
 
-    # Speak question only once
+    # Speak question only once; the same key is used for every question and
+    # the play id, not the frame, decides when the question is spoken
+    tts_key = 'question_tts'
     if not st.session_state.question_spoken:
-        speak_question(st.session_state.current_question, show_repeat_button=False)
+        replay_question(tts_key)
         st.session_state.question_spoken = True
+    speak_question(st.session_state.current_question, show_repeat_button=False, auto_speak=False, key=tts_key,
+                   audio_url=get_question_audio_url(st.session_state.current_question))
 
     # Show mic and repeat button
+    recording_mode = get_recording_mode()
+    audio = None
+    direct_result = None
+    webrtc_ctx = None
     col1, col2 = st.columns([1, 1])
     with col1:
-        audio = mic_recorder(
-            start_prompt="🎤 Start Recording",
-            stop_prompt="⏹️ Stop & Submit",
-            just_once=True,
-            key=recorder_key
-        )
+        if recording_mode == "webrtc":
+            webrtc_ctx = webrtc_recorder(recorder_key)
+        elif recording_mode in ("direct", "chunked"):
+            upload = get_direct_upload_token()
+            direct_result = direct_recorder(
+                PUBLIC_API_BASE + UPLOAD_PATH,
+                upload['token'],
+                upload['upload_id'],
+                st.session_state.current_question,
+                chunk_url=PUBLIC_API_BASE + CHUNK_UPLOAD_PATH if recording_mode == "chunked" else None,
+                chunk_ms=CHUNK_INTERVAL_MS,
+                key=recorder_key
+            )
+        else:
+            audio = mic_recorder(
+                start_prompt="🎤 Start Recording",
+                stop_prompt="⏹️ Stop & Submit",
+                just_once=True,
+                format="wav",
+                key=recorder_key
+            )
     with col2:
-        if st.button("🔊 Repeat Question", key=f"repeat_{recorder_key}", use_container_width=True):
-            speak_question(st.session_state.current_question, show_repeat_button=False)
+        st.button("🔊 Repeat Question", key=f"repeat_{recorder_key}", use_container_width=True,
+                  on_click=replay_question, args=(tts_key,))
 
     st.markdown("---")
 
+    # Show why the previous attempt failed, if it did
+    upload_error = st.session_state.pop('upload_error', None)
+    if upload_error:
+        st.markdown(f'<div class="error-alert">❌ Failed to submit response. {upload_error}</div>', unsafe_allow_html=True)
+
     # Handle audio response
-    if audio and audio.get('bytes'):
+    if recording_mode == "webrtc":
+        handle_streamed_answer(webrtc_ctx)
+    elif recording_mode in ("direct", "chunked"):
+        handle_direct_upload(direct_result, recorder_key)
+    elif audio and audio.get('bytes'):
         st.session_state[f'is_recording_{recorder_key}'] = False
         st.session_state.recording_start_time = None
 
-        with st.spinner("🔄 Processing your response..."):
-            upload_response = upload_audio_to_backend(
-                audio['bytes'],
-                st.session_state.current_question
-            )
+        answer_audio = prepare_answer_audio(audio['bytes'])
+        if answer_audio is None:
+            return
+
+        is_last_question = st.session_state.current_question_index >= MAX_QUESTIONS
+        upload_job = upload_audio_to_backend(
+            answer_audio,
+            st.session_state.current_question,
+            prefetch_next=PREFETCH_NEXT_QUESTION and not is_last_question
+        )
+
+        if upload_job:
+            st.session_state.upload_job = upload_job
+            st.session_state.interview_state = 'uploading'
+            st.rerun()
+        else:
+            st.markdown('<div class="error-alert">❌ Failed to submit response. Please try again.</div>', unsafe_allow_html=True)
+
+def get_recording_mode():
+    """Return the recording mode to use, falling back to mic_recorder if direct uploads are not configured"""
+    if RECORDING_MODE in ("direct", "chunked") and not direct_upload_enabled():
+        logger.warning("RECORDING_MODE is '%s' but DIRECT_UPLOAD_SECRET is not set, using mic_recorder", RECORDING_MODE)
+        return "mic_recorder"
+    return RECORDING_MODE
+
+def _question_audio_job(job, question):
+    """Background job: synthesize a question's audio into the shared cache and return its URL."""
+    return synthesize_question(question, voice=TTS_VOICE, rate=TTS_RATE)
+
+def _start_question_audio(job, response):
+    """Start synthesizing a fetched question's audio as a job of its own.
+
+    Called from the job that fetched the question, which publishes the
+    synthesis job as job.values['question_audio_job'] and returns the
+    question right away instead of waiting for its audio.
+    """
+    if TTS_MODE != "server" or not isinstance(response, dict) or response.get("status") != "success":
+        return
+    question = (response.get("data") or {}).get("question", "")
+    if not question.strip():
+        return
+    try:
+        job.update(question_audio_job=(question, submit_job("question_audio", _question_audio_job, question)))
+    except JobQueueFull:
+        logger.warning("Job queue full, not pre-synthesizing the next question")
+
+def remember_question_audio(entry):
+    """Keep a (question, url) pair of synthesized question audio for this session"""
+    entries = [e for e in st.session_state.get('question_audio', []) if e[0] != entry[0]]
+    st.session_state.question_audio = (entries + [tuple(entry)])[-QUESTION_AUDIO_ENTRIES:]
+
+def get_question_audio_url(question):
+    """Return the URL of server-synthesized audio for the question, or None to use browser speech
+    
+    Never synthesizes on the script thread: while the question's synthesis job
+    is still running, or if it failed, the browser speaks the question instead.
+    """
+    if TTS_MODE != "server":
+        return None
+    for known_question, url in st.session_state.get('question_audio', []):
+        if known_question == question:
+            return url
+    
+    pending = st.session_state.get('question_audio_job')
+    if pending is not None and pending[0] == question:
+        job = pending[1]
+        if not job.done() or job.failed:
+            return None
+        del st.session_state['question_audio_job']
+        remember_question_audio((question, job.result()))
+        return job.result()
+    
+    url = cached_question_audio(question, voice=TTS_VOICE, rate=TTS_RATE)
+    if url is not None:
+        remember_question_audio((question, url))
+        return url
+    try:
+        st.session_state.question_audio_job = (question, submit_job("question_audio", _question_audio_job, question))
+    except JobQueueFull:
+        logger.warning("Job queue full, not synthesizing question audio")
+    return None
+
+def get_direct_upload_token():
+    """Return the signed upload token for the current question, renewing it before it expires.
+    
+    The upload id stays the same for the whole question so a renewed token does
+    not reset a recording in progress.
+    """
+    email = st.session_state.get('email')
+    entry = st.session_state.get('direct_upload')
+    if entry is None or entry['question_index'] != st.session_state.current_question_index:
+        entry = {'question_index': st.session_state.current_question_index, 'upload_id': None, 'expires_at': 0}
+    if entry['expires_at'] - time.time() < DIRECT_UPLOAD_TOKEN_MARGIN:
+        entry['token'], entry['upload_id'] = create_upload_token(email, st.session_state.current_question,
+                                                                 upload_id=entry['upload_id'])
+        entry['expires_at'] = time.time() + UPLOAD_TOKEN_TTL
+        st.session_state.direct_upload = entry
+    return entry
+
+def get_audio_stream():
+    """Return the WebRTC answer stream for the current question, starting it on first use"""
+    entry = st.session_state.get('audio_stream')
+    if entry is None or entry['question_index'] != st.session_state.current_question_index:
+        discard_audio_stream()
+        email = st.session_state.get('email')
+        token, upload_id = None, None
+        if direct_upload_enabled():
+            token, upload_id = create_upload_token(email, st.session_state.current_question)
+        entry = {
+            'question_index': st.session_state.current_question_index,
+            'stream': AudioStreamUploader(st.session_state.current_question, email=email,
+                                          token=token, upload_id=upload_id),
+        }
+        st.session_state.audio_stream = entry
+    return entry['stream']
 
-            if upload_response:
-                if st.session_state.questions_responses:
-                    st.session_state.questions_responses[-1]['response_status'] = 'RECORDED'
+def discard_audio_stream():
+    """Abort the WebRTC answer stream, if any, and drop what it sent"""
+    entry = st.session_state.pop('audio_stream', None)
+    if entry is not None:
+        entry['stream'].abort()
 
-                st.markdown('<div class="success-alert">✅ Response submitted successfully!</div>', unsafe_allow_html=True)
+def _stream_commit_job(job, stream, email, prefetch_next, next_question=None):
+    """Background job: commit a streamed answer while fetching the next question."""
+    def commit():
+        result = stream.finish()
+        job.update(0.9, "Response submitted", upload=result)
+    
+    job.update(0.1, f"Finishing upload... {stream.seconds_sent:.0f}s of audio already sent")
+    return _submit_with_next_question(job, commit, email, prefetch_next, next_question)
 
-                if st.session_state.current_question_index >= MAX_QUESTIONS:
-                    st.session_state.interview_state = 'complete'
-                else:
-                    st.session_state.interview_state = 'loading_next'
+def webrtc_recorder(recorder_key):
+    """Show the WebRTC recorder, streaming the answer as it is recorded.
+    
+    streamlit-webrtc and PyAV are only needed for RECORDING_MODE "webrtc",
+    so they are imported here rather than for every interview session.
+    """
+    from streamlit_webrtc import webrtc_streamer, WebRtcMode, RTCConfiguration
+    return webrtc_streamer(
+        key=recorder_key,
+        mode=WebRtcMode.SENDONLY,
+        media_stream_constraints={"video": False, "audio": True},
+        rtc_configuration=RTCConfiguration(WEBRTC_RTC_CONFIGURATION),
+        audio_frame_callback=get_audio_stream().audio_frame_callback,
+    )
+
+def handle_streamed_answer(webrtc_ctx):
+    """Commit the streamed answer once the candidate stops the WebRTC recorder"""
+    email = st.session_state.get('email')
+    stream = st.session_state.audio_stream['stream']
+    if webrtc_ctx.state.playing:
+        st.caption(f"🔴 Streaming your answer... {stream.seconds_sent:.0f}s sent")
+        return
+    if not stream.frames_received:
+        return
+    
+    logger.info("Committing streamed answer %s for user %s: %.1fs", stream.upload_id, email, stream.seconds_sent)
+    del st.session_state['audio_stream']
+    is_last_question = st.session_state.current_question_index >= MAX_QUESTIONS
+    prefetch_next = PREFETCH_NEXT_QUESTION and not is_last_question
+    try:
+        st.session_state.upload_job = submit_job("answer_stream", _stream_commit_job, stream, email, prefetch_next,
+                                                 st.session_state.get('unused_next_question'))
+        st.session_state.pop('unused_next_question', None)
+    except JobQueueFull as e:
+        # The audio is already on the backend; commit it on this run rather than lose it
+        logger.warning("Job queue full, committing streamed answer inline for user %s: %s", email, e)
+        try:
+            with st.spinner("Submitting your response..."):
+                stream.finish()
+        except Exception as commit_error:
+            logger.error("Streamed answer commit failed for user %s: %s", email, commit_error)
+            st.markdown(f'<div class="error-alert">❌ Failed to submit response. {_describe_upload_error(commit_error)}</div>', unsafe_allow_html=True)
+            return
+        if st.session_state.questions_responses:
+            st.session_state.questions_responses[-1]['response_status'] = 'RECORDED'
+        st.session_state.interview_state = 'complete' if is_last_question else 'loading_next'
+        st.rerun()
+    st.session_state.interview_state = 'uploading'
+    st.rerun()
 
-                time.sleep(2)
-                st.rerun()
-            else:
-                st.markdown('<div class="error-alert">❌ Failed to submit response. Please try again.</div>', unsafe_allow_html=True)
+def _next_question_job(job, email, next_question=None):
+    """Background job: fetch the next question while the page moves on."""
+    if next_question is not None:
+        return next_question
+    return _fetch_next_question(job, email)
+
+def handle_direct_upload(result, recorder_key):
+    """Move the interview on once the browser reports a direct upload, handling each attempt once"""
+    email = st.session_state.get('email')
+    if not result:
+        return
+    attempt = (result.get('upload_id'), result.get('attempt'))
+    if st.session_state.get(f'handled_{recorder_key}') == attempt:
+        return
+    st.session_state[f'handled_{recorder_key}'] = attempt
+    
+    if result.get('status') != 'uploaded':
+        logger.error("Direct upload %s failed for user %s: %s", result.get('upload_id'), email, result.get('error'))
+        st.markdown(f'<div class="error-alert">❌ Failed to submit response. {result.get("error", "")}</div>', unsafe_allow_html=True)
+        return
+    
+    # The browser's report is only a claim; confirm with the backend that the
+    # upload the token was issued for actually arrived before moving on
+    upload = st.session_state.get('direct_upload') or {}
+    confirmed = None
+    if result.get('upload_id') == upload.get('upload_id'):
+        with st.spinner("Confirming your response..."):
+            confirmed = get_upload_status(upload['upload_id'], token=upload.get('token'))
+    if not confirmed or confirmed.get("status") != "success":
+        logger.error("Direct upload %s reported by the browser could not be confirmed for user %s",
+                     result.get('upload_id'), email)
+        st.markdown('<div class="error-alert">❌ Your response could not be confirmed by the server. Please record it again.</div>', unsafe_allow_html=True)
+        return
+    
+    logger.info("Direct audio upload successful for user: %s", email)
+    log_user_action(logger, "Audio response uploaded directly", email, upload_id=result['upload_id'],
+                    upload_bytes=confirmed.get('data', {}).get('bytes', result.get('bytes')))
+    if st.session_state.questions_responses:
+        st.session_state.questions_responses[-1]['response_status'] = 'RECORDED'
+        st.session_state.questions_responses[-1]['upload_id'] = result['upload_id']
+    invalidate_user_cache(email)
+    st.session_state.pop('direct_upload', None)
+    
+    if st.session_state.current_question_index >= MAX_QUESTIONS:
+        st.session_state.interview_state = 'complete'
+    else:
+        if PREFETCH_NEXT_QUESTION:
+            try:
+                st.session_state.prefetched_question = submit_job("next_question", _next_question_job, email,
+                                                                  st.session_state.get('unused_next_question'))
+                st.session_state.pop('unused_next_question', None)
+            except JobQueueFull:
+                logger.warning("Job queue full, next question for user %s will be fetched inline", email)
+        st.session_state.interview_state = 'loading_next'
+    st.rerun()
 
 def load_next_question():
     """Load the next question"""
@@ -488,9 +957,27 @@ def load_next_question():
     </div>
     """, unsafe_allow_html=True)
     
-    # Auto-load next question
-    if fetch_question(is_first_question=False):
-        time.sleep(1)  # Brief pause for smooth transition
+    # Use the question prefetched during the upload when there is one. A fetch
+    # still running, e.g. one started after a direct upload, is polled by
+    # await_job's progress fragment rather than waited on here
+    prefetched = st.session_state.get('prefetched_question')
+    if prefetched is not None:
+        try:
+            response = await_job('prefetched_question', "Preparing your next question...")
+        except Exception as e:
+            logger.warning("Prefetching the next question failed for user %s: %s", st.session_state.get('email'), e)
+            response = None
+        if 'question_audio_job' in prefetched.values:
+            st.session_state.question_audio_job = prefetched.values['question_audio_job']
+        if response is not None:
+            logger.info("Using prefetched next question for user: %s", st.session_state.get('email'))
+            loaded = apply_question_response(response, is_first_question=False)
+        else:
+            loaded = fetch_question(is_first_question=False)
+    else:
+        loaded = fetch_question(is_first_question=False)
+    
+    if loaded:
         st.rerun()
     else:
         st.markdown('<div class="error-alert">❌ Failed to load next question.</div>', unsafe_allow_html=True)
@@ -541,8 +1028,10 @@ def handle_interview_completion():
         with col2:
             if st.button("🏠 Back to Dashboard", use_container_width=True):
                 # Clear interview state
+                discard_audio_stream()
                 for key in ['interview_state', 'current_question_index', 'current_question', 
-                          'questions_responses', 'total_questions_asked', 'question_spoken', 'recording_start_time']:
+                          'questions_responses', 'total_questions_asked', 'question_spoken', 'recording_start_time',
+                          'prefetched_question', 'upload_job', 'upload_error', 'answer_warnings', 'direct_upload', 'question_audio_job', 'unused_next_question']:
                     if key in st.session_state:
                         del st.session_state[key]
                 st.switch_page("pages/dashboard.py")
@@ -550,8 +1039,10 @@ def handle_interview_completion():
         st.markdown('<div class="error-alert">⚠️ No questions were answered. Consider trying again!</div>', unsafe_allow_html=True)
         if st.button("🔄 Start New Interview", type="primary"):
             # Reset interview state
+            discard_audio_stream()
             for key in ['interview_state', 'current_question_index', 'current_question', 
-                      'questions_responses', 'total_questions_asked', 'question_spoken', 'recording_start_time']:
+                      'questions_responses', 'total_questions_asked', 'question_spoken', 'recording_start_time',
+                      'prefetched_question', 'upload_job', 'upload_error', 'answer_warnings', 'direct_upload', 'question_audio_job', 'unused_next_question']:
                 if key in st.session_state:
                     del st.session_state[key]
             st.rerun()
@@ -574,47 +1065,51 @@ def main():
         return
     
     # Log interview page access
-    logger.info(f"Interview page accessed by user: {email}")
+    logger.info("Interview page accessed by user: %s", email)
     log_user_action(logger, "Interview page accessed", email)
     
     # Initialize interview state
     try:
         initialize_interview_state()
-        logger.debug(f"Interview state initialized for user: {email}")
+        logger.debug("Interview state initialized for user: %s", email)
     except Exception as e:
-        logger.error(f"Error initializing interview state for user {email}: {str(e)}")
+        logger.error("Error initializing interview state for user %s: %s", email, e)
         st.error("Error initializing interview. Please try again.")
         return
     
     # State machine with error handling
     try:
         current_state = st.session_state.get('interview_state', 'start')
-        logger.debug(f"Interview state for user {email}: {current_state}")
+        logger.debug("Interview state for user %s: %s", email, current_state)
         
         if current_state == 'start':
             start_interview()
         elif current_state == 'asking':
             display_question_and_record()
+        elif current_state == 'uploading':
+            display_upload_status()
         elif current_state == 'loading_next':
             load_next_question()
         elif current_state == 'complete':
             handle_interview_completion()
         else:
             # Handle unexpected states
-            logger.warning(f"Invalid interview state '{current_state}' for user {email}, restarting")
+            logger.warning("Invalid interview state '%s' for user %s, restarting", current_state, email)
             add_custom_css()
             st.markdown('<div class="error-alert">❌ Invalid interview state. Restarting...</div>', unsafe_allow_html=True)
             st.session_state.interview_state = 'start'
             st.rerun()
             
     except Exception as e:
-        logger.error(f"Unexpected error in interview state machine for user {email}: {str(e)}")
+        logger.error("Unexpected error in interview state machine for user %s: %s", email, e)
         st.error("An unexpected error occurred. Please try refreshing the page.")
         if st.button("🔄 Restart Interview"):
             # Reset interview state
+            discard_audio_stream()
             for key in ['interview_state', 'current_question_index', 'current_question', 
                        'questions_responses', 'total_questions_asked', 'interview_completed', 
-                       'question_spoken', 'recording_start_time']:
+                       'question_spoken', 'recording_start_time', 'prefetched_question',
+                       'upload_job', 'upload_error', 'answer_warnings', 'direct_upload', 'question_audio_job', 'unused_next_question']:
                 if key in st.session_state:
                     del st.session_state[key]
             st.rerun()
@@ -148,7 +148,7 @@ with st.container():
 
     if submit:
         try:
-            logger.info(f"Registration attempt for email: {email.strip()}")
+            logger.info("Registration attempt for email: %s", email.strip())
             log_user_action(logger, "Registration attempt", email.strip())
             
             # Enhanced validation
@@ -168,7 +168,7 @@ with st.container():
                 validation_errors.append("Education is required")
             
             if validation_errors:
-                logger.warning(f"Registration validation failed for {email.strip()}: {', '.join(validation_errors)}")
+                logger.warning("Registration validation failed for %s: %s", email.strip(), ', '.join(validation_errors))
                 st.error(f"❌ Please fix the following errors:\n• " + "\n• ".join(validation_errors))
             else:
                 payload = {
@@ -182,14 +182,14 @@ with st.container():
                     "experience": experience.strip() if experience else None
                 }
                 
-                logger.info(f"Submitting registration for email: {email.strip()}")
+                logger.info("Submitting registration for email: %s", email.strip())
                 res = register_user(payload)
                 
                 if res is None:
-                    logger.error(f"Registration failed - no response from API for email: {email.strip()}")
+                    logger.error("Registration failed - no response from API for email: %s", email.strip())
                     st.error("❌ Unable to connect to the server. Please try again later.")
                 elif res.ok:
-                    logger.info(f"Registration successful for email: {email.strip()}")
+                    logger.info("Registration successful for email: %s", email.strip())
                     log_user_action(logger, "Registration successful", email.strip(), role=role)
                     
                     # Store user data in session
@@ -208,18 +208,18 @@ with st.container():
                     st.success("✅ Registration successful! Redirecting...")
                     st.switch_page("pages/dashboard.py")
                 else:
-                    logger.error(f"Registration failed for email {email.strip()}: HTTP {res.status_code}")
+                    logger.error("Registration failed for email %s: HTTP %s", email.strip(), res.status_code)
                     try:
                         error_data = res.json()
                         error_msg = error_data.get("message", "Unknown error")
-                        logger.error(f"Registration error details: {error_msg}")
+                        logger.error("Registration error details: %s", error_msg)
                     except:
                         logger.error("Could not parse error response from registration API")
                     
                     st.error("❌ Registration failed. Please try again later.")
                     
         except Exception as e:
-            logger.error(f"Unexpected error during registration for email {email.strip()}: {str(e)}")
+            logger.error("Unexpected error during registration for email %s: %s", email.strip(), e)
             st.error("❌ An unexpected error occurred during registration. Please try again.")
 
     st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,220 @@
+"""
+Local stand-in for the interview backend's answer upload endpoints.
+
+Serves the whole-answer upload, the chunked upload protocol (PUT chunk,
+POST commit, DELETE abort) and upload status lookups in memory, so uploads can be exercised without the
+real backend. With a secret it checks signed upload tokens the same way the
+backend does.
+
+Run it for manual testing of the recorder modes:
+    python test/mock_backend.py --port 8081 --secret dev-secret
+
+or use it from a test:
+    with MockBackend() as backend:
+        api.API_BASE = backend.url
+        ...
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Optional
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.upload_token import verify_upload_token
+
+CHUNK_PREFIX = "/interview/responses/chunks/"
+UPLOAD_PATH = "/interview/responses/upload"
+
+class MockBackend:
+    """In-memory upload backend on a background thread."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, secret: Optional[str] = None,
+                 fail_sequences: Iterable[int] = ()):
+        self.secret = secret
+        # Chunk sequences whose first attempt is answered with a 503, to exercise retries
+        self.fail_sequences = set(fail_sequences)
+        self.chunks: Dict[str, Dict[int, bytes]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockBackend":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockBackend":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+def _make_handler(backend: MockBackend):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status: int, body: Dict[str, Any]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self) -> bytes:
+            if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                data = bytearray()
+                while True:
+                    size = int(self.rfile.readline().split(b";")[0], 16)
+                    if size == 0:
+                        self.rfile.readline()
+                        return bytes(data)
+                    data += self.rfile.read(size)
+                    self.rfile.readline()
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        def _authorized(self, token: Optional[str], upload_id: Optional[str]) -> bool:
+            if backend.secret is None:
+                return True
+            try:
+                claims = verify_upload_token(token or "", secret=backend.secret)
+            except ValueError:
+                return False
+            return upload_id is None or claims["upload_id"] == upload_id
+
+        def _bearer(self) -> Optional[str]:
+            auth = self.headers.get("Authorization", "")
+            return auth[len("Bearer "):] if auth.startswith("Bearer ") else None
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
+            self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+            self.send_header("Access-Control-Max-Age", "600")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            prefix = UPLOAD_PATH + "/"
+            upload_id = self.path[len(prefix):] if self.path.startswith(prefix) else None
+            if not upload_id:
+                return self._reply(404, {"status": "error", "message": "Not found"})
+            if not self._authorized(self._bearer(), upload_id):
+                return self._reply(401, {"status": "error", "message": "Invalid upload token"})
+            with backend.lock:
+                backend.requests += 1
+                upload = backend.uploads.get(upload_id)
+            if upload is None:
+                return self._reply(404, {"status": "error", "message": "Unknown upload"})
+            self._reply(200, {"status": "success", "data": {"upload_id": upload_id, "bytes": len(upload["audio"]),
+                                                            "question": upload["question"]}})
+
+        def do_PUT(self):
+            body = self._body()
+            parts = self.path[len(CHUNK_PREFIX):].split("/")
+            if not self.path.startswith(CHUNK_PREFIX) or len(parts) != 2 or not parts[1].isdigit():
+                return self._reply(404, {"status": "error", "message": "Not found"})
+            upload_id, sequence = parts[0], int(parts[1])
+            if not self._authorized(self._bearer(), upload_id):
+                return self._reply(401, {"status": "error", "message": "Invalid upload token"})
+            with backend.lock:
+                backend.requests += 1
+                if sequence in backend.fail_sequences:
+                    backend.fail_sequences.discard(sequence)
+                    return self._reply(503, {"status": "error", "message": "Try again"})
+                backend.chunks.setdefault(upload_id, {})[sequence] = body
+            self._reply(200, {"status": "success", "data": {"upload_id": upload_id, "sequence": sequence,
+                                                            "bytes": len(body)}})
+
+        def do_DELETE(self):
+            upload_id = self.path[len(CHUNK_PREFIX):]
+            if not self._authorized(self._bearer(), upload_id):
+                return self._reply(401, {"status": "error", "message": "Invalid upload token"})
+            with backend.lock:
+                backend.requests += 1
+                backend.chunks.pop(upload_id, None)
+            self._reply(200, {"status": "success"})
+
+        def do_POST(self):
+            body = self._body()
+            with backend.lock:
+                backend.requests += 1
+            if self.path == UPLOAD_PATH:
+                return self._upload(body)
+            if self.path.startswith(CHUNK_PREFIX) and self.path.endswith("/commit"):
+                return self._commit(self.path[len(CHUNK_PREFIX):-len("/commit")], json.loads(body or b"{}"))
+            self._reply(404, {"status": "error", "message": "Not found"})
+
+        def _commit(self, upload_id: str, request: Dict[str, Any]):
+            if not self._authorized(self._bearer(), upload_id):
+                return self._reply(401, {"status": "error", "message": "Invalid upload token"})
+            with backend.lock:
+                chunks = backend.chunks.get(upload_id, {})
+                total = request.get("total_chunks", 0)
+                missing = [sequence for sequence in range(total) if sequence not in chunks]
+                if not total or missing:
+                    return self._reply(409, {"status": "error", "message": f"Missing chunks: {missing}"})
+                audio = b"".join(chunks[sequence] for sequence in range(total))
+                del backend.chunks[upload_id]
+                backend.uploads[upload_id] = {"question": request.get("question"), "audio": audio,
+                                              "filename": request.get("filename"),
+                                              "content_type": request.get("content_type"), "chunks": total}
+            self._reply(200, {"status": "success", "data": {"upload_id": upload_id, "bytes": len(audio)}})
+
+        def _upload(self, body: bytes):
+            message = BytesParser(policy=HTTP).parsebytes(
+                f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("utf-8") + body)
+            fields = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+            token = fields["upload_token"].get_content() if "upload_token" in fields else self._bearer()
+            upload_id = fields["upload_id"].get_content() if "upload_id" in fields else None
+            if not self._authorized(token, upload_id):
+                return self._reply(401, {"status": "error", "message": "Invalid upload token"})
+            audio_part = fields.get("audio_file")
+            if audio_part is None:
+                return self._reply(422, {"status": "error", "message": "audio_file is required"})
+            upload_id = upload_id or f"upload-{len(backend.uploads) + 1}"
+            audio = audio_part.get_payload(decode=True)
+            with backend.lock:
+                backend.uploads[upload_id] = {"question": fields["question"].get_content() if "question" in fields else None,
+                                              "audio": audio, "filename": audio_part.get_filename(),
+                                              "content_type": audio_part.get_content_type(), "chunks": 1}
+            self._reply(200, {"status": "success", "data": {"upload_id": upload_id, "bytes": len(audio)}})
+
+    return Handler
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the stand-in upload backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--secret", default=os.environ.get("DIRECT_UPLOAD_SECRET"))
+    args = parser.parse_args()
+
+    backend = MockBackend(args.host, args.port, secret=args.secret).start()
+    print(f"Mock backend listening on {backend.url} (tokens {'required' if args.secret else 'not checked'})")
+    try:
+        backend._thread.join()
+    except KeyboardInterrupt:
+        backend.stop()
@@ -20,6 +20,7 @@ import tempfile
 import os
 from utils.api import get_initial_question, get_next_question, upload_audio_response
 from utils.text_to_speech_util import speak_question
+from utils.ring_buffer import AudioRingBuffer, DEFAULT_BUFFER_SECONDS
 
 st.set_page_config(page_title="Mock Interview", page_icon="🎤", layout="centered")
 
@@ -80,12 +81,11 @@ def upload_audio_response_data(question, audio_data):
 def create_audio_recorder():
     """Create audio recorder using streamlit-webrtc"""
     
-    # Audio recording callback
-    audio_frames = []
-    
-    def audio_frame_callback(frame):
-        audio_frames.append(frame)
-        return frame
+    # Audio recording callback: frames are copied into a preallocated ring
+    # buffer instead of kept in a growing list
+    if 'audio_buffer' not in st.session_state:
+        st.session_state.audio_buffer = AudioRingBuffer(capacity=48000 * DEFAULT_BUFFER_SECONDS)
+    audio_buffer = st.session_state.audio_buffer
     
     # WebRTC configuration
     rtc_configuration = RTCConfiguration({
@@ -98,10 +98,10 @@ def create_audio_recorder():
         audio_receiver_size=256,
         media_stream_constraints={"video": False, "audio": True},
         rtc_configuration=rtc_configuration,
-        audio_frame_callback=audio_frame_callback,
+        audio_frame_callback=audio_buffer.frame_callback,
     )
     
-    return webrtc_ctx, audio_frames
+    return webrtc_ctx, audio_buffer
 
 def simple_audio_recorder():
     """Alternative simple audio recorder using HTML5"""
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for the response cache and request coalescing in utils/api.py.
+Run it directly or through pytest; it does not need the backend.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+import time
+from utils import api
+
+def test_cache_returns_copies():
+    """Changing a cached response never changes what the next caller reads."""
+    print("Testing cache isolation...")
+    cache = api._ResponseCache()
+    data = {"status": "success", "data": {"interviews": [{"id": 1}]}}
+    cache.set("login_user", "a@example.com", data)
+    data["data"]["interviews"].append({"id": 2})
+
+    first = cache.get("login_user", "a@example.com")
+    first["data"]["interviews"].clear()
+    second = cache.get("login_user", "a@example.com")
+    assert second == {"status": "success", "data": {"interviews": [{"id": 1}]}}
+    print("✅ Cached responses are copied in and out")
+
+def test_cache_expiry():
+    """Entries expire after their endpoint's TTL, and errors are never cached."""
+    print("Testing cache expiry...")
+    previous = dict(api.CACHE_TTLS)
+    api.CACHE_TTLS["login_user"] = 0.05
+    try:
+        cache = api._ResponseCache()
+        cache.set("login_user", "a@example.com", {"status": "success"})
+        cache.set("login_user", "b@example.com", {"status": "error"})
+        cache.set("get_next_question", "x", {"status": "success"})
+        assert cache.get("login_user", "a@example.com") is not None
+        assert cache.get("login_user", "b@example.com") is None
+        assert cache.get("get_next_question", "x") is None
+        time.sleep(0.1)
+        assert cache.get("login_user", "a@example.com") is None
+    finally:
+        api.CACHE_TTLS.clear()
+        api.CACHE_TTLS.update(previous)
+    print("✅ Entries expire and errors are not cached")
+
+def test_pending_feedback_ttl():
+    """Feedback that is still pending is cached only briefly; complete feedback for the endpoint's TTL."""
+    print("Testing pending feedback TTL...")
+    pending = {"status": "success", "data": {}}
+    complete = {"status": "success", "data": {"overall_feedback": {"overall_score": 7}}}
+    assert not api.feedback_is_complete(pending)
+    assert not api.feedback_is_complete({"status": "error", "data": complete["data"]})
+    assert api.feedback_is_complete(complete)
+    assert api._feedback_ttl("get_interview_feedback", pending) == api.FEEDBACK_PENDING_TTL
+    assert api._feedback_ttl("get_interview_feedback", complete) == api.CACHE_TTLS["get_interview_feedback"]
+
+    previous = api.FEEDBACK_PENDING_TTL
+    api.FEEDBACK_PENDING_TTL = 0.05
+    try:
+        cache = api._ResponseCache()
+        cache.set("get_interview_feedback", 1, pending, ttl=api._feedback_ttl("get_interview_feedback", pending))
+        cache.set("get_interview_feedback", 2, complete, ttl=api._feedback_ttl("get_interview_feedback", complete))
+        time.sleep(0.1)
+        assert cache.get("get_interview_feedback", 1) is None
+        assert cache.get("get_interview_feedback", 2) == complete
+    finally:
+        api.FEEDBACK_PENDING_TTL = previous
+    print("✅ Pending feedback expires quickly")
+
+def test_cache_eviction():
+    """The least recently used entry is evicted once the cache is full."""
+    print("Testing cache eviction...")
+    cache = api._ResponseCache(max_entries=2)
+    cache.set("login_user", "a", {"status": "success"})
+    cache.set("login_user", "b", {"status": "success"})
+    cache.get("login_user", "a")
+    cache.set("login_user", "c", {"status": "success"})
+    assert cache.get("login_user", "b") is None
+    assert cache.get("login_user", "a") is not None
+    assert cache.get("login_user", "c") is not None
+    print("✅ Least recently used entry evicted")
+
+def test_single_flight():
+    """Identical concurrent calls share one backend hit and its result or error."""
+    print("Testing request coalescing...")
+    flight = api._SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def backend_call():
+        calls.append(1)
+        release.wait(5)
+        return {"status": "success"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("GET /x", backend_call)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    while not calls:
+        time.sleep(0.01)
+    time.sleep(0.1)  # let the other callers join the flight
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+
+    def failing_call():
+        raise ValueError("backend down")
+    try:
+        flight.do("GET /x", failing_call)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Error was not raised to the caller")
+    assert flight.do("GET /x", lambda: "fresh") == "fresh"
+    print("✅ 8 concurrent calls, 1 backend hit")
+
+def main():
+    """Run all tests."""
+    print("🔍 Running API cache tests...\n")
+
+    test_cache_returns_copies()
+    print()
+
+    test_cache_expiry()
+    print()
+
+    test_pending_feedback_ttl()
+    print()
+
+    test_cache_eviction()
+    print()
+
+    test_single_flight()
+    print()
+
+    print("🎉 All tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Test script for chunked and streamed answer uploads against the local stand-in backend.
+Run it directly or through pytest; it does not need the real backend.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import io
+import numpy as np
+from utils import api
+from utils.audio_stream import AudioStreamUploader
+from utils.chunked_upload import ChunkedUploadSession
+from utils.upload_token import create_upload_token, verify_upload_token
+from test.mock_backend import MockBackend
+
+def _use_backend(backend):
+    """Point utils.api at the stand-in backend and return the previous base URL."""
+    previous = api.API_BASE
+    api.API_BASE = backend.url
+    return previous
+
+def test_chunked_upload():
+    """Chunks arrive in order and the commit assembles them."""
+    print("Testing chunked upload...")
+    audio = os.urandom(300 * 1024)
+    with MockBackend() as backend:
+        previous = _use_backend(backend)
+        try:
+            upload = ChunkedUploadSession("Tell me about yourself", min_chunk_bytes=64 * 1024)
+            for start in range(0, len(audio), 10 * 1024):
+                upload.send(audio[start:start + 10 * 1024])
+            result = upload.commit(timeout=10)
+        finally:
+            api.API_BASE = previous
+
+    stored = backend.uploads[upload.upload_id]
+    assert result["status"] == "success"
+    assert stored["audio"] == audio
+    assert stored["question"] == "Tell me about yourself"
+    assert stored["chunks"] == upload.chunks_sent == 5
+    print(f"✅ {upload.chunks_sent} chunks committed, {len(audio)} bytes assembled")
+
+def test_chunk_retry():
+    """A chunk the backend refuses once is retried without losing order."""
+    print("Testing chunk retry...")
+    audio = os.urandom(96 * 1024)
+    with MockBackend(fail_sequences=[1]) as backend:
+        previous = _use_backend(backend)
+        try:
+            upload = ChunkedUploadSession("Why this role?", min_chunk_bytes=32 * 1024)
+            upload.send(audio)
+            upload.send(b"")
+            result = upload.commit(timeout=10)
+        finally:
+            api.API_BASE = previous
+
+    assert result["status"] == "success"
+    assert backend.uploads[upload.upload_id]["audio"] == audio
+    print("✅ Refused chunk retried and committed")
+
+def test_signed_uploads():
+    """With a secret configured, uploads need a valid token for their upload id."""
+    print("Testing signed uploads...")
+    secret = "test-secret"
+    with MockBackend(secret=secret) as backend:
+        previous = _use_backend(backend)
+        try:
+            token, upload_id = create_upload_token("test@example.com", "Q", secret=secret)
+            upload = ChunkedUploadSession("Q", upload_id=upload_id, token=token)
+            upload.send(b"audio")
+            assert upload.commit(timeout=10)["status"] == "success"
+
+            status = api.get_upload_status(upload_id, token=token)
+            assert status["data"] == {"upload_id": upload_id, "bytes": 5, "question": "Q"}
+            other_token, other_id = create_upload_token("test@example.com", "Q", secret=secret)
+            assert api.get_upload_status(upload_id, token=other_token) is None
+            assert api.get_upload_status(other_id, token=other_token) is None
+
+            unsigned = ChunkedUploadSession("Q")
+            unsigned.send(b"audio")
+            try:
+                unsigned.commit(timeout=10)
+            except Exception as e:
+                print(f"✅ Unsigned upload refused: {e}")
+            else:
+                raise AssertionError("Unsigned upload was accepted")
+
+            res = api.upload_audio_response("Q", io.BytesIO(b"whole answer"))
+            assert res.status_code == 401
+        finally:
+            api.API_BASE = previous
+
+def test_malformed_token_claims():
+    """Signed tokens whose claims are not a JSON object are rejected as invalid."""
+    print("Testing malformed token claims...")
+    import base64
+    import hashlib
+    import hmac
+    secret = "test-secret"
+    for claims in (b"[1, 2]", b"42", b'"upload"', b'{"exp": "never"}'):
+        payload = base64.urlsafe_b64encode(claims).rstrip(b"=").decode("ascii")
+        signature = hmac.new(secret.encode("utf-8"), payload.encode("ascii"), hashlib.sha256).digest()
+        token = f"{payload}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode('ascii')}"
+        try:
+            verify_upload_token(token, secret=secret)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Token with claims {claims!r} was accepted")
+    print("✅ Malformed claims rejected")
+
+class _FakeFrame:
+    """Stand-in for the packed s16 stereo av.AudioFrame streamlit-webrtc delivers."""
+
+    class format:
+        name = "s16"
+        is_planar = False
+
+    class layout:
+        channels = ("FL", "FR")
+
+    sample_rate = 48000
+
+    def __init__(self, data):
+        self.samples = data.shape[0]
+        self.planes = [data.tobytes()]
+
+def test_audio_stream():
+    """WebRTC frames are resampled to 16 kHz PCM and streamed in batches."""
+    print("Testing streamed WebRTC audio...")
+    rng = np.random.default_rng(0)
+    stereo = (rng.standard_normal((48000 * 2, 2)) * 3000).astype(np.int16)
+    with MockBackend() as backend:
+        previous = _use_backend(backend)
+        try:
+            stream = AudioStreamUploader("Describe a project", batch_ms=500)
+            for start in range(0, len(stereo), 960):
+                stream.audio_frame_callback(_FakeFrame(stereo[start:start + 960]))
+            result = stream.finish(timeout=10)
+        finally:
+            api.API_BASE = previous
+
+    stored = backend.uploads[stream.upload_id]
+    assert result["status"] == "success"
+    assert len(stored["audio"]) == 2 * 16000 * 2
+    assert stored["content_type"] == "audio/L16; rate=16000; channels=1"
+    assert stored["chunks"] == stream.upload.chunks_sent and stream.frames_dropped == 0
+    print(f"✅ {stream.seconds_sent:.1f}s streamed in {stored['chunks']} chunks")
+
+def test_audio_stream_lifecycle():
+    """The worker thread starts with the first frame and an abandoned stream aborts itself."""
+    print("Testing streamed audio lifecycle...")
+    from utils import audio_stream
+    stereo = np.zeros((960, 2), dtype=np.int16)
+    with MockBackend() as backend:
+        previous = _use_backend(backend)
+        previous_timeout = audio_stream.STREAM_IDLE_TIMEOUT
+        audio_stream.STREAM_IDLE_TIMEOUT = 0.2
+        try:
+            idle = AudioStreamUploader("Q")
+            assert idle._worker is None
+            idle.abort()
+
+            stream = AudioStreamUploader("Q", batch_ms=10)
+            stream.audio_frame_callback(_FakeFrame(stereo))
+            assert stream._worker.is_alive()
+            stream._worker.join(5)
+            assert not stream._worker.is_alive()
+            assert stream.error is not None
+            assert stream.upload_id not in backend.chunks
+        finally:
+            audio_stream.STREAM_IDLE_TIMEOUT = previous_timeout
+            api.API_BASE = previous
+    print("✅ Idle stream aborted and its chunks discarded")
+
+def main():
+    """Run all tests."""
+    print("🔍 Running chunked upload tests...\n")
+
+    test_chunked_upload()
+    print()
+
+    test_chunk_retry()
+    print()
+
+    test_signed_uploads()
+    print()
+
+    test_malformed_token_claims()
+    print()
+
+    test_audio_stream()
+    print()
+
+    test_audio_stream_lifecycle()
+    print()
+
+    print("🎉 All tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ Run this script to test the logging setup before running the main application.
 
 import sys
 import os
+import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.logger import setup_logger, log_user_action, log_api_call
@@ -32,6 +33,172 @@ def test_logging():
     
     print("✅ Logging test completed. Check logs/ directory for log files.")
 
+def test_mutable_args_snapshot():
+    """Test that records are queued with mutable arguments already formatted."""
+    print("Testing queued records with mutable arguments...")
+    
+    import logging
+    import queue
+    from utils.logger import _BoundedQueueHandler, _Event
+    
+    handler = _BoundedQueueHandler(queue.Queue())
+    logger = logging.getLogger("test_mutable_args")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        scores = {"clarity": 3}
+        logger.warning("Scores: %s, question %d", scores, 1)
+        steps = ["upload"]
+        logger.warning(_Event("answer_scored", {"steps": steps, "email": "test@example.com"}))
+        logger.warning("Question %d of %d", 1, 5)
+        scores["clarity"] = 5
+        steps.append("feedback")
+    finally:
+        logger.removeHandler(handler)
+    
+    mutable, event, scalar = (handler.queue.get_nowait() for _ in range(3))
+    assert mutable.getMessage() == "Scores: {'clarity': 3}, question 1"
+    assert mutable.args is None
+    assert event.msg.fields == {"steps": ["upload"], "email": "test@example.com"}
+    # Scalar arguments are left for the listener to format
+    assert scalar.args == (1, 5)
+    print("✅ Mutable arguments are formatted before queueing")
+
+def test_queue_overflow():
+    """Test that a full log queue drops and counts records, then reports them."""
+    print("Testing log queue overflow...")
+    
+    import logging
+    import queue
+    from utils.logger import _BoundedQueueHandler
+    
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=2), policy="drop")
+    logger = logging.getLogger("test_queue_overflow")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        for i in range(5):
+            logger.warning("Record %d", i)
+        assert handler.dropped == 3
+        assert handler.queue.qsize() == 2
+        
+        # Once there is room, the next record is followed by the dropped count
+        kept = [handler.queue.get_nowait() for _ in range(2)]
+        logger.warning("After overflow")
+        after, report = handler.queue.get_nowait(), handler.queue.get_nowait()
+    finally:
+        logger.removeHandler(handler)
+    
+    assert [record.getMessage() for record in kept] == ["Record 0", "Record 1"]
+    assert after.getMessage() == "After overflow"
+    assert report.levelno == logging.WARNING
+    assert report.getMessage() == "Log queue was full, 3 records dropped"
+    assert handler.dropped == 3
+    print("✅ Full queue drops, counts and reports records")
+
+def test_queue_listener():
+    """Test that queued records are written by the listener thread, not the caller."""
+    print("Testing log queue listener...")
+    
+    import logging
+    import logging.handlers
+    import queue
+    import threading
+    from utils.logger import _BoundedQueueHandler
+    
+    class Collecting(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.emitted = []
+        
+        def emit(self, record):
+            self.emitted.append((record.getMessage(), threading.current_thread().name))
+    
+    target = Collecting()
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, target)
+    handler = _BoundedQueueHandler(log_queue)
+    logger = logging.getLogger("test_queue_listener")
+    logger.propagate = False
+    logger.addHandler(handler)
+    listener.start()
+    try:
+        logger.warning("Question %d uploaded", 3)
+    finally:
+        logger.removeHandler(handler)
+        listener.stop()
+    
+    assert len(target.emitted) == 1
+    message, thread = target.emitted[0]
+    assert message == "Question 3 uploaded"
+    assert thread != threading.current_thread().name
+    print("✅ Listener thread writes queued records")
+
+class _Collecting(logging.Handler):
+    """Handler that keeps the messages of the records it gets."""
+    
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+    
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_rate_limiter_across_reruns():
+    """Test that setup_logger on every rerun keeps the logger's rate limiter."""
+    print("Testing rate limiter across reruns...")
+    
+    from utils.logger import EventRateLimiter
+    
+    captured = _Collecting()
+    logging.getLogger("dashboard").addHandler(captured)
+    try:
+        limiters = []
+        for _ in range(5):
+            # What a page does on every Streamlit rerun
+            logger = setup_logger("dashboard")
+            limiters.append([f for f in logger.filters if isinstance(f, EventRateLimiter)])
+            log_user_action(logger, "Dashboard accessed", "rerun@example.com", role="Engineer")
+        log_user_action(logger, "Start Interview button clicked", "rerun@example.com")
+        log_user_action(logger, "Start Interview button clicked", "rerun@example.com")
+    finally:
+        logging.getLogger("dashboard").removeHandler(captured)
+    
+    assert all(len(found) == 1 and found[0] is limiters[0][0] for found in limiters)
+    assert sum("Dashboard accessed" in message for message in captured.messages) == 1
+    # Actions outside the dashboard's events are never limited
+    assert sum("Start Interview button clicked" in message for message in captured.messages) == 2
+    print("✅ Rate limiter survives reruns and only limits its events")
+
+def test_rate_limiter_summary():
+    """Test that suppressed records are summarized even when nothing is logged after them."""
+    print("Testing rate limiter summaries...")
+    
+    import time
+    from utils.logger import EventRateLimiter
+    
+    logger = logging.getLogger("test_rate_limiter_summary")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    captured = _Collecting()
+    logger.addHandler(captured)
+    EventRateLimiter.install(logger, limit=1, interval=0.2)
+    try:
+        for _ in range(4):
+            logger.info("Page accessed by user: %s", "burst@example.com")
+        logger.warning("Page accessed by user: %s", "burst@example.com")
+        assert captured.messages == ["Page accessed by user: burst@example.com"] * 2
+        
+        deadline = time.monotonic() + 2
+        while len(captured.messages) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        logger.removeHandler(captured)
+        logger.filters.clear()
+    
+    assert captured.messages[2] == "Suppressed 3 similar events in the last 0.2s: Page accessed by user: %s"
+    print("✅ Suppressed records are summarized after the burst")
+
 def test_api_error_handling():
     """Test API error handling."""
     print("Testing API error handling...")
@@ -55,11 +222,11 @@ def test_log_file_creation():
     print("Testing log file creation...")
     
     import os
-    from datetime import datetime
+    import json
+    from utils.logger import LOG_DIR, LOG_FILENAME
     
-    log_dir = "logs"
-    log_filename = f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    log_path = os.path.join(log_dir, log_filename)
+    # The handler always writes logs/app.log and rotates it at midnight
+    log_path = os.path.join(LOG_DIR, LOG_FILENAME)
     
     if os.path.exists(log_path):
         print(f"✅ Log file created successfully: {log_path}")
@@ -69,6 +236,8 @@ def test_log_file_creation():
             content = f.read()
             if content.strip():
                 print(f"✅ Log file has content ({len(content)} characters)")
+                json.loads(content.strip().splitlines()[-1])
+                print("✅ Log records are JSON lines")
             else:
                 print("⚠️  Log file is empty")
     else:
@@ -81,6 +250,21 @@ def main():
     test_logging()
     print()
     
+    test_mutable_args_snapshot()
+    print()
+    
+    test_queue_overflow()
+    print()
+    
+    test_queue_listener()
+    print()
+    
+    test_rate_limiter_across_reruns()
+    print()
+    
+    test_rate_limiter_summary()
+    print()
+    
     test_api_error_handling()
     print()
     
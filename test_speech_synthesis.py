@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the speech synthesis helpers in utils/speech_synthesis.py.
+Run it directly or through pytest; it does not need pyttsx3.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import io
+import math
+import struct
+import wave
+import numpy as np
+from utils.speech_synthesis import aiff_to_wav
+
+def _extended(value):
+    """80-bit IEEE extended encoding of a positive integer, as AIFF stores sample rates."""
+    exponent = int(math.log2(value))
+    return struct.pack(">HQ", 16383 + exponent, int(value * 2 ** (63 - exponent)))
+
+def _aiff(samples, rate, form=b"AIFF", compression=None):
+    """Build mono 16-bit AIFF or AIFF-C bytes for the samples."""
+    little_endian = compression == b"sowt"
+    sound = samples.astype("<i2" if little_endian else ">i2").tobytes()
+    comm = struct.pack(">hIh", 1, len(samples), 16) + _extended(rate)
+    if compression is not None:
+        comm += compression + b"\x00\x00"
+    chunks = b"COMM" + struct.pack(">I", len(comm)) + comm
+    chunks += b"SSND" + struct.pack(">I", len(sound) + 8) + struct.pack(">II", 0, 0) + sound
+    return b"FORM" + struct.pack(">I", len(chunks) + 4) + form + chunks
+
+def test_aiff_to_wav():
+    """AIFF and AIFF-C audio from the macOS speech driver converts to WAV with the same samples."""
+    print("Testing AIFF to WAV conversion...")
+    samples = np.array([0, 1000, -1000, 32767, -32768, 258], dtype=np.int16)
+    for form, compression in ((b"AIFF", None), (b"AIFC", b"NONE"), (b"AIFC", b"sowt")):
+        wav_bytes = aiff_to_wav(_aiff(samples, 22050, form, compression))
+        with wave.open(io.BytesIO(wav_bytes), "rb") as source:
+            assert source.getnchannels() == 1
+            assert source.getsampwidth() == 2
+            assert source.getframerate() == 22050
+            converted = np.frombuffer(source.readframes(source.getnframes()), dtype="<i2")
+        assert np.array_equal(converted, samples), (form, compression)
+
+    try:
+        aiff_to_wav(b"RIFF\x00\x00\x00\x00WAVE")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("WAV input was accepted as AIFF")
+    print("✅ AIFF converted to WAV")
+
+def main():
+    """Run all tests."""
+    print("🔍 Running speech synthesis tests...\n")
+
+    test_aiff_to_wav()
+    print()
+
+    print("🎉 All tests completed!")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,247 @@
 # 📁 utils/api.py
+import copy
+import os
+import threading
+import time
 import requests
 import logging
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple, Hashable, Callable
 from .logger import setup_logger, log_api_call
+from .multipart import MultipartStream
 
 # Setup logger
 logger = setup_logger("api")
 
 API_BASE = "http://65.0.75.215:8081"
+# Backend address as seen from the candidate's browser, for direct uploads
+PUBLIC_API_BASE = os.environ.get("PUBLIC_API_BASE", API_BASE)
+UPLOAD_PATH = "/interview/responses/upload"
+CHUNK_UPLOAD_PATH = "/interview/responses/chunks"
+
+# Keep-alive pool size per backend host. Every Streamlit session shares the same
+# process-wide session, so this caps concurrent connections to each host.
+DEFAULT_POOL_MAXSIZE = 10
+HOST_POOL_MAXSIZE: Dict[str, int] = {
+    API_BASE: 32,
+}
+
+# (connect, read) timeouts in seconds, per endpoint
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 30)
+ENDPOINT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "login_user": (3.05, 10),
+    "register_user": (3.05, 30),
+    "get_candidate_interviews": (3.05, 15),
+    "get_interview_feedback": (3.05, 30),
+    "get_initial_question": (3.05, 60),
+    "get_next_question": (3.05, 60),
+    "get_feedback": (3.05, 120),
+    "upload_audio_response": (3.05, 120),
+    "upload_audio_chunk": (3.05, 30),
+    "commit_audio_upload": (3.05, 120),
+    "abort_audio_upload": (3.05, 10),
+    "get_upload_status": (3.05, 10),
+}
+
+# Seconds a successful read stays cached, per endpoint. Endpoints not listed
+# here are never cached.
+CACHE_TTLS: Dict[str, float] = {
+    "login_user": 60,
+    "get_candidate_interviews": 60,
+    "get_feedback": 300,
+    "get_interview_feedback": 3600,  # feedback for a finished interview never changes
+}
+
+# Seconds a feedback response that is still pending or empty stays cached, so
+# a user who opens feedback before it is generated sees it soon after it is
+FEEDBACK_PENDING_TTL = 10
+CACHE_MAX_ENTRIES = 512
+
+# Endpoints whose cache key is the user's email, dropped by invalidate_user_cache
+USER_KEYED_ENDPOINTS = ("login_user", "get_candidate_interviews", "get_feedback")
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+    
+    The session keeps connections alive between calls and is shared by every
+    Streamlit session in the process.
+    
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                default_adapter = HTTPAdapter(pool_connections=len(HOST_POOL_MAXSIZE) or 1,
+                                              pool_maxsize=DEFAULT_POOL_MAXSIZE)
+                session.mount("http://", default_adapter)
+                session.mount("https://", default_adapter)
+                for host, maxsize in HOST_POOL_MAXSIZE.items():
+                    session.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=maxsize))
+                _session = session
+                logger.info("HTTP session created with pools: %s", HOST_POOL_MAXSIZE)
+    return _session
+
+class _SingleFlight:
+    """Merge identical in-flight calls so only one runs and every caller gets its result."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func, or wait for the identical call already running under key.
+        
+        Args:
+            key: Identity of the call
+            func: Call to run if none is in flight
+            
+        Returns:
+            Result of func, shared by every caller that joined the flight
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+        
+        if not is_leader:
+            logger.debug("Joining in-flight request: %s", key)
+            return future.result()
+        
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+_in_flight = _SingleFlight()
+
+def _request(method: str, path: str, endpoint: str, coalesce: bool = False, **kwargs) -> requests.Response:
+    """
+    Send a request to the backend through the shared session.
+    
+    Args:
+        method: HTTP method
+        path: Path relative to API_BASE
+        endpoint: Endpoint name used to pick the timeout
+        coalesce: Share one backend call between identical concurrent requests.
+            Only safe for idempotent GETs; the response body is fully read
+            before it is shared.
+        **kwargs: Passed through to requests.Session.request
+        
+    Returns:
+        requests.Response object
+    """
+    url = f"{API_BASE}{path}"
+    kwargs.setdefault("timeout", ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT))
+    if coalesce and method == "GET" and not kwargs.get("stream"):
+        return _in_flight.do((method, url), lambda: get_session().request(method, url, **kwargs))
+    return get_session().request(method, url, **kwargs)
+
+class _ResponseCache:
+    """
+    Bounded, thread-safe TTL cache for parsed read responses, shared by all sessions.
+
+    Responses are copied on the way in and out, so a session that changes
+    what it got back never changes what the next session reads.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Dict[Any, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[Dict[Any, Any]]:
+        """Return the cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get((endpoint, key))
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[(endpoint, key)]
+                return None
+            self._entries.move_to_end((endpoint, key))
+        logger.debug("Cache hit for %s/%s", endpoint, key)
+        return copy.deepcopy(data)
+
+    def set(self, endpoint: str, key: Hashable, data: Optional[Dict[Any, Any]], ttl: Optional[float] = None) -> None:
+        """Cache a successful response for ttl seconds (the endpoint's TTL by default), evicting the least recently used entries."""
+        ttl = CACHE_TTLS.get(endpoint) if ttl is None else ttl
+        if not ttl or not _is_cacheable(data):
+            return
+        with self._lock:
+            self._entries[(endpoint, key)] = (time.monotonic() + ttl, copy.deepcopy(data))
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str, key: Hashable) -> None:
+        """Drop one cached response."""
+        with self._lock:
+            self._entries.pop((endpoint, key), None)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+def _is_cacheable(data: Optional[Dict[Any, Any]]) -> bool:
+    """Only cache parsed responses that did not report an error status."""
+    if not isinstance(data, dict):
+        return False
+    status = data.get("status", "success")
+    return status is True or status == "success"
+
+def feedback_is_complete(data: Optional[Dict[Any, Any]]) -> bool:
+    """Whether a feedback response holds generated feedback rather than a pending or empty result."""
+    if not isinstance(data, dict) or data.get("status") != "success":
+        return False
+    feedback = data.get("data")
+    if not isinstance(feedback, dict):
+        return False
+    question_block = feedback.get("question_feedback") or {}
+    return bool(feedback.get("overall_feedback")
+                or (isinstance(question_block, dict) and question_block.get("question_analysis")))
+
+def _feedback_ttl(endpoint: str, data: Optional[Dict[Any, Any]]) -> float:
+    """Cache TTL for a feedback response: the endpoint's own once complete, FEEDBACK_PENDING_TTL before."""
+    return CACHE_TTLS.get(endpoint, 0) if feedback_is_complete(data) else FEEDBACK_PENDING_TTL
+
+_response_cache = _ResponseCache()
+
+def invalidate_user_cache(email: Optional[str]) -> None:
+    """
+    Drop every cached response keyed by a user's email.
+    
+    Args:
+        email: User email
+    """
+    if not email:
+        return
+    for endpoint in USER_KEYED_ENDPOINTS:
+        _response_cache.invalidate(endpoint, email)
+    logger.info("Response cache invalidated for user: %s", email)
+
+def clear_cache() -> None:
+    """Drop every cached response."""
+    _response_cache.clear()
 
 def _handle_api_response(response: requests.Response, endpoint: str, email: Optional[str] = None) -> Optional[Dict[Any, Any]]:
     """
@@ -28,110 +262,226 @@ def _handle_api_response(response: requests.Response, endpoint: str, email: Opti
     except requests.exceptions.HTTPError as e:
         error_msg = f"HTTP {response.status_code}: {str(e)}"
         log_api_call(logger, endpoint, email, success=False, error_msg=error_msg)
-        logger.error(f"API HTTP error for {endpoint}: {error_msg}")
+        logger.error("API HTTP error for %s: %s", endpoint, error_msg)
         return None
     except requests.exceptions.ConnectionError as e:
         error_msg = f"Connection error: {str(e)}"
         log_api_call(logger, endpoint, email, success=False, error_msg=error_msg)
-        logger.error(f"API connection error for {endpoint}: {error_msg}")
+        logger.error("API connection error for %s: %s", endpoint, error_msg)
         return None
     except requests.exceptions.Timeout as e:
         error_msg = f"Timeout error: {str(e)}"
         log_api_call(logger, endpoint, email, success=False, error_msg=error_msg)
-        logger.error(f"API timeout error for {endpoint}: {error_msg}")
+        logger.error("API timeout error for %s: %s", endpoint, error_msg)
         return None
     except requests.exceptions.RequestException as e:
         error_msg = f"Request error: {str(e)}"
         log_api_call(logger, endpoint, email, success=False, error_msg=error_msg)
-        logger.error(f"API request error for {endpoint}: {error_msg}")
+        logger.error("API request error for %s: %s", endpoint, error_msg)
         return None
     except ValueError as e:
         error_msg = f"JSON decode error: {str(e)}"
         log_api_call(logger, endpoint, email, success=False, error_msg=error_msg)
-        logger.error(f"API JSON decode error for {endpoint}: {error_msg}")
+        logger.error("API JSON decode error for %s: %s", endpoint, error_msg)
         return None
 
 def register_user(payload):
     """Register a new user."""
     try:
-        logger.info(f"Attempting to register user with email: {payload.get('email', 'unknown')}")
-        res = requests.post(f"{API_BASE}/interview/candidates/register", json=payload)
+        logger.info("Attempting to register user with email: %s", payload.get('email', 'unknown'))
+        res = _request("POST", "/interview/candidates/register", "register_user", json=payload)
+        if res.ok:
+            invalidate_user_cache(payload.get("candidate_email") or payload.get("email"))
         return res
     except Exception as e:
-        logger.error(f"Error in register_user: {str(e)}")
+        logger.error("Error in register_user: %s", e)
         raise
 
 def get_initial_question(email):
     """Get initial interview question for a candidate."""
     try:
-        logger.info(f"Fetching initial question for email: {email}")
-        res = requests.get(f"{API_BASE}/interview/candidates/{email}/interview-questions")
+        logger.info("Fetching initial question for email: %s", email)
+        res = _request("GET", f"/interview/candidates/{email}/interview-questions", "get_initial_question")
         return _handle_api_response(res, f"get_initial_question/{email}", email)
     except Exception as e:
-        logger.error(f"Error in get_initial_question for {email}: {str(e)}")
+        logger.error("Error in get_initial_question for %s: %s", email, e)
         return None
 
 def get_next_question():
     """Get next interview question."""
     try:
         logger.info("Fetching next interview question")
-        res = requests.get(f"{API_BASE}/interview/next-question")
+        res = _request("GET", "/interview/next-question", "get_next_question")
         return _handle_api_response(res, "get_next_question")
     except Exception as e:
-        logger.error(f"Error in get_next_question: {str(e)}")
+        logger.error("Error in get_next_question: %s", e)
         return None
 
-def upload_audio_response(question, audio_file):
-    """Upload audio response for a question."""
+def upload_audio_response(question, audio_file, email=None, progress=None,
+                          filename="response.wav", content_type="audio/wav"):
+    """
+    Upload audio response for a question, invalidating the user's cached reads on success.
+    
+    The body is streamed with chunked transfer encoding, so audio_file (bytes, a
+    buffer or a spool file) is never copied into a second in-memory request body.
+    
+    Args:
+        question: Question text
+        audio_file: Audio as bytes or a readable binary file object
+        email: User email, used to invalidate cached reads
+        progress: Optional callback progress(bytes_sent, total_bytes)
+        filename: Filename sent for the audio part
+        content_type: Content type of the audio part, e.g. "audio/flac"
+    """
     try:
-        logger.info(f"Uploading audio response for question: {question[:50]}...")
-        files = {
+        logger.info("Uploading audio response for question: %s...", question[:50])
+        body = MultipartStream({
             "question": (None, question),
-            "audio_file": ("response.wav", audio_file, "audio/wav")
-        }
-        res = requests.post(f"{API_BASE}/interview/responses/upload", files=files)
+            "audio_file": (filename, audio_file, content_type)
+        }, progress=progress)
+        res = _request("POST", UPLOAD_PATH, "upload_audio_response",
+                       data=body, headers={"Content-Type": body.content_type})
+        if res.ok:
+            invalidate_user_cache(email)
         return res
     except Exception as e:
-        logger.error(f"Error in upload_audio_response: {str(e)}")
+        logger.error("Error in upload_audio_response: %s", e)
         raise
 
+def _upload_token_headers(token: Optional[str]) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def upload_audio_chunk(upload_id, sequence, data, token=None):
+    """
+    Send one ordered chunk of an answer that is still being recorded.
+    
+    Re-sending a sequence number replaces that chunk, so a failed chunk can be retried.
+    
+    Args:
+        upload_id: Id shared by every chunk of the answer
+        sequence: Chunk number, starting at 0
+        data: Chunk bytes
+        token: Signed upload token from utils.upload_token, if the backend requires one
+    """
+    headers = {"Content-Type": "application/octet-stream", **_upload_token_headers(token)}
+    return _request("PUT", f"{CHUNK_UPLOAD_PATH}/{upload_id}/{sequence}", "upload_audio_chunk",
+                    data=data, headers=headers)
+
+def commit_audio_upload(upload_id, question, total_chunks, email=None, filename="response.wav",
+                        content_type="audio/wav", token=None):
+    """
+    Assemble the chunks of an answer on the backend and submit it, invalidating the user's cached reads on success.
+    
+    The backend answers the same way as for upload_audio_response.
+    
+    Args:
+        upload_id: Id the chunks were sent under
+        question: Question text
+        total_chunks: Number of chunks sent; the backend rejects the commit if any is missing
+        email: User email, used to invalidate cached reads
+        filename: Filename of the assembled audio
+        content_type: Content type of the assembled audio
+        token: Signed upload token from utils.upload_token, if the backend requires one
+    """
+    try:
+        logger.info("Committing chunked upload %s (%s chunks) for question: %s...", upload_id, total_chunks, question[:50])
+        res = _request("POST", f"{CHUNK_UPLOAD_PATH}/{upload_id}/commit", "commit_audio_upload",
+                       json={"question": question, "total_chunks": total_chunks,
+                             "filename": filename, "content_type": content_type},
+                       headers=_upload_token_headers(token))
+        if res.ok:
+            invalidate_user_cache(email)
+        return res
+    except Exception as e:
+        logger.error("Error in commit_audio_upload for %s: %s", upload_id, e)
+        raise
+
+def get_upload_status(upload_id, token=None):
+    """
+    Ask the backend whether an answer uploaded under upload_id was received.
+    
+    Used to confirm uploads reported by the browser, which the Streamlit
+    server never saw.
+    
+    Args:
+        upload_id: Id the answer was uploaded under
+        token: Signed upload token issued for upload_id, if the backend requires one
+        
+    Returns:
+        Parsed response, e.g. {"status": "success", "data": {"upload_id", "bytes", "question"}},
+        or None if the upload is unknown or the call failed
+    """
+    try:
+        res = _request("GET", f"{UPLOAD_PATH}/{upload_id}", "get_upload_status",
+                       headers=_upload_token_headers(token))
+        return _handle_api_response(res, f"get_upload_status/{upload_id}")
+    except Exception as e:
+        logger.error("Error in get_upload_status for %s: %s", upload_id, e)
+        return None
+
+def abort_audio_upload(upload_id, token=None):
+    """Discard the chunks of an answer that will not be committed."""
+    return _request("DELETE", f"{CHUNK_UPLOAD_PATH}/{upload_id}", "abort_audio_upload",
+                    headers=_upload_token_headers(token))
+
 def get_feedback(email):
     """Get overall feedback for a candidate."""
+    cached = _response_cache.get("get_feedback", email)
+    if cached is not None:
+        return cached
     try:
-        logger.info(f"Fetching feedback for email: {email}")
-        res = requests.get(f"{API_BASE}/interview/candidate/{email}/overall/feedback")
-        return _handle_api_response(res, f"get_feedback/{email}", email)
+        logger.info("Fetching feedback for email: %s", email)
+        res = _request("GET", f"/interview/candidate/{email}/overall/feedback", "get_feedback", coalesce=True)
+        data = _handle_api_response(res, f"get_feedback/{email}", email)
+        _response_cache.set("get_feedback", email, data, ttl=_feedback_ttl("get_feedback", data))
+        return data
     except Exception as e:
-        logger.error(f"Error in get_feedback for {email}: {str(e)}")
+        logger.error("Error in get_feedback for %s: %s", email, e)
         return None
 
 def login_user(email):
     """Login user and get their details."""
+    cached = _response_cache.get("login_user", email)
+    if cached is not None:
+        return cached
     try:
-        logger.info(f"Attempting login for email: {email}")
-        res = requests.get(f"{API_BASE}/interview/candidate/{email}")
-        return _handle_api_response(res, f"login_user/{email}", email)
+        logger.info("Attempting login for email: %s", email)
+        res = _request("GET", f"/interview/candidate/{email}", "login_user", coalesce=True)
+        data = _handle_api_response(res, f"login_user/{email}", email)
+        _response_cache.set("login_user", email, data)
+        return data
     except Exception as e:
-        logger.error(f"Error in login_user for {email}: {str(e)}")
+        logger.error("Error in login_user for %s: %s", email, e)
         return None
 
 def get_candidate_interviews(email):
     """Get all interviews for a candidate."""
+    cached = _response_cache.get("get_candidate_interviews", email)
+    if cached is not None:
+        return cached
     try:
-        logger.info(f"Fetching interviews for email: {email}")
-        res = requests.get(f"{API_BASE}/interview/candidate/{email}/interviews")
-        return _handle_api_response(res, f"get_candidate_interviews/{email}", email)
+        logger.info("Fetching interviews for email: %s", email)
+        res = _request("GET", f"/interview/candidate/{email}/interviews", "get_candidate_interviews", coalesce=True)
+        data = _handle_api_response(res, f"get_candidate_interviews/{email}", email)
+        _response_cache.set("get_candidate_interviews", email, data)
+        return data
     except Exception as e:
-        logger.error(f"Error in get_candidate_interviews for {email}: {str(e)}")
+        logger.error("Error in get_candidate_interviews for %s: %s", email, e)
         return None
 
 def get_interview_feedback(interview_id):
     """Get feedback for a specific interview."""
+    cached = _response_cache.get("get_interview_feedback", interview_id)
+    if cached is not None:
+        return cached
     try:
-        logger.info(f"Fetching feedback for interview ID: {interview_id}")
-        res = requests.get(f"{API_BASE}/interview/{interview_id}/feedback")
-        return _handle_api_response(res, f"get_interview_feedback/{interview_id}")
+        logger.info("Fetching feedback for interview ID: %s", interview_id)
+        res = _request("GET", f"/interview/{interview_id}/feedback", "get_interview_feedback", coalesce=True)
+        data = _handle_api_response(res, f"get_interview_feedback/{interview_id}")
+        _response_cache.set("get_interview_feedback", interview_id, data,
+                            ttl=_feedback_ttl("get_interview_feedback", data))
+        return data
     except Exception as e:
-        logger.error(f"Error in get_interview_feedback for {interview_id}: {str(e)}")
+        logger.error("Error in get_interview_feedback for %s: %s", interview_id, e)
         return None
 # You can expand this file with more endpoints as needed
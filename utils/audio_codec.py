@@ -0,0 +1,87 @@
+# 📁 utils/audio_codec.py
+import io
+from typing import Optional, Tuple
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("audio_codec")
+
+# Encodings offered for uploaded answers
+UPLOAD_FORMATS = {
+    "wav": {"filename": "response.wav", "content_type": "audio/wav"},
+    "opus": {
+        "container": "ogg",
+        "codec": "libopus",
+        "sample_rates": (8000, 12000, 16000, 24000, 48000),  # the only rates libopus accepts
+        "filename": "response.ogg",
+        "content_type": "audio/ogg; codecs=opus",
+    },
+    "flac": {
+        "container": "flac",
+        "codec": "flac",
+        "sample_rates": None,  # keep the recorded rate, FLAC is lossless
+        "filename": "response.flac",
+        "content_type": "audio/flac",
+    },
+}
+
+# Opus bitrate in bits per second; 24-32 kbps is transparent for speech
+DEFAULT_OPUS_BITRATE = 32000
+
+def encode_audio(audio_bytes: bytes, fmt: str = "opus", bitrate: Optional[int] = DEFAULT_OPUS_BITRATE) -> Tuple[bytes, str, str]:
+    """
+    Re-encode a recorded answer for upload.
+
+    Decoding and encoding run in-process through PyAV's bundled FFmpeg, so no
+    temporary files or subprocesses are involved. PyAV is imported on first
+    use, so WAV uploads work without it.
+
+    Usage:
+        data, filename, content_type = encode_audio(wav_bytes, "opus", bitrate=24000)
+
+    Args:
+        audio_bytes: Recorded audio in any container FFmpeg can read (WAV, WebM, ...)
+        fmt: One of UPLOAD_FORMATS
+        bitrate: Target bitrate in bits per second, used by lossy formats only
+
+    Returns:
+        Tuple of (encoded bytes, filename, content type) for the multipart field
+
+    Raises:
+        ValueError: If fmt is not a known upload format
+        ImportError: If PyAV is not installed
+        av.error.FFmpegError: If the input cannot be decoded or encoded
+    """
+    if fmt not in UPLOAD_FORMATS:
+        raise ValueError(f"Unknown upload audio format: {fmt}")
+    spec = UPLOAD_FORMATS[fmt]
+    if fmt == "wav":
+        return audio_bytes, spec["filename"], spec["content_type"]
+
+    import av
+    output = io.BytesIO()
+    with av.open(io.BytesIO(audio_bytes)) as source:
+        in_stream = source.streams.audio[0]
+        rate = in_stream.codec_context.sample_rate
+        if spec["sample_rates"] and rate not in spec["sample_rates"]:
+            rate = spec["sample_rates"][-1]
+        layout = "mono" if in_stream.codec_context.channels == 1 else "stereo"
+
+        with av.open(output, mode="w", format=spec["container"]) as target:
+            out_stream = target.add_stream(spec["codec"], rate=rate)
+            out_stream.codec_context.layout = layout
+            if bitrate and fmt == "opus":
+                out_stream.codec_context.bit_rate = bitrate
+
+            resampler = av.AudioResampler(format=out_stream.codec_context.format.name, layout=layout, rate=rate)
+            for frame in source.decode(in_stream):
+                frame.pts = None
+                for resampled in resampler.resample(frame):
+                    target.mux(out_stream.encode(resampled))
+            for resampled in resampler.resample(None):
+                target.mux(out_stream.encode(resampled))
+            target.mux(out_stream.encode(None))
+
+    encoded = output.getvalue()
+    logger.info("Encoded answer audio as %s: %d -> %d bytes", fmt, len(audio_bytes), len(encoded))
+    return encoded, spec["filename"], spec["content_type"]
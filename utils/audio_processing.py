@@ -0,0 +1,560 @@
+# 📁 utils/audio_processing.py
+import io
+import time
+import wave
+from math import gcd
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("audio_processing")
+
+# Speech-grade output: 16 kHz mono 16-bit PCM
+TARGET_SAMPLE_RATE = 16000
+
+# Resampling filter: zero crossings on each side of the centre (measured at the
+# lower of the two rates), Kaiser window shape, and cutoff as a fraction of the
+# lower Nyquist frequency. Together they give over 80 dB of alias rejection and
+# a flat passband up to ~5.5 kHz at 16 kHz, well beyond what speech needs.
+RESAMPLE_HALF_WIDTH = 16
+RESAMPLE_KAISER_BETA = 8.0
+RESAMPLE_ROLLOFF = 0.85
+
+# Voice activity detection. A frame is speech when its energy is VAD_MARGIN_DB
+# above the recording's noise floor (10th percentile frame), or a little less
+# loud but with the high zero-crossing rate of unvoiced consonants.
+VAD_FRAME_MS = 20
+VAD_MARGIN_DB = 12.0
+VAD_MIN_ENERGY_DB = -55.0  # dBFS; quieter frames are always silence
+VAD_DYNAMIC_RANGE_DB = 30.0  # frames this far below the loudest can still be speech
+VAD_ZCR_THRESHOLD = 0.3
+# Silence kept on each side of detected speech so word edges are not clipped
+VAD_HANGOVER_MS = 200
+
+# Pre-upload quality gate. Answers failing a "reject" check are not uploaded;
+# "warn" checks are shown to the candidate but the answer is still sent.
+QUALITY_MIN_SECONDS = 1.5  # reject shorter answers
+QUALITY_MIN_SPEECH_SECONDS = 0.5  # reject answers with less detected speech
+QUALITY_QUIET_RMS_DB = -45.0  # dBFS; warn below
+QUALITY_CLIP_LEVEL = 0.99  # fraction of full scale counted as clipped
+QUALITY_MAX_CLIPPED_RATIO = 0.01  # warn above
+QUALITY_MIN_SPEECH_RATIO = 0.2  # warn below
+
+def decode_wav(data: bytes) -> Tuple[np.ndarray, int]:
+    """
+    Decode a PCM WAV file.
+
+    Args:
+        data: WAV file contents (8, 16, 24 or 32-bit integer PCM)
+
+    Returns:
+        Tuple of (float32 samples in [-1, 1] shaped (frames, channels), sample rate)
+
+    Raises:
+        ValueError: If data is not a PCM WAV file
+    """
+    try:
+        with wave.open(io.BytesIO(data), "rb") as reader:
+            channels = reader.getnchannels()
+            width = reader.getsampwidth()
+            rate = reader.getframerate()
+            raw = reader.readframes(reader.getnframes())
+    except (wave.Error, EOFError) as e:
+        raise ValueError(f"Not a PCM WAV file: {str(e)}") from e
+
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        triplets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        packed = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        samples = ((packed << 8) >> 8).astype(np.float32) / 8388608.0
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {width}")
+
+    return samples.reshape(-1, channels), rate
+
+def downmix(samples: np.ndarray) -> np.ndarray:
+    """Average all channels of a (frames, channels) array into one float32 channel."""
+    if samples.ndim == 1:
+        return samples.astype(np.float32, copy=False)
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1, dtype=np.float32)
+
+def _design_resampler(up: int, down: int) -> np.ndarray:
+    """
+    Kaiser-windowed sinc lowpass for a polyphase resampler, arranged as one row
+    of reversed taps per phase.
+
+    Returns:
+        float32 array shaped (up, taps_per_phase)
+    """
+    scale = max(up, down)
+    length = 2 * RESAMPLE_HALF_WIDTH * scale + 1
+    taps_per_phase = -(-length // up)
+    centre = RESAMPLE_HALF_WIDTH * scale
+    cutoff = RESAMPLE_ROLLOFF * 0.5 / max(up, down)  # cycles per upsampled sample
+
+    n = np.arange(length) - centre
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, RESAMPLE_KAISER_BETA) * up
+    taps = np.concatenate([taps, np.zeros(taps_per_phase * up - length)])
+
+    # taps[p + k * up] is tap k of phase p; reverse k so a forward window dots with it
+    return taps.reshape(taps_per_phase, up)[::-1].T.astype(np.float32)
+
+def load_wav_mono(data: bytes) -> Tuple[np.ndarray, int]:
+    """
+    Decode a PCM WAV file to a single float32 channel.
+
+    Args:
+        data: WAV file contents
+
+    Returns:
+        Tuple of (1-D float32 samples in [-1, 1], sample rate)
+
+    Raises:
+        ValueError: If data is not a PCM WAV file
+    """
+    samples, rate = decode_wav(data)
+    return downmix(samples), rate
+
+def resample_poly(samples: np.ndarray, orig_rate: int, target_rate: int) -> np.ndarray:
+    """
+    Resample a mono signal with a polyphase FIR filter.
+
+    Only the output samples are computed: outputs are grouped by phase, and
+    each group is one matrix-vector product over a strided, zero-copy window
+    view of the input.
+
+    Args:
+        samples: 1-D float32 signal
+        orig_rate: Input sample rate in Hz
+        target_rate: Output sample rate in Hz
+
+    Returns:
+        1-D float32 signal at target_rate, time-aligned with the input
+    """
+    if orig_rate == target_rate or samples.size == 0:
+        return samples.astype(np.float32, copy=False)
+
+    divisor = gcd(orig_rate, target_rate)
+    up, down = target_rate // divisor, orig_rate // divisor
+    filters = _design_resampler(up, down)
+    taps_per_phase = filters.shape[1]
+    centre = RESAMPLE_HALF_WIDTH * max(up, down)
+
+    padded = np.concatenate([
+        np.zeros(taps_per_phase - 1, dtype=np.float32),
+        samples.astype(np.float32, copy=False),
+        np.zeros(2 * taps_per_phase + down, dtype=np.float32),
+    ])
+    windows = sliding_window_view(padded, taps_per_phase)
+
+    out_length = -(-samples.size * up // down)
+    output = np.empty(out_length, dtype=np.float32)
+    for residue in range(min(up, out_length)):
+        position = residue * down + centre
+        count = len(range(residue, out_length, up))
+        start = position // up
+        output[residue::up] = windows[start:start + count * down:down] @ filters[position % up]
+    return output
+
+class StreamingResampler:
+    """
+    Incremental version of resample_poly for audio that arrives in pieces.
+
+    The filter history is carried from one push() to the next, so the
+    concatenated output matches resample_poly over the whole signal with no
+    seams at piece boundaries. Output lags input by half the filter length.
+
+    Usage:
+        resampler = StreamingResampler(48000, 16000)
+        for frame in frames:
+            out = resampler.push(frame)
+        out = resampler.flush()
+    """
+
+    def __init__(self, orig_rate: int, target_rate: int = TARGET_SAMPLE_RATE):
+        self.orig_rate = orig_rate
+        self.target_rate = target_rate
+        divisor = gcd(orig_rate, target_rate)
+        self._up, self._down = target_rate // divisor, orig_rate // divisor
+        self._filters = _design_resampler(self._up, self._down)
+        self._taps = self._filters.shape[1]
+        self._centre = RESAMPLE_HALF_WIDTH * max(self._up, self._down)
+        # Unconsumed input, and the padded-input index of its first sample
+        self._buffer = np.zeros(self._taps - 1, dtype=np.float32)
+        self._offset = 0
+        self._inputs = 0
+        self._outputs = 0
+
+    def _window_start(self, index: np.ndarray) -> np.ndarray:
+        return (index * self._down + self._centre) // self._up
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Add input samples and return every output sample that can now be computed.
+
+        Args:
+            samples: 1-D float32 signal at orig_rate
+
+        Returns:
+            1-D float32 signal at target_rate, possibly empty
+        """
+        samples = samples.astype(np.float32, copy=False)
+        self._inputs += samples.size
+        if self.orig_rate == self.target_rate:
+            self._outputs += samples.size
+            return samples
+        self._buffer = np.concatenate([self._buffer, samples])
+        return self._drain(self._offset + self._buffer.size)
+
+    def flush(self) -> np.ndarray:
+        """Return the remaining output once the input has ended."""
+        if self.orig_rate == self.target_rate:
+            return np.zeros(0, dtype=np.float32)
+        self._buffer = np.concatenate([self._buffer, np.zeros(2 * self._taps + self._down, dtype=np.float32)])
+        total = -(-self._inputs * self._up // self._down)
+        return self._drain(self._offset + self._buffer.size, limit=total)
+
+    def _drain(self, available: int, limit: Optional[int] = None) -> np.ndarray:
+        # Output m needs padded input up to _window_start(m) + taps
+        last = (available - self._taps + 1) * self._up - self._centre - 1
+        count = max(0, last // self._down + 1 - self._outputs) if last >= 0 else 0
+        if limit is not None:
+            count = min(count, max(0, limit - self._outputs))
+        index = np.arange(self._outputs, self._outputs + count)
+        if count:
+            windows = sliding_window_view(self._buffer, self._taps)
+            positions = index * self._down + self._centre
+            output = np.einsum("ij,ij->i", windows[positions // self._up - self._offset],
+                               self._filters[positions % self._up])
+        else:
+            output = np.zeros(0, dtype=np.float32)
+        self._outputs += count
+
+        # Drop input no future output can reach
+        keep_from = int(self._window_start(np.int64(self._outputs))) - self._offset
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._offset += keep_from
+        return output.astype(np.float32, copy=False)
+
+def to_pcm16(samples: np.ndarray) -> np.ndarray:
+    """Requantize float samples in [-1, 1] to int16 with clipping."""
+    return np.clip(np.rint(samples * 32767.0), -32768, 32767).astype(np.int16)
+
+def encode_wav(samples: np.ndarray, rate: int) -> bytes:
+    """
+    Encode mono int16 samples as a WAV file.
+
+    Args:
+        samples: 1-D int16 array
+        rate: Sample rate in Hz
+
+    Returns:
+        WAV file contents
+    """
+    output = io.BytesIO()
+    with wave.open(output, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(samples.astype("<i2", copy=False).tobytes())
+    return output.getvalue()
+
+def to_upload_wav(samples: np.ndarray, rate: int, target_rate: int = TARGET_SAMPLE_RATE) -> bytes:
+    """
+    Resample a mono float signal and encode it as 16-bit WAV.
+
+    Args:
+        samples: 1-D float32 signal
+        rate: Sample rate of samples in Hz
+        target_rate: Output sample rate in Hz
+
+    Returns:
+        WAV file contents
+    """
+    return encode_wav(to_pcm16(resample_poly(samples, rate, target_rate)), target_rate)
+
+def preprocess_for_upload(audio_bytes: bytes, target_rate: int = TARGET_SAMPLE_RATE) -> bytes:
+    """
+    Convert a recorded WAV answer to speech-grade 16 kHz mono 16-bit WAV.
+
+    Usage:
+        wav_16k = preprocess_for_upload(audio['bytes'])
+
+    Args:
+        audio_bytes: Recorded WAV file
+        target_rate: Output sample rate in Hz
+
+    Returns:
+        Re-encoded WAV file
+
+    Raises:
+        ValueError: If audio_bytes is not a PCM WAV file
+    """
+    started = time.perf_counter()
+    samples, rate = decode_wav(audio_bytes)
+    output = to_upload_wav(downmix(samples), rate, target_rate)
+    logger.info("Preprocessed answer audio: %dch %d Hz -> 1ch %d Hz, %d -> %d bytes in %.1f ms",
+                samples.shape[1], rate, target_rate, len(audio_bytes), len(output),
+                (time.perf_counter() - started) * 1000)
+    return output
+
+def frame_features(samples: np.ndarray, rate: int, frame_ms: int = VAD_FRAME_MS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-frame energy and zero-crossing rate of a mono signal.
+
+    Frames are non-overlapping reshaped views of the signal, so no samples are
+    copied; a partial last frame is ignored.
+
+    Args:
+        samples: 1-D float32 signal
+        rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Tuple of (energy in dBFS, zero-crossing rate in crossings per sample)
+    """
+    frame_length = max(int(rate * frame_ms / 1000), 2)
+    frame_count = samples.size // frame_length
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+
+    power = np.einsum("ij,ij->i", frames, frames) / frame_length
+    energy_db = 10 * np.log10(power + 1e-12)
+    signs = np.signbit(frames)
+    # Summing a uint8 view of the boolean crossings is several times faster than count_nonzero(axis=1)
+    crossings = np.not_equal(signs[:, 1:], signs[:, :-1]).view(np.uint8).sum(axis=1, dtype=np.int32)
+    return energy_db, crossings / (frame_length - 1)
+
+def detect_speech(samples: np.ndarray, rate: int, frame_ms: int = VAD_FRAME_MS) -> np.ndarray:
+    """
+    Frame-level voice activity detection from energy and zero-crossing rate.
+
+    Args:
+        samples: 1-D float32 signal
+        rate: Sample rate in Hz
+        frame_ms: Frame length in milliseconds
+
+    Returns:
+        Boolean array, True for frames that contain speech
+    """
+    return _speech_frames(*frame_features(samples, rate, frame_ms))
+
+def _speech_frames(energy_db: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+    """Classify frames as speech from their energy and zero-crossing rate."""
+    if energy_db.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    noise_floor = np.percentile(energy_db, 10)
+    threshold = min(noise_floor + VAD_MARGIN_DB, energy_db.max() - VAD_DYNAMIC_RANGE_DB)
+    threshold = max(threshold, VAD_MIN_ENERGY_DB)
+    voiced = energy_db > threshold
+    unvoiced = (energy_db > max(threshold - VAD_MARGIN_DB / 2, VAD_MIN_ENERGY_DB)) & (zcr > VAD_ZCR_THRESHOLD)
+    return voiced | unvoiced
+
+def trim_silence(samples: np.ndarray, rate: int, max_pause: Optional[float] = None,
+                 frame_ms: int = VAD_FRAME_MS) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Cut leading and trailing silence, and optionally shorten long pauses.
+
+    Recordings with no detected speech are returned unchanged.
+
+    Usage:
+        trimmed, stats = trim_silence(samples, rate, max_pause=2.0)
+
+    Args:
+        samples: 1-D float32 signal
+        rate: Sample rate in Hz
+        max_pause: Longest internal pause to keep, in seconds; None keeps every pause
+        frame_ms: VAD frame length in milliseconds
+
+    Returns:
+        Tuple of (trimmed signal, stats) where stats has the original and kept
+        durations, detected speech, cut leading/trailing silence and the number
+        and length of shortened pauses, all in seconds
+    """
+    frame_length = max(int(rate * frame_ms / 1000), 2)
+    frame_seconds = frame_length / rate
+    speech = detect_speech(samples, rate, frame_ms)
+    stats: Dict[str, Any] = {
+        "original_seconds": round(samples.size / rate, 3),
+        "speech_seconds": round(int(np.count_nonzero(speech)) * frame_seconds, 3),
+        "leading_silence_seconds": 0.0,
+        "trailing_silence_seconds": 0.0,
+        "pauses_shortened": 0,
+        "pause_seconds_removed": 0.0,
+        "kept_seconds": round(samples.size / rate, 3),
+    }
+    speech_frames = np.flatnonzero(speech)
+    if speech_frames.size == 0:
+        return samples, stats
+
+    # Widen speech by the hangover so word onsets and tails survive
+    hangover = int(np.ceil(VAD_HANGOVER_MS / 1000 / frame_seconds))
+    padded_speech = np.convolve(speech, np.ones(2 * hangover + 1, dtype=bool), mode="same") > 0
+    first, last = (int(i) for i in np.flatnonzero(padded_speech)[[0, -1]])
+    keep = np.zeros(speech.size, dtype=bool)
+    keep[first:last + 1] = True
+
+    if max_pause is not None:
+        max_pause_frames = max(int(max_pause / frame_seconds), 1)
+        # Silence runs between first and last speech frame, as [start, end) pairs
+        edges = np.diff(np.concatenate(([1], padded_speech[first:last + 1].astype(np.int8), [1])))
+        starts = np.flatnonzero(edges == -1) + first
+        ends = np.flatnonzero(edges == 1) + first
+        long_runs = (ends - starts) > max_pause_frames
+        half = max_pause_frames // 2
+        for start, end in zip(starts[long_runs], ends[long_runs]):
+            keep[start + half:end - (max_pause_frames - half)] = False
+        stats["pauses_shortened"] = int(np.count_nonzero(long_runs))
+        stats["pause_seconds_removed"] = round(
+            float(np.sum(ends[long_runs] - starts[long_runs] - max_pause_frames)) * frame_seconds, 3)
+
+    sample_keep = np.repeat(keep, frame_length)
+    if sample_keep.size < samples.size:
+        # The partial last frame follows the last full frame
+        sample_keep = np.concatenate([sample_keep, np.full(samples.size - sample_keep.size, keep[-1])])
+    trimmed = samples[sample_keep]
+
+    stats["leading_silence_seconds"] = round(first * frame_seconds, 3)
+    if last < keep.size - 1:
+        stats["trailing_silence_seconds"] = round((samples.size - (last + 1) * frame_length) / rate, 3)
+    stats["kept_seconds"] = round(trimmed.size / rate, 3)
+    return trimmed, stats
+
+def analyze_quality(samples: np.ndarray, rate: int, frame_ms: int = VAD_FRAME_MS) -> Dict[str, Any]:
+    """
+    Check a recorded answer before it is uploaded.
+
+    Measures duration, RMS level, the share of clipped samples and the share
+    of frames with speech in a single vectorized pass over the frames.
+
+    Usage:
+        report = analyze_quality(samples, rate)
+        if report["verdict"] == "reject":
+            ...
+
+    Args:
+        samples: 1-D float32 signal in [-1, 1]
+        rate: Sample rate in Hz
+        frame_ms: VAD frame length in milliseconds
+
+    Returns:
+        Dict with duration_seconds, rms_db, peak_db, clipped_ratio, speech_ratio,
+        speech_seconds, issues (list of {"level", "message"}) and a verdict of
+        "ok", "warn" or "reject"
+    """
+    energy_db, zcr = frame_features(samples, rate, frame_ms)
+    speech = _speech_frames(energy_db, zcr)
+    frame_seconds = max(int(rate * frame_ms / 1000), 2) / rate
+
+    duration = samples.size / rate
+    power = float(np.mean(10 ** (energy_db / 10))) if energy_db.size else 0.0
+    peak = max(float(samples.max()), -float(samples.min())) if samples.size else 0.0
+    clipped_ratio = 0.0
+    if peak >= QUALITY_CLIP_LEVEL:
+        clipped_ratio = np.count_nonzero(np.abs(samples) >= QUALITY_CLIP_LEVEL) / samples.size
+    speech_seconds = int(np.count_nonzero(speech)) * frame_seconds
+    speech_ratio = speech_seconds / duration if duration else 0.0
+
+    issues: List[Dict[str, str]] = []
+    if duration < QUALITY_MIN_SECONDS:
+        issues.append({"level": "reject", "message": f"The recording is only {duration:.1f} seconds long."})
+    elif speech_seconds < QUALITY_MIN_SPEECH_SECONDS:
+        issues.append({"level": "reject", "message": "No speech was detected. Please check your microphone."})
+    else:
+        if float(10 * np.log10(power + 1e-12)) < QUALITY_QUIET_RMS_DB:
+            issues.append({"level": "warn", "message": "Your recording is very quiet. Try speaking closer to the microphone."})
+        if clipped_ratio > QUALITY_MAX_CLIPPED_RATIO:
+            issues.append({"level": "warn", "message": "Your recording is distorted. Try speaking a little further from the microphone."})
+        if speech_ratio < QUALITY_MIN_SPEECH_RATIO:
+            issues.append({"level": "warn", "message": "Most of the recording is silence."})
+
+    levels = {issue["level"] for issue in issues}
+    return {
+        "duration_seconds": round(duration, 3),
+        "rms_db": round(float(10 * np.log10(power + 1e-12)), 1),
+        "peak_db": round(float(20 * np.log10(peak + 1e-12)), 1),
+        "clipped_ratio": round(float(clipped_ratio), 5),
+        "speech_ratio": round(speech_ratio, 3),
+        "speech_seconds": round(speech_seconds, 3),
+        "issues": issues,
+        "verdict": "reject" if "reject" in levels else "warn" if "warn" in levels else "ok",
+    }
+
+def benchmark_preprocess(seconds: float = 60.0, rate: int = 48000, channels: int = 2,
+                         uplink_mbps: float = 5.0, repeats: int = 5) -> dict:
+    """
+    Time preprocess_for_upload on a synthetic recording and compare it with the
+    upload time it saves at a given uplink speed.
+
+    Args:
+        seconds: Length of the synthetic answer
+        rate: Recording sample rate in Hz
+        channels: Recording channel count
+        uplink_mbps: Assumed client-to-backend bandwidth in megabits per second
+        repeats: Runs to take the best time from
+
+    Returns:
+        Dict with sizes, best processing time and upload time saved, in seconds
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * rate)) / rate
+    voice = 0.3 * np.sin(2 * np.pi * 180 * t) * (1 + np.sin(2 * np.pi * 3 * t)) / 2
+    signal = voice[:, None] + 0.01 * rng.standard_normal((t.size, channels))
+    recording = io.BytesIO()
+    with wave.open(recording, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(to_pcm16(signal).tobytes())
+    recording = recording.getvalue()
+
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        processed = preprocess_for_upload(recording)
+        best = min(best, time.perf_counter() - started)
+
+    bytes_per_second = uplink_mbps * 1e6 / 8
+    return {
+        "input_bytes": len(recording),
+        "output_bytes": len(processed),
+        "processing_seconds": best,
+        "upload_seconds_saved": (len(recording) - len(processed)) / bytes_per_second,
+    }
+
+def benchmark_quality_gate(seconds: float = 60.0, rate: int = 48000, repeats: int = 5) -> float:
+    """
+    Best time in seconds for analyze_quality on a synthetic mono answer.
+
+    Args:
+        seconds: Length of the synthetic answer
+        rate: Sample rate in Hz
+        repeats: Runs to take the best time from
+    """
+    t = np.arange(int(seconds * rate)) / rate
+    samples = (0.3 * np.sin(2 * np.pi * 180 * t) * (np.sin(2 * np.pi * 0.5 * t) > 0)).astype(np.float32)
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        analyze_quality(samples, rate)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+if __name__ == "__main__":
+    # python -m utils.audio_processing
+    print(f"Quality gate on a 60 s answer @ 48000 Hz: {benchmark_quality_gate() * 1000:.1f} ms")
+    for rate, channels in ((44100, 1), (48000, 2)):
+        result = benchmark_preprocess(rate=rate, channels=channels)
+        print(f"60 s answer @ {rate} Hz x{channels}: {result['input_bytes'] / 1e6:.1f} MB -> "
+              f"{result['output_bytes'] / 1e6:.1f} MB, processing {result['processing_seconds'] * 1000:.0f} ms, "
+              f"saves {result['upload_seconds_saved']:.1f} s of upload at 5 Mbps")
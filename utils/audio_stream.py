@@ -0,0 +1,190 @@
+# 📁 utils/audio_stream.py
+import threading
+import time
+from typing import Any, Dict, Optional
+import numpy as np
+from .audio_processing import TARGET_SAMPLE_RATE, StreamingResampler, downmix, to_pcm16
+from .chunked_upload import ChunkedUploadSession
+from .ring_buffer import DEFAULT_BUFFER_SECONDS, AudioRingBuffer
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("audio_stream")
+
+# Milliseconds of 16 kHz audio per ingest chunk
+STREAM_BATCH_MS = 500
+
+# Seconds between checks of the ring buffer by the worker thread
+STREAM_POLL_SECONDS = 0.05
+
+# Abort a stream that has had no frames for this long without being finished,
+# e.g. because the candidate closed the tab mid-answer
+STREAM_IDLE_TIMEOUT = 120
+
+def frame_to_mono(frame: Any) -> np.ndarray:
+    """
+    Convert an av.AudioFrame from streamlit-webrtc to one float32 channel.
+
+    Handles packed (interleaved) and planar layouts in int16 or float formats.
+    """
+    data = frame.to_ndarray()
+    channels = len(frame.layout.channels)
+    if frame.format.is_planar:
+        data = data.T
+    else:
+        data = data.reshape(-1, channels)
+    if data.dtype == np.int16:
+        data = data.astype(np.float32) / 32768.0
+    elif data.dtype == np.int32:
+        data = data.astype(np.float32) / 2147483648.0
+    return downmix(data)
+
+class AudioStreamUploader:
+    """
+    Stream an answer to the backend ingest endpoint while it is being recorded.
+
+    audio_frame_callback runs on the WebRTC worker thread and only copies the
+    frame into a preallocated AudioRingBuffer. A background thread, started
+    with the first frame, reads the
+    ring through zero-copy views, downmixes and resamples the audio
+    to 16 kHz, converts them to 16-bit PCM and sends them in STREAM_BATCH_MS
+    chunks through a ChunkedUploadSession, so the backend can start
+    transcribing before the answer ends. A stream that receives no frames for
+    STREAM_IDLE_TIMEOUT seconds before finish() aborts itself, so an
+    abandoned answer does not keep its thread or its backend upload.
+
+    Usage:
+        stream = AudioStreamUploader(question, email=email)
+        webrtc_streamer(..., audio_frame_callback=stream.audio_frame_callback)
+        ...
+        result = stream.finish()
+
+    Args:
+        question: Question being answered
+        email: Candidate email, used to invalidate cached reads on commit
+        token: Signed upload token from utils.upload_token, if the backend requires one
+        upload_id: Upload id the token was issued for
+        target_rate: Sample rate sent to the backend
+        batch_ms: Milliseconds of audio per chunk
+        buffer_seconds: Audio the ring buffer holds before frames are dropped
+    """
+
+    def __init__(self, question: str, email: Optional[str] = None, token: Optional[str] = None,
+                 upload_id: Optional[str] = None, target_rate: int = TARGET_SAMPLE_RATE,
+                 batch_ms: int = STREAM_BATCH_MS, buffer_seconds: float = DEFAULT_BUFFER_SECONDS):
+        self.target_rate = target_rate
+        self.upload = ChunkedUploadSession(
+            question, email=email, upload_id=upload_id, token=token, filename="response.pcm",
+            content_type=f"audio/L16; rate={target_rate}; channels=1",
+            min_chunk_bytes=target_rate * batch_ms // 1000 * 2,
+        )
+        self.frames_received = 0
+        self.samples_sent = 0
+        self.started_at: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self.buffer_seconds = buffer_seconds
+        self._ring: Optional[AudioRingBuffer] = None
+        self._resampler: Optional[StreamingResampler] = None
+        self._stopped = False
+        self._last_frame_at = 0.0
+        self._done = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def upload_id(self) -> str:
+        return self.upload.upload_id
+
+    @property
+    def seconds_sent(self) -> float:
+        """Seconds of audio handed to the uploader so far."""
+        return self.samples_sent / self.target_rate
+
+    @property
+    def frames_dropped(self) -> int:
+        """Samples per channel lost because the ring buffer was full."""
+        return self._ring.overruns if self._ring is not None else 0
+
+    def audio_frame_callback(self, frame: Any) -> Any:
+        """streamlit-webrtc audio callback; copies the frame and never blocks the WebRTC thread."""
+        if self._stopped:
+            return frame
+        if self._ring is None:
+            self.started_at = time.time()
+            self._ring = AudioRingBuffer.for_seconds(self.buffer_seconds, frame.sample_rate)
+            # Set before the worker starts, so its idle check never sees the initial 0.0
+            self._last_frame_at = time.monotonic()
+            self._worker = threading.Thread(target=self._run, name="audio_stream", daemon=True)
+            self._worker.start()
+        self.frames_received += 1
+        self._last_frame_at = time.monotonic()
+        self._ring.write_frame(frame)
+        return frame
+
+    def _run(self) -> None:
+        while True:
+            stopping = self._done.wait(STREAM_POLL_SECONDS)
+            if self.error is not None:
+                return
+            if not stopping and time.monotonic() - self._last_frame_at > STREAM_IDLE_TIMEOUT:
+                logger.warning("Audio stream %s had no frames for %ss, aborting", self.upload_id, STREAM_IDLE_TIMEOUT)
+                self.abort()
+                return
+            try:
+                self._drain()
+                if stopping:
+                    if self._resampler is not None:
+                        self._write(self._resampler.flush())
+                    return
+            except Exception as e:
+                logger.error("Audio stream %s failed: %s", self.upload_id, e)
+                self.error = e
+                self.upload.abort()
+                return
+
+    def _drain(self) -> None:
+        ring = self._ring
+        if ring is None or not ring.available:
+            return
+        if self._resampler is None:
+            self._resampler = StreamingResampler(ring.sample_rate, self.target_rate)
+        count = ring.available
+        for view in ring.readable(count):
+            self._write(self._resampler.push(downmix(view.astype(np.float32) / 32768.0)))
+        ring.consume(count)
+
+    def _write(self, samples: np.ndarray) -> None:
+        if samples.size:
+            self.upload.send(to_pcm16(samples).tobytes())
+            self.samples_sent += samples.size
+
+    def finish(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Stop taking frames, send what is left and commit the answer.
+
+        Args:
+            timeout: Seconds to wait for queued audio to be sent, no limit by default
+
+        Returns:
+            Parsed commit response
+
+        Raises:
+            requests.exceptions.RequestException: If a chunk or the commit failed
+            ValueError: If the audio could not be processed
+        """
+        self._stopped = True
+        self._done.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        if self.error is not None:
+            raise self.error
+        if self.frames_dropped:
+            logger.warning("Audio stream %s dropped %d samples of %d frames",
+                           self.upload_id, self.frames_dropped, self.frames_received)
+        return self.upload.commit(timeout)
+
+    def abort(self) -> None:
+        """Stop taking frames and discard the audio sent so far."""
+        self._stopped = True
+        self.error = self.error or RuntimeError("Audio stream aborted")
+        self._done.set()
+        self.upload.abort()
@@ -0,0 +1,379 @@
+# 📁 utils/background.py
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+import streamlit as st
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("background")
+
+# Worker threads shared by every session for backend calls that should not
+# block a script run. Jobs must not call Streamlit APIs. Size this for the
+# backend calls in flight at once, not for the number of sessions.
+BACKGROUND_WORKERS = 16
+
+# Jobs allowed to wait for a worker across all sessions; submissions beyond
+# this are refused with JobQueueFull instead of queueing without bound
+MAX_QUEUED_JOBS = 128
+
+# Most jobs of one name running at once, so slow calls cannot take every
+# worker; names not listed are limited only by BACKGROUND_WORKERS
+JOB_CONCURRENCY_LIMITS: Dict[str, int] = {
+    "answer_upload": 6,
+    "answer_stream": 6,
+    "final_feedback": 4,  # feedback generation holds a worker for up to two minutes
+    "interview_feedback": 8,  # fanned out by the dashboard, several per page load
+}
+
+# Seconds between polls of a running job by show_job_progress
+JOB_POLL_INTERVAL = 0.5
+
+# Seconds await_job waits for a job before falling back to show_job_progress,
+# so a job answered from the response cache returns on the same script run
+# instead of costing a progress tick and a second rerun
+JOB_INLINE_WAIT = 0.1
+
+# Log a warning with the queue metrics when a job waits longer than this for a worker
+JOB_WAIT_WARNING_SECONDS = 1.0
+
+class JobQueueFull(RuntimeError):
+    """Raised when MAX_QUEUED_JOBS jobs are already waiting for a worker."""
+
+class Job:
+    """
+    Handle for a background job that a page can keep in st.session_state and
+    poll across reruns.
+
+    The job function receives the Job as its first argument and may call
+    update() to report progress or publish intermediate values.
+    """
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = ""
+        self.values: Dict[str, Any] = {}
+        self.error: Optional[BaseException] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future: Future = Future()
+
+    def update(self, progress: Optional[float] = None, message: Optional[str] = None, **values) -> None:
+        """
+        Report progress from inside the job.
+
+        Args:
+            progress: Fraction complete, 0.0 to 1.0
+            message: Short status text for the page to show
+            **values: Intermediate results the page can read before the job finishes
+        """
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self.message = message
+        self.values.update(values)
+
+    def done(self) -> bool:
+        """Whether the job has finished, successfully or not."""
+        return self.future.done()
+
+    @property
+    def failed(self) -> bool:
+        """Whether the job raised."""
+        return self.status == "failed"
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the job was submitted, or its total duration once finished."""
+        return (self.finished_at or time.time()) - self.submitted_at
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for and return the job's result, re-raising its error."""
+        return self.future.result(timeout)
+
+    def _run(self, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        self.status = "running"
+        self.started_at = time.time()
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException as e:
+            self.error = e
+            self.status = "failed"
+            self.finished_at = time.time()
+            logger.error("Job %s (%s) failed after %.2fs: %s", self.name, self.id, self.elapsed, e)
+            self.future.set_exception(e)
+        else:
+            self.progress = 1.0
+            self.status = "done"
+            self.finished_at = time.time()
+            self.future.set_result(result)
+
+class JobRunner:
+    """
+    Bounded thread pool shared by every session, with per-name concurrency
+    limits, a cap on waiting jobs and queue-depth metrics.
+
+    Jobs over their name's limit wait in a per-name queue rather than on a
+    worker, so a burst of slow jobs of one kind never blocks the others.
+
+    Args:
+        workers: Worker threads
+        max_queued: Jobs allowed to wait for a worker before submit() refuses more
+        limits: Most jobs of each name running at once
+    """
+
+    def __init__(self, workers: int = BACKGROUND_WORKERS, max_queued: int = MAX_QUEUED_JOBS,
+                 limits: Optional[Dict[str, int]] = None):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.limits = dict(JOB_CONCURRENCY_LIMITS if limits is None else limits)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="background")
+        self._lock = threading.Lock()
+        self._waiting: Dict[str, Deque[tuple]] = {}
+        self._active: Dict[str, int] = {}  # dispatched to the pool, queued there or running
+        self._queued = 0
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        logger.info("Background job runner started with %d workers, %d queued jobs max, limits %s",
+                    workers, max_queued, self.limits)
+
+    def submit(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Job:
+        """
+        Run func(job, *args, **kwargs) on the pool.
+
+        Returns:
+            Job handle
+
+        Raises:
+            JobQueueFull: If MAX_QUEUED_JOBS jobs are already waiting
+        """
+        job = Job(name)
+        with self._lock:
+            if self._queued >= self.max_queued:
+                self._counts["rejected"] += 1
+                logger.warning("Refusing job %s: %d jobs already queued", name, self._queued)
+                raise JobQueueFull(f"{self._queued} background jobs are already queued")
+            self._queued += 1
+            self._counts["submitted"] += 1
+            entry = (job, func, args, kwargs)
+            if self._active.get(name, 0) < self.limits.get(name, self.workers):
+                self._dispatch(entry)
+            else:
+                self._waiting.setdefault(name, deque()).append(entry)
+        return job
+
+    def _dispatch(self, entry: tuple) -> None:
+        # Called with the lock held
+        job = entry[0]
+        self._active[job.name] = self._active.get(job.name, 0) + 1
+        self._executor.submit(self._execute, *entry)
+
+    def _execute(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> None:
+        wait = time.time() - job.submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+        if wait > JOB_WAIT_WARNING_SECONDS:
+            logger.warning("Job %s (%s) waited %.2fs for a worker: %s", job.name, job.id, wait, self.metrics())
+        try:
+            job._run(func, args, kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._counts["failed" if job.failed else "completed"] += 1
+                self._active[job.name] -= 1
+                waiting = self._waiting.get(job.name)
+                if waiting:
+                    self._dispatch(waiting.popleft())
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the runner's load.
+
+        Returns:
+            Dict with workers, max_queued, queued (waiting for a worker),
+            running, active and waiting per job name, submitted/completed/
+            failed/rejected totals, and mean and max seconds jobs waited
+        """
+        with self._lock:
+            started = self._counts["completed"] + self._counts["failed"] + self._running
+            return {
+                "workers": self.workers,
+                "max_queued": self.max_queued,
+                "queued": self._queued,
+                "running": self._running,
+                "active_by_name": {name: count for name, count in self._active.items() if count},
+                "waiting_by_name": {name: len(waiting) for name, waiting in self._waiting.items() if waiting},
+                **self._counts,
+                "mean_wait_seconds": self._wait_total / started if started else 0.0,
+                "max_wait_seconds": self._wait_max,
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_job_runner() -> JobRunner:
+    """
+    Return the process-wide job runner, created once and shared by every session.
+
+    Returns:
+        Shared JobRunner instance
+    """
+    return JobRunner()
+
+def submit_job(name: str, func: Callable[..., Any], *args, **kwargs) -> Job:
+    """
+    Run a pollable job on the shared job runner.
+
+    Usage:
+        job = submit_job("upload", upload_fn, audio_bytes)
+        st.session_state.upload_job = job
+        ...
+        st.progress(job.progress, text=job.message)
+
+    Args:
+        name: Job name, used for logging and concurrency limits
+        func: Job function, called as func(job, *args, **kwargs); must not call Streamlit APIs
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Job handle
+
+    Raises:
+        JobQueueFull: If the runner's queue is full
+    """
+    return get_job_runner().submit(name, func, *args, **kwargs)
+
+class _Call:
+    """One call of a gather(), run by whichever thread claims it first."""
+
+    def __init__(self, func: Callable[..., Any], args: tuple):
+        self.func = func
+        self.args = args
+        self.future: Future = Future()
+        self._claim = threading.Lock()
+
+    def run(self, job: Optional[Job] = None) -> None:
+        if not self._claim.acquire(blocking=False):
+            return
+        try:
+            self.future.set_result(self.func(*self.args))
+        except BaseException as e:
+            self.future.set_exception(e)
+
+def gather(name: str, *calls: tuple) -> List[Any]:
+    """
+    Run several calls at once on the shared job runner and return their results in order.
+
+    The calling thread runs the first call itself, then any call no worker
+    has picked up yet, so gather() is safe inside a job and never waits on a
+    full pool. Page latency is the slowest call instead of the sum of them.
+
+    Usage:
+        interviews, feedback = gather("dashboard", (get_candidate_interviews, email),
+                                      (get_interview_feedback, interview_id))
+
+    Args:
+        name: Job name for the calls sent to the pool, used for logging and concurrency limits
+        *calls: (func, *args) tuples; funcs must not call Streamlit APIs
+
+    Returns:
+        List of results in the same order as the calls
+
+    Raises:
+        The first error raised by a call, once every call has finished
+    """
+    pending = [_Call(call[0], tuple(call[1:])) for call in calls]
+    for call in pending[1:]:
+        try:
+            submit_job(name, call.run)
+        except JobQueueFull:
+            # This thread runs whatever could not be queued
+            break
+    for call in pending:
+        call.run()
+    wait([call.future for call in pending])
+    for call in pending:
+        if call.future.exception() is not None:
+            raise call.future.exception()
+    return [call.future.result() for call in pending]
+
+def start_job(key: str, name: str, func: Callable[..., Any], *args, **kwargs) -> Job:
+    """
+    Run func(*args, **kwargs) in the background and keep its job in st.session_state[key].
+
+    Args:
+        key: Session state key for the job
+        name: Job name, used for logging and concurrency limits
+        func: Call to run, e.g. a utils.api function; must not call Streamlit APIs
+
+    Returns:
+        Job handle
+    """
+    job = submit_job(name, lambda job: func(*args, **kwargs))
+    st.session_state[key] = job
+    return job
+
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def show_job_progress(key: str, text: str) -> None:
+    """Timer fragment showing the job in st.session_state[key]; reruns the page once it finishes."""
+    job = st.session_state.get(key)
+    if job is None or job.done():
+        st.rerun()
+    st.progress(job.progress, text=f"{job.message or text} ({job.elapsed:.0f}s)")
+
+def await_job(key: str, text: str = "Loading...") -> Any:
+    """
+    Return the result of the job in st.session_state[key] once it has finished.
+
+    A job that finishes within JOB_INLINE_WAIT seconds, e.g. one answered
+    from the response cache, is returned on this run. Otherwise this shows a
+    progress bar refreshed by a timer fragment and stops the script run
+    there; the fragment reruns the page when the job finishes, and this call
+    then returns its result. Widgets above the call stay responsive in the
+    meantime.
+
+    Usage:
+        if "history_job" not in st.session_state:
+            start_job("history_job", "history", get_candidate_interviews, email)
+        response = await_job("history_job", "Loading your interviews...")
+
+    Args:
+        key: Session state key the job was started under
+        text: Progress text shown while the job has not reported its own
+
+    Returns:
+        The job's result; the job is removed from session state
+
+    Raises:
+        Whatever the job raised
+    """
+    job = st.session_state[key]
+    if not job.done():
+        wait([job.future], timeout=JOB_INLINE_WAIT)
+    if not job.done():
+        show_job_progress(key, text)
+        st.stop()
+    del st.session_state[key]
+    return job.result()
+
+def run_job(key: str, name: str, func: Callable[..., Any], *args, text: str = "Loading...", **kwargs) -> Any:
+    """
+    start_job() unless a job is already in st.session_state[key], then await_job().
+
+    Returns:
+        The call's result once it has finished
+    """
+    if key not in st.session_state:
+        start_job(key, name, func, *args, **kwargs)
+    return await_job(key, text)
@@ -0,0 +1,191 @@
+# 📁 utils/chunked_upload.py
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+import requests
+from . import api
+from .logger import setup_logger, log_event
+
+# Setup logger
+logger = setup_logger("chunked_upload")
+
+# Data smaller than this is held back and sent with the next call to send(),
+# so a stream of small frames does not become a stream of tiny requests
+MIN_CHUNK_BYTES = 32 * 1024
+
+# Attempts per chunk before the upload is marked failed, and the delay before
+# the first retry (doubled on each further retry)
+CHUNK_ATTEMPTS = 3
+CHUNK_RETRY_DELAY = 0.5
+
+_CLOSE = object()
+
+class ChunkedUploadSession:
+    """
+    Upload one answer as ordered chunks while it is still being recorded.
+
+    send() only buffers and queues data; a sender thread of its own posts the
+    chunks in order through utils.api, retrying each a few times. (It does
+    not use the shared job runner, where it would hold a worker for the
+    whole answer.) commit() waits for the queue to drain and asks the backend
+    to assemble the answer, so what is left to do after the candidate stops
+    is the last chunk and the commit call.
+
+    Usage:
+        upload = ChunkedUploadSession(question, email=email)
+        for frame in frames:
+            upload.send(frame)
+        result = upload.commit()
+
+    Args:
+        question: Question being answered
+        email: Candidate email, used to invalidate cached reads on commit
+        upload_id: Id for the upload, random by default
+        token: Signed upload token from utils.upload_token, if the backend requires one
+        filename: Filename of the assembled audio
+        content_type: Content type of the assembled audio
+        min_chunk_bytes: Smallest chunk sent before commit
+    """
+
+    def __init__(self, question: str, email: Optional[str] = None, upload_id: Optional[str] = None,
+                 token: Optional[str] = None, filename: str = "response.wav", content_type: str = "audio/wav",
+                 min_chunk_bytes: int = MIN_CHUNK_BYTES):
+        self.question = question
+        self.email = email
+        self.upload_id = upload_id or uuid.uuid4().hex
+        self.token = token
+        self.filename = filename
+        self.content_type = content_type
+        self.min_chunk_bytes = min_chunk_bytes
+        self.chunks_queued = 0
+        self.chunks_sent = 0
+        self.bytes_sent = 0
+        self.error: Optional[BaseException] = None
+        self._buffer = bytearray()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._sender: Optional[threading.Thread] = None
+
+    def send(self, data: bytes) -> None:
+        """
+        Add recorded data to the upload without waiting for the network.
+
+        Never raises for network errors; a failed chunk is reported by commit().
+
+        Args:
+            data: Next piece of the recording, in order
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Chunked upload {self.upload_id} is already closed")
+            self._buffer += data
+            if len(self._buffer) >= self.min_chunk_bytes:
+                self._queue_buffer()
+
+    def flush(self) -> None:
+        """Queue any buffered data as a chunk now, however small."""
+        with self._lock:
+            self._queue_buffer()
+
+    def _queue_buffer(self) -> None:
+        if not self._buffer:
+            return
+        self._queue.put((self.chunks_queued, bytes(self._buffer)))
+        self.chunks_queued += 1
+        self._buffer.clear()
+        if self._sender is None:
+            self._sender = threading.Thread(target=self._send_loop, name="chunked_upload", daemon=True)
+            self._sender.start()
+
+    @property
+    def pending(self) -> int:
+        """Chunks queued but not yet accepted by the backend."""
+        return self.chunks_queued - self.chunks_sent
+
+    def _send_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                return
+            if self.error is not None:
+                continue
+            sequence, data = item
+            try:
+                self._send_chunk(sequence, data)
+            except Exception as e:
+                self.error = e
+                logger.error("Chunk %d of upload %s failed: %s", sequence, self.upload_id, e)
+
+    def _send_chunk(self, sequence: int, data: bytes) -> None:
+        delay = CHUNK_RETRY_DELAY
+        for attempt in range(1, CHUNK_ATTEMPTS + 1):
+            try:
+                res = api.upload_audio_chunk(self.upload_id, sequence, data, token=self.token)
+                res.raise_for_status()
+                self.chunks_sent += 1
+                self.bytes_sent += len(data)
+                return
+            except requests.exceptions.RequestException as e:
+                refused = e.response is not None and e.response.status_code < 500
+                if refused or attempt == CHUNK_ATTEMPTS:
+                    raise
+                logger.warning("Chunk %d of upload %s failed (attempt %d), retrying: %s", sequence, self.upload_id, attempt, e)
+                time.sleep(delay)
+                delay *= 2
+
+    def _close(self, timeout: Optional[float]) -> None:
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue_buffer()
+                self._queue.put(_CLOSE)
+        if self._sender is not None:
+            self._sender.join(timeout)
+            if self._sender.is_alive():
+                raise TimeoutError(f"Chunks of upload {self.upload_id} were not sent within {timeout}s")
+
+    def commit(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send what is left, then have the backend assemble and submit the answer.
+
+        Args:
+            timeout: Seconds to wait for queued chunks, no limit by default
+
+        Returns:
+            Parsed commit response
+
+        Raises:
+            requests.exceptions.RequestException: If a chunk or the commit failed
+            TimeoutError: If queued chunks were not sent in time
+        """
+        started = time.time()
+        self._close(timeout)
+        if self.error is not None:
+            raise self.error
+        if self.chunks_queued == 0:
+            raise ValueError(f"Chunked upload {self.upload_id} has no data to commit")
+
+        drain_seconds = time.time() - started
+        res = api.commit_audio_upload(self.upload_id, self.question, self.chunks_queued, email=self.email,
+                                      filename=self.filename, content_type=self.content_type, token=self.token)
+        res.raise_for_status()
+        log_event(logger, "upload_committed", upload_id=self.upload_id, email=self.email,
+                  chunks=self.chunks_sent, upload_bytes=self.bytes_sent, drain_seconds=round(drain_seconds, 2),
+                  commit_seconds=round(time.time() - started - drain_seconds, 2))
+        return res.json()
+
+    def abort(self) -> None:
+        """Stop sending and ask the backend to discard the chunks already sent."""
+        with self._lock:
+            self._closed = True
+            self._buffer.clear()
+            self.error = self.error or RuntimeError("Upload aborted")
+            self._queue.put(_CLOSE)
+        try:
+            if self.chunks_queued:
+                api.abort_audio_upload(self.upload_id, token=self.token)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Could not abort upload %s: %s", self.upload_id, e)
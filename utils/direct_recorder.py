@@ -0,0 +1,59 @@
+# 📁 utils/direct_recorder.py
+import os
+from typing import Any, Dict, Optional
+import streamlit.components.v1 as components
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("direct_recorder")
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "direct_recorder")
+
+_direct_recorder = components.declare_component("direct_recorder", path=_FRONTEND_DIR)
+
+def direct_recorder(upload_url: str, token: str, upload_id: str, question: str,
+                    timeout: Optional[float] = None, chunk_url: Optional[str] = None, chunk_ms: int = 0,
+                    key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Record an answer in the browser and upload it straight to the backend.
+
+    The audio never passes through the Streamlit server: the browser posts it
+    to upload_url as multipart form data with upload_token, upload_id,
+    question and audio_file fields, and only the outcome comes back.
+
+    With chunk_url and chunk_ms the answer is instead sent while it is being
+    recorded, one chunk every chunk_ms, using the chunked upload protocol of
+    utils.api.upload_audio_chunk and commit_audio_upload.
+
+    Usage:
+        token, upload_id = create_upload_token(email, question)
+        result = direct_recorder(upload_url, token, upload_id, question, key="recorder_1")
+        if result and result["status"] == "uploaded":
+            ...
+
+    Args:
+        upload_url: Backend upload endpoint as reachable from the candidate's browser
+        token: Signed token from utils.upload_token.create_upload_token
+        upload_id: Upload id the token was issued for
+        question: Question being answered
+        timeout: Seconds the browser waits for the upload, no limit by default
+        chunk_url: Backend chunk upload endpoint as reachable from the browser
+        chunk_ms: Milliseconds of audio per chunk; 0 uploads the whole answer after stop
+        key: Streamlit widget key; keep it stable so the recorder is not remounted
+
+    Returns:
+        None until an upload finishes, then a dict with upload_id, status
+        ("uploaded" or "failed"), attempt (increments on every try), and
+        bytes or error
+    """
+    return _direct_recorder(
+        upload_url=upload_url,
+        token=token,
+        upload_id=upload_id,
+        question=question,
+        timeout_ms=int(timeout * 1000) if timeout else 0,
+        chunk_url=chunk_url,
+        chunk_ms=chunk_ms if chunk_url else 0,
+        key=key,
+        default=None,
+    )
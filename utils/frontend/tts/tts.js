@@ -0,0 +1,179 @@
+// Question text-to-speech component. Served as a static file so the browser
+// caches it once; each render only sends {text, rate, volume, play_id} and,
+// for server-synthesized audio, audio_url.
+//
+// Speaks args.text with the browser's speech synthesis whenever args.play_id
+// is new, or plays args.audio_url when it is given, and reports {play_id, state} back to Streamlit on start and end so
+// the page can show a speaking indicator without waiting on the server.
+(function () {
+    const VOICE_STORAGE_KEY = "tts_voice_name";
+    // Audio elements kept loaded while the frame lives, for instant repeats
+    const MAX_AUDIO_ELEMENTS = 3;
+    let lastPlayId = null;
+    let cachedVoice = null;
+    // One audio element per URL, kept loaded so a repeat starts at once
+    const audioElements = new Map();
+    let currentAudio = null;
+
+    function sendMessage(type, data) {
+        window.parent.postMessage(Object.assign({isStreamlitMessage: true, type: type}, data), "*");
+    }
+
+    function report(playId, state, error) {
+        const value = {play_id: playId, state: state};
+        if (error) {
+            value.error = error;
+        }
+        sendMessage("streamlit:setComponentValue", {value: value, dataType: "json"});
+    }
+
+    function storageGet(storage, key) {
+        try {
+            return storage.getItem(key);
+        } catch (err) {
+            // Storage can be blocked in sandboxed frames
+            return null;
+        }
+    }
+
+    function storageSet(storage, key, value) {
+        try {
+            storage.setItem(key, value);
+        } catch (err) {
+            // Nothing to remember then; the in-memory state still applies
+        }
+    }
+
+    // A remounted iframe gets the same play_id again; remember what was played
+    // for the browser session so a question is never repeated by accident
+    function alreadyPlayed(playId) {
+        if (storageGet(sessionStorage, "tts_played_" + playId)) {
+            return true;
+        }
+        storageSet(sessionStorage, "tts_played_" + playId, "1");
+        return false;
+    }
+
+    // getVoices() is empty until the browser has loaded its voice list, which
+    // it announces with voiceschanged. The chosen voice is kept for the life
+    // of the frame and its name in localStorage, so later visits pick the
+    // same voice without searching the list again.
+    function chooseVoice() {
+        const voices = window.speechSynthesis.getVoices();
+        if (!voices.length) {
+            return null;
+        }
+        const stored = storageGet(localStorage, VOICE_STORAGE_KEY);
+        let voice = stored ? voices.find(v => v.name === stored) : null;
+        if (!voice) {
+            voice = voices.find(v =>
+                v.lang.startsWith("en") && (v.name.includes("Google") || v.name.includes("Microsoft"))
+            ) || voices.find(v => v.lang.startsWith("en")) || null;
+            if (voice) {
+                storageSet(localStorage, VOICE_STORAGE_KEY, voice.name);
+            }
+        }
+        return voice;
+    }
+
+    function getVoice() {
+        if (!cachedVoice) {
+            cachedVoice = chooseVoice();
+        }
+        return cachedVoice;
+    }
+
+    function getAudio(url) {
+        let audio = audioElements.get(url);
+        if (!audio) {
+            audio = new Audio(url);
+            audio.preload = "auto";
+        } else {
+            audioElements.delete(url);
+        }
+        // Map order is least recently played first
+        audioElements.set(url, audio);
+        while (audioElements.size > MAX_AUDIO_ELEMENTS) {
+            const oldest = audioElements.keys().next().value;
+            audioElements.get(oldest).removeAttribute("src");
+            audioElements.delete(oldest);
+        }
+        return audio;
+    }
+
+    function stopAll() {
+        if ("speechSynthesis" in window) {
+            window.speechSynthesis.cancel();
+        }
+        if (currentAudio) {
+            currentAudio.onplaying = currentAudio.onended = currentAudio.onerror = null;
+            currentAudio.pause();
+            currentAudio = null;
+        }
+    }
+
+    function playAudio(args) {
+        const audio = getAudio(args.audio_url);
+        audio.volume = args.volume;
+        audio.currentTime = 0;
+        audio.onplaying = () => report(args.play_id, "speaking");
+        audio.onended = () => report(args.play_id, "done");
+        audio.onerror = () => report(args.play_id, "error", "Could not load " + args.audio_url);
+        currentAudio = audio;
+        audio.play().catch(err => report(args.play_id, "error", err.name));
+    }
+
+    function speak(args) {
+        stopAll();
+        if (args.audio_url) {
+            playAudio(args);
+            return;
+        }
+        if (!("speechSynthesis" in window)) {
+            report(args.play_id, "error", "Speech synthesis is not supported in this browser");
+            return;
+        }
+
+        const utterance = new SpeechSynthesisUtterance(args.text);
+        utterance.rate = args.rate;
+        utterance.volume = args.volume;
+        utterance.lang = "en-US";
+        const voice = getVoice();
+        if (voice) {
+            utterance.voice = voice;
+        }
+        utterance.onstart = () => report(args.play_id, "speaking");
+        utterance.onend = () => report(args.play_id, "done");
+        utterance.onerror = event => {
+            // "interrupted" and "canceled" mean a newer play took over
+            if (event.error !== "interrupted" && event.error !== "canceled") {
+                report(args.play_id, "error", event.error);
+            }
+        };
+        window.speechSynthesis.speak(utterance);
+    }
+
+    if ("speechSynthesis" in window) {
+        window.speechSynthesis.addEventListener("voiceschanged", () => {
+            cachedVoice = chooseVoice();
+        });
+        getVoice();
+    }
+
+    window.addEventListener("message", event => {
+        if (event.data.type !== "streamlit:render") {
+            return;
+        }
+        const args = event.data.args;
+        if (!args.play_id || args.play_id === lastPlayId) {
+            return;
+        }
+        lastPlayId = args.play_id;
+        if (!alreadyPlayed(args.play_id)) {
+            speak(args);
+        }
+    });
+
+    sendMessage("streamlit:componentReady", {apiVersion: 1});
+    sendMessage("streamlit:setFrameHeight", {height: 0});
+})();
@@ -1,12 +1,438 @@
+import atexit
+import copy
+import gzip
+import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
-from datetime import datetime
+import queue
+import random
+import shutil
+import sys
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
 
-from typing import Optional
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+# The one log file every logger writes to. It rolls over at midnight into
+# app.log.YYYY-MM-DD, which is gzipped in the background when
+# LOG_COMPRESS_ROTATED is set; LOG_BACKUP_DAYS rotated files are kept.
+LOG_DIR = "logs"
+LOG_FILENAME = "app.log"
+LOG_BACKUP_DAYS = 14
+LOG_COMPRESS_ROTATED = True
+
+# Format of the log file: "json" writes one JSON object per line, "text" the
+# one-line format the console also uses
+LOG_FILE_FORMAT = "json"
+
+# Records waiting for the listener thread. When the queue is full,
+# LOG_QUEUE_POLICY "drop" discards the record and counts it, and "block"
+# makes the logging call wait for room.
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_POLICY = "drop"
+
+# Rate limits for INFO and DEBUG records that repeat on every Streamlit rerun,
+# per logger. The same message (same template and arguments, or the same
+# event, action and email) passes at most "limit" times per "interval"
+# seconds, and then only with probability "sample" (default 1.0). "events"
+# lists the message templates, events or actions limited; all of the
+# logger's records if left out. WARNING and above always pass. How many
+# records were suppressed is logged once per interval, and at exit.
+LOG_EVENT_LIMITS: Dict[str, Dict[str, Any]] = {
+    "interview": {"limit": 1, "interval": 300, "events": (
+        "Interview page accessed by user: %s",
+        "Interview page accessed",
+    )},
+    "dashboard": {"limit": 1, "interval": 300, "events": (
+        "Dashboard accessed",
+        "Displaying profile sections for user: %s",
+        "Fetching interview history for user: %s",
+        "Found %s interviews for user: %s",
+        "No interviews found for user: %s",
+        "Dashboard page loaded successfully for user: %s",
+    )},
+    "final_feedback": {"limit": 1, "interval": 300, "events": (
+        "Final feedback page accessed by user: %s",
+        "Final feedback page accessed",
+        "Successfully loaded feedback for user: %s",
+        "Final feedback page completed successfully for user: %s",
+    )},
+    "feedback_view": {"limit": 1, "interval": 300, "events": (
+        "Feedback view accessed",
+        "Loading feedback for interview ID: %s, user: %s",
+        "Feedback view completed successfully for interview %s, user: %s",
+    )},
+    "existing_user": {"limit": 1, "interval": 300, "events": ("Existing user login page accessed",)},
+    "new_user": {"limit": 1, "interval": 300, "events": ("New user registration page accessed",)},
+}
+
+_SCALARS = (str, int, float, bool, type(None))
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, _SCALARS)
+
+def _args_values(args: Any) -> Iterable[Any]:
+    # A single mapping argument is passed as the mapping itself
+    return args.values() if isinstance(args, dict) else args
+
+def _snapshot(value: Any) -> Any:
+    """Copy of a mutable event field, or its text if it cannot be copied."""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return repr(value)
+
+class _BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that applies LOG_QUEUE_POLICY when the queue is full and counts dropped records."""
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", policy: str = LOG_QUEUE_POLICY):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self._unreported = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The base class formats the message here, on the thread that logged;
+        # the queue never leaves the process, so leave that to the listener
+        # unless an argument could change before the listener gets to it
+        msg = record.msg
+        if isinstance(msg, _Event):
+            if not all(_is_scalar(value) for value in msg.fields.values()):
+                record.msg = _Event(msg.event, {key: value if _is_scalar(value) else _snapshot(value)
+                                                for key, value in msg.fields.items()})
+        elif record.args and not all(_is_scalar(arg) for arg in _args_values(record.args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                self._unreported += 1
+            return
+        if self._unreported:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        # Once the queue has room again, say in the log how much is missing from it
+        with self._dropped_lock:
+            count, self._unreported = self._unreported, 0
+        if not count:
+            return
+        record = logging.LogRecord("logger", logging.WARNING, __file__, 0,
+                                   "Log queue was full, %d records dropped", (count,), None)
+        try:
+            self.queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            with self._dropped_lock:
+                self._unreported += count
+
+class _Event:
+    """Message of a structured event, rendered as text only when a text handler emits it."""
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: Dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        context = ", ".join(f"{key}={value}" for key, value in self.fields.items() if value is not None)
+        return f"{self.event} | {context}" if context else self.event
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Every object has time, level, logger, func and line. Records from
+    log_event() add event and their fields at the top level (the standard
+    keys win on a name clash); other records add message. exc holds the
+    traceback when there is one. Values JSON cannot encode are written with str().
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "line": record.lineno,
+        }
+        if isinstance(record.msg, _Event):
+            entry["event"] = record.msg.event
+            for key, value in record.msg.fields.items():
+                entry.setdefault(key, value)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class EventRateLimiter(logging.Filter):
+    """
+    Logger filter that rate limits and samples repeated INFO and DEBUG records.
+
+    Records are grouped by message key: the template and arguments of a
+    plain record, or the event, action and email of a log_event() record.
+    Each key passes at most limit times per interval seconds, then only with
+    probability sample. Once per interval, and at exit, a daemon thread logs
+    through the logger how many records of each message were suppressed, so
+    a burst is reported even when nothing is logged after it.
+
+    Usage:
+        EventRateLimiter.install(logger, limit=1, interval=300)
+
+    Args:
+        logger: Logger the filter is installed on, used for the summaries
+        limit: Records per key per interval
+        interval: Window length in seconds
+        sample: Probability that a record within the limit is kept
+        events: Templates, event names or actions to limit; all if None
+    """
+
+    def __init__(self, logger: logging.Logger, limit: int = 1, interval: float = 60.0, sample: float = 1.0,
+                 events: Optional[Iterable[str]] = None):
+        super().__init__()
+        self.logger = logger
+        self.limit = limit
+        self.interval = interval
+        self.sample = sample
+        self.events = frozenset(events) if events is not None else None
+        self.config = {"limit": limit, "interval": interval, "sample": sample, "events": self.events}
+        self._lock = threading.Lock()
+        # key -> [window start, records passed in the window]
+        self._windows: Dict[Hashable, List[Any]] = {}
+        self._suppressed: Dict[str, int] = {}
+        self._next_summary = time.monotonic() + interval
+
+    @classmethod
+    def install(cls, logger: logging.Logger, **limits: Any) -> "EventRateLimiter":
+        """
+        Add a rate limiter to the logger, once.
+
+        Pages call setup_logger() on every Streamlit rerun; a limiter already
+        installed with the same limits is kept along with its windows and
+        counts, and one with different limits is flushed and replaced.
+        """
+        limiter = cls(logger, **limits)
+        for existing in list(logger.filters):
+            if type(existing).__name__ == cls.__name__:
+                if getattr(existing, "config", None) == limiter.config:
+                    return existing
+                logger.removeFilter(existing)
+                _limiters.discard(existing)
+                if hasattr(existing, "flush"):
+                    existing.flush()
+        logger.addFilter(limiter)
+        _start_summary_thread(limiter)
+        return limiter
+
+    def next_summary(self) -> float:
+        """time.monotonic() at which the suppressed counts are next due."""
+        with self._lock:
+            return self._next_summary
+
+    @staticmethod
+    def _name(record: logging.LogRecord) -> str:
+        msg = record.msg
+        if isinstance(msg, _Event):
+            return msg.fields.get("action") or msg.event
+        return str(msg)
+
+    @staticmethod
+    def _key(record: logging.LogRecord) -> Hashable:
+        msg = record.msg
+        if isinstance(msg, _Event):
+            return (msg.event, msg.fields.get("action"), msg.fields.get("email"))
+        key = (msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            key = (msg,)
+        return key
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or getattr(record, "rate_limit_summary", False):
+            return True
+        name = self._name(record)
+        if self.events is not None and name not in self.events:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(self._key(record))
+            if window is None or now - window[0] >= self.interval:
+                window = [now, 0]
+                self._windows[self._key(record)] = window
+            passed = window[1] < self.limit and (self.sample >= 1.0 or random.random() < self.sample)
+            if passed:
+                window[1] += 1
+            else:
+                self._suppressed[name] = self._suppressed.get(name, 0) + 1
+        return passed
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """Log the suppressed counts now and forget expired windows."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            suppressed, self._suppressed = self._suppressed, {}
+            self._next_summary = now + self.interval
+            self._windows = {key: window for key, window in self._windows.items()
+                             if now - window[0] < self.interval}
+        for name, count in suppressed.items():
+            record = self.logger.makeRecord(self.logger.name, logging.INFO, __file__, 0,
+                                            "Suppressed %d similar events in the last %gs: %s",
+                                            (count, self.interval, name), None, func="flush")
+            record.rate_limit_summary = True
+            self.logger.handle(record)
+
+# Installed rate limiters, flushed by the summary thread when due and at exit
+_limiters: "weakref.WeakSet[EventRateLimiter]" = weakref.WeakSet()
+_limiters_changed = threading.Event()
+_summary_thread: Optional[threading.Thread] = None
+_summary_lock = threading.Lock()
+
+def _flush_limiters() -> None:
+    for limiter in list(_limiters):
+        limiter.flush()
+
+def _summarize_limiters() -> None:
+    """Summary thread: flush each rate limiter when its interval is up."""
+    while True:
+        now = time.monotonic()
+        limiters = list(_limiters)
+        for limiter in limiters:
+            if limiter.next_summary() <= now:
+                limiter.flush(now)
+        wait = min((limiter.next_summary() for limiter in limiters), default=60.0) - time.monotonic()
+        del limiters
+        _limiters_changed.wait(max(wait, 0.05))
+        _limiters_changed.clear()
+
+def _start_summary_thread(limiter: EventRateLimiter) -> None:
+    global _summary_thread
+    with _summary_lock:
+        _limiters.add(limiter)
+        if _summary_thread is None:
+            _summary_thread = threading.Thread(target=_summarize_limiters, name="log_rate_summaries", daemon=True)
+            _summary_thread.start()
+            # Registered after the listener's stop, so it runs first and the
+            # summaries still reach the log file
+            atexit.register(_flush_limiters)
+    _limiters_changed.set()
+
+# Name of the root handler feeding the listener; a reloaded module finds the
+# sink installed by its previous incarnation by this name
+_SINK_NAME = "app_sink"
+
+_queue_handler: Optional[_BoundedQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+def _gzip_file(path: str) -> None:
+    try:
+        with open(path, "rb") as source, gzip.open(f"{path}.gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(path)
+    except OSError as e:
+        # Logging here could rotate again; the file is still there uncompressed
+        sys.stderr.write(f"Could not compress rotated log {path}: {e}\n")
+
+def _rotate_and_compress(source: str, dest: str) -> None:
+    """Rotator for the log file: rename now, compress on a thread of its own so the listener never waits."""
+    os.rename(source, dest)
+    threading.Thread(target=_gzip_file, args=(dest,), name="log_gzip", daemon=True).start()
+
+def _get_queue_handler() -> _BoundedQueueHandler:
+    """
+    Return the root sink, installing it and starting the listener thread on first use.
+
+    The sink is a queue handler on the root logger; the listener owns the
+    file and console handlers, so disk and console writes happen on its
+    thread and never on the thread that logged.
+    """
+    global _queue_handler, _listener
+    if _queue_handler is None:
+        with _listener_lock:
+            if _queue_handler is None:
+                root = logging.getLogger()
+                for handler in root.handlers:
+                    if handler.get_name() == _SINK_NAME:
+                        _queue_handler = handler
+                        return _queue_handler
+
+                # Create logs directory if it doesn't exist
+                if not os.path.exists(LOG_DIR):
+                    os.makedirs(LOG_DIR)
+                
+                # File handler, rolled over at midnight
+                file_handler = logging.handlers.TimedRotatingFileHandler(
+                    os.path.join(LOG_DIR, LOG_FILENAME), when="midnight", backupCount=LOG_BACKUP_DAYS,
+                    encoding="utf-8",
+                )
+                file_handler.setLevel(logging.INFO)
+                if LOG_COMPRESS_ROTATED:
+                    file_handler.rotator = _rotate_and_compress
+                
+                # Console handler
+                console_handler = logging.StreamHandler()
+                console_handler.setLevel(logging.WARNING)
+                
+                # Formatter
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+                )
+                file_handler.setFormatter(JsonFormatter() if LOG_FILE_FORMAT == "json" else formatter)
+                console_handler.setFormatter(formatter)
+                
+                log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+                _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                                           respect_handler_level=True)
+                _listener.start()
+                # Write out what is still queued when the process exits
+                atexit.register(_listener.stop)
+                _queue_handler = _BoundedQueueHandler(log_queue)
+                _queue_handler.set_name(_SINK_NAME)
+                root.addHandler(_queue_handler)
+    return _queue_handler
+
+def _install_worker_sink() -> None:
+    """
+    Root sink for worker processes, e.g. the speech synthesis workers.
+
+    Only the app process may open and rotate the log file, so workers log
+    warnings and errors to stderr, which the app process's console shows.
+    """
+    root = logging.getLogger()
+    if any(handler.get_name() == _SINK_NAME for handler in root.handlers):
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setLevel(logging.WARNING)
+    handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+    ))
+    handler.set_name(_SINK_NAME)
+    root.addHandler(handler)
 
 def setup_logger(name: str = "streamlit_app") -> logging.Logger:
     """
-    Set up a logger with file and console handlers.
+    Set up a logger that writes to the log file and console without blocking.
+    
+    The logger has no handlers of its own and propagates to the root sink:
+    one bounded in-memory queue read by a listener thread that owns the
+    rotating log file and the console. In a worker process the sink is
+    stderr instead. Loggers listed in LOG_EVENT_LIMITS get an EventRateLimiter.
     
     Args:
         name: Logger name
@@ -14,44 +440,41 @@ def setup_logger(name: str = "streamlit_app") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    if multiprocessing.parent_process() is not None:
+        _install_worker_sink()
+    else:
+        _get_queue_handler()
     logger = logging.getLogger(name)
-    
-    # Avoid adding handlers multiple times
-    if logger.handlers:
-        return logger
-    
     logger.setLevel(logging.INFO)
-    
-    # Create logs directory if it doesn't exist
-    logs_dir = "logs"
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
-    
-    # File handler
-    log_filename = f"{logs_dir}/app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_filename)
-    file_handler.setLevel(logging.INFO)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.propagate = True
+    if name in LOG_EVENT_LIMITS:
+        EventRateLimiter.install(logger, **LOG_EVENT_LIMITS[name])
     
     return logger
 
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """
+    Log a structured event.
+
+    Nothing is formatted unless the level is enabled, and then only when the
+    listener writes the record: the log file gets the fields as JSON keys,
+    the console gets "event | key=value, ...".
+
+    Usage:
+        log_event(logger, "answer_uploaded", email=email, upload_bytes=size, seconds=elapsed)
+
+    Args:
+        logger: Logger instance
+        event: Event name, snake_case
+        level: Logging level
+        **fields: Event fields; None values are left out of the text form
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, _Event(event, fields), stacklevel=2)
+
 def log_user_action(logger: logging.Logger, action: str, email: Optional[str] = None, **kwargs):
     """
-    Log user actions with consistent format.
+    Log a user action as a "user_action" event.
     
     Args:
         logger: Logger instance
@@ -59,20 +482,12 @@ def log_user_action(logger: logging.Logger, action: str, email: Optional[str] =
         email: User email (optional)
         **kwargs: Additional context
     """
-    context = f"email={email}" if email else ""
-    if kwargs:
-        extra_context = ", ".join([f"{k}={v}" for k, v in kwargs.items()])
-        context = f"{context}, {extra_context}" if context else extra_context
-    
-    log_message = f"User action: {action}"
-    if context:
-        log_message += f" | Context: {context}"
-    
-    logger.info(log_message)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_Event("user_action", {"action": action, "email": email, **kwargs}), stacklevel=2)
 
 def log_api_call(logger: logging.Logger, endpoint: str, email: Optional[str] = None, success: bool = True, error_msg: Optional[str] = None):
     """
-    Log API calls with consistent format.
+    Log an API call as an "api_call" event, at ERROR level if it failed.
     
     Args:
         logger: Logger instance
@@ -81,16 +496,7 @@ def log_api_call(logger: logging.Logger, endpoint: str, email: Optional[str] = N
         success: Whether the call was successful
         error_msg: Error message if failed
     """
-    status = "SUCCESS" if success else "FAILED"
-    log_message = f"API call {status}: {endpoint}"
-    
-    if email:
-        log_message += f" | User: {email}"
-    
-    if not success and error_msg:
-        log_message += f" | Error: {error_msg}"
-    
-    if success:
-        logger.info(log_message)
-    else:
-        logger.error(log_message)
+    level = logging.INFO if success else logging.ERROR
+    if logger.isEnabledFor(level):
+        logger.log(level, _Event("api_call", {"endpoint": endpoint, "email": email, "success": success,
+                                              "error": error_msg}), stacklevel=2)
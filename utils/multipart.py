@@ -0,0 +1,124 @@
+# 📁 utils/multipart.py
+import io
+import uuid
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Bytes read from a file part per chunk sent
+CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+class MultipartStream:
+    """
+    multipart/form-data request body that is produced chunk by chunk.
+
+    File parts are read from their buffer or spool file CHUNK_SIZE bytes at a
+    time, so peak memory per upload stays flat instead of holding a second
+    full copy of the body. Pass the instance as ``data=`` to requests; with no
+    length it is sent with chunked transfer encoding.
+
+    Usage:
+        body = MultipartStream({
+            "question": (None, "Tell me about yourself"),
+            "audio_file": ("response.wav", open("response.wav", "rb"), "audio/wav"),
+        })
+        session.post(url, data=body, headers={"Content-Type": body.content_type})
+
+    Args:
+        fields: Mapping in the same shape as requests' ``files=``: a plain field is
+            ``(None, value)``, a file is ``(filename, bytes or file object, content_type)``
+        chunk_size: Bytes read from file parts per chunk
+        progress: Called as progress(bytes_sent, total_bytes) after each chunk;
+            total_bytes is None when a part's size cannot be determined
+        boundary: Multipart boundary, random by default
+    """
+
+    def __init__(self, fields: Dict[str, Tuple[Any, ...]], chunk_size: int = CHUNK_SIZE,
+                 progress: Optional[ProgressCallback] = None, boundary: Optional[str] = None):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts: List[Tuple[bytes, Union[bytes, BinaryIO]]] = []
+        for name, spec in fields.items():
+            filename, value = spec[0], spec[1]
+            content_type = spec[2] if len(spec) > 2 else None
+            self._add_part(name, value, filename, content_type)
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value, including the boundary."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _add_part(self, name: str, value: Any, filename: Optional[str], content_type: Optional[str]) -> None:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        header += "\r\n"
+
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            # BytesIO shares the buffer of an immutable bytes object, no copy is made
+            value = io.BytesIO(value)
+        self._parts.append((header.encode("utf-8"), value))
+
+    def total_size(self) -> Optional[int]:
+        """Total body size in bytes, or None if a file part's size is unknown."""
+        total = len(self._closing_boundary())
+        for header, value in self._parts:
+            total += len(header) + 2
+            if isinstance(value, bytes):
+                total += len(value)
+            else:
+                size = _remaining_size(value)
+                if size is None:
+                    return None
+                total += size
+        return total
+
+    def _closing_boundary(self) -> bytes:
+        return f"--{self.boundary}--\r\n".encode("utf-8")
+
+    def __iter__(self) -> Iterator[bytes]:
+        total = self.total_size() if self.progress else None
+        sent = 0
+        for header, value in self._parts:
+            if isinstance(value, bytes):
+                chunk = header + value + b"\r\n"
+                sent += len(chunk)
+                yield chunk
+            else:
+                yield header
+                sent += len(header)
+                while True:
+                    chunk = value.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    sent += len(chunk)
+                    yield chunk
+                    if self.progress:
+                        self.progress(sent, total)
+                yield b"\r\n"
+                sent += 2
+        closing = self._closing_boundary()
+        sent += len(closing)
+        yield closing
+        if self.progress:
+            self.progress(sent, total)
+
+def _quote(value: str) -> str:
+    """Escape a name or filename for a Content-Disposition header."""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+def _remaining_size(fileobj: BinaryIO) -> Optional[int]:
+    """Bytes left to read from a seekable file object, or None if unknown."""
+    try:
+        position = fileobj.tell()
+        end = fileobj.seek(0, io.SEEK_END)
+        fileobj.seek(position)
+        return end - position
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
@@ -0,0 +1,454 @@
+# 📁 utils/speech_synthesis.py
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from typing import Any, Optional
+import numpy as np
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("speech_synthesis")
+
+# Directory the TTS component is served from, outside the source tree.
+# utils.text_to_speech_util copies the component's files here, and
+# synthesized audio is cached in its audio/ subdirectory, so Streamlit serves
+# both and the browser fetches the audio by relative URL like any other asset.
+TTS_COMPONENT_DIR = os.environ.get("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "interview_tts"))
+TTS_AUDIO_SUBDIR = "audio"
+TTS_CACHE_DIR = os.path.join(TTS_COMPONENT_DIR, TTS_AUDIO_SUBDIR)
+
+# Total size of cached audio before the least recently played files are removed
+TTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds to wait for one question to be synthesized before giving up on the worker
+TTS_SYNTHESIS_TIMEOUT = 30
+
+# pyttsx3 speech rate in words per minute
+DEFAULT_TTS_RATE = 175
+
+# Warm engine processes shared by every session, and requests allowed to wait
+# for one of them; requests beyond that are dropped with SynthesisOverloaded
+TTS_WORKERS = 2
+TTS_MAX_QUEUED = 8
+
+def audio_cache_key(text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE) -> str:
+    """Content address of the audio for (text, voice, rate)."""
+    return hashlib.sha256(json.dumps([text, voice, rate]).encode("utf-8")).hexdigest()
+
+class AudioCache:
+    """
+    Bounded LRU cache of synthesized audio files on disk, shared by every
+    session and kept across restarts.
+
+    Files are named by audio_cache_key(), so identical questions share one
+    file. A hit refreshes the file's modification time, and put() removes
+    the files with the oldest times once the directory exceeds max_bytes.
+
+    Args:
+        directory: Cache directory, created if missing
+        max_bytes: Total size of cached files to keep
+    """
+
+    def __init__(self, directory: str = TTS_CACHE_DIR, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def filename(self, key: str) -> str:
+        return f"{key}.wav"
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, self.filename(key))
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached file's path and mark it recently used, or None."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> str:
+        """
+        Store audio under key, then evict least recently used files over max_bytes.
+
+        Returns:
+            Path of the cached file
+        """
+        path = self.path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # Readers only ever see complete files
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def evict(self) -> None:
+        """Remove the least recently used files until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".wav"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
+
+def aiff_to_wav(data: bytes) -> bytes:
+    """
+    Convert uncompressed AIFF or AIFF-C audio to WAV.
+
+    pyttsx3's macOS driver (NSSpeechSynthesizer) writes AIFF whatever the
+    file is named; the other drivers write WAV. The cache and the browser
+    only ever get WAV.
+
+    Args:
+        data: AIFF bytes
+
+    Returns:
+        WAV bytes with the same samples
+
+    Raises:
+        ValueError: If the data is not uncompressed AIFF
+    """
+    if len(data) < 12 or data[:4] != b"FORM" or data[8:12] not in (b"AIFF", b"AIFC"):
+        raise ValueError("Not AIFF audio")
+    channels = width = rate = None
+    little_endian = False
+    samples = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id, size = data[offset:offset + 4], struct.unpack(">I", data[offset + 4:offset + 8])[0]
+        body = data[offset + 8:offset + 8 + size]
+        if chunk_id == b"COMM":
+            channels, _, bits = struct.unpack(">hIh", body[:8])
+            width = (bits + 7) // 8
+            exponent, mantissa = struct.unpack(">HQ", body[8:18])
+            rate = round(mantissa * 2.0 ** ((exponent & 0x7FFF) - 16383 - 63))
+            if data[8:12] == b"AIFC":
+                compression = body[18:22]
+                if compression not in (b"NONE", b"sowt"):
+                    raise ValueError(f"Compressed AIFF-C audio is not supported: {compression!r}")
+                little_endian = compression == b"sowt"
+        elif chunk_id == b"SSND":
+            skip = struct.unpack(">I", body[:4])[0]
+            samples = body[8 + skip:]
+        # Chunks are padded to an even length
+        offset += 8 + size + (size & 1)
+    if channels is None or samples is None:
+        raise ValueError("AIFF audio is missing its COMM or SSND chunk")
+
+    frames = np.frombuffer(samples[:len(samples) - len(samples) % width], dtype=np.uint8).reshape(-1, width)
+    if width == 1:
+        # AIFF 8-bit samples are signed, WAV 8-bit samples unsigned
+        frames = frames + np.uint8(128)
+    elif not little_endian:
+        frames = frames[:, ::-1]
+    output = io.BytesIO()
+    with wave.open(output, "wb") as target:
+        target.setnchannels(channels)
+        target.setsampwidth(width)
+        target.setframerate(rate)
+        target.writeframes(frames.tobytes())
+    return output.getvalue()
+
+class SynthesisOverloaded(RuntimeError):
+    """Raised when TTS_MAX_QUEUED requests are already waiting for a worker."""
+
+def _synthesis_worker(conn: Any) -> None:
+    """Worker process loop: keep one pyttsx3 engine and synthesize requests into files."""
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+        default_voice = engine.getProperty("voice")
+    except Exception as e:
+        conn.send(f"{type(e).__name__}: {e}")
+        return
+    # Tell the parent the engine is initialised
+    conn.send(None)
+    while True:
+        request = conn.recv()
+        if request is None:
+            return
+        text, voice, rate, path = request
+        try:
+            engine.setProperty("voice", voice or default_voice)
+            engine.setProperty("rate", rate)
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            conn.send(None)
+        except Exception as e:
+            conn.send(f"{type(e).__name__}: {e}")
+
+class SynthesisWorker:
+    """
+    One pyttsx3 engine in a process of its own.
+
+    pyttsx3 drives a platform speech engine that is slow to initialise and
+    not safe to share between threads, so each engine lives in a separate
+    process and handles one request at a time. start() launches it without
+    waiting; the engine initialises in the background and the first
+    request waits only for whatever is left of that. A request that exceeds
+    its timeout kills the process; the next request starts a fresh one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Any = None
+        self._ready = False
+
+    def start(self) -> None:
+        """Launch the worker process if it is not running."""
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._stop()
+                self._start()
+
+    def _start(self) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_synthesis_worker, args=(child_conn,),
+                                        name="speech_synthesis", daemon=True)
+        self._process.start()
+        child_conn.close()
+        logger.info("Speech synthesis worker started (pid %s)", self._process.pid)
+
+    def _stop(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+        self._ready = False
+
+    def _receive(self, deadline: float) -> Any:
+        # Called with the lock held
+        if not self._conn.poll(max(deadline - time.monotonic(), 0)):
+            self._stop()
+            raise TimeoutError("Speech synthesis worker did not answer in time")
+        return self._conn.recv()
+
+    def synthesize(self, text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE,
+                   timeout: float = TTS_SYNTHESIS_TIMEOUT) -> bytes:
+        """
+        Synthesize text to WAV audio.
+
+        Args:
+            text: Text to speak
+            voice: pyttsx3 voice id, the engine's default if None
+            rate: Speech rate in words per minute
+            timeout: Seconds to wait for the worker
+
+        Returns:
+            WAV bytes
+
+        Raises:
+            TimeoutError: If the worker did not answer in time
+            RuntimeError: If the engine failed or the worker died
+        """
+        deadline = time.monotonic() + timeout
+        path = os.path.join(tempfile.gettempdir(), f"tts_{uuid.uuid4().hex}.wav")
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._stop()
+                self._start()
+            try:
+                if not self._ready:
+                    error = self._receive(deadline)
+                    if error:
+                        self._stop()
+                        raise RuntimeError(f"Speech engine failed to start: {error}")
+                    self._ready = True
+                self._conn.send((text, voice, rate, path))
+                error = self._receive(deadline)
+            except (EOFError, OSError) as e:
+                self._stop()
+                raise RuntimeError(f"Speech synthesis worker died: {str(e)}")
+        try:
+            if error:
+                raise RuntimeError(f"Speech synthesis failed: {error}")
+            with open(path, "rb") as f:
+                data = f.read()
+            return aiff_to_wav(data) if data[:4] == b"FORM" else data
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            if self._conn is not None and self._process is not None and self._process.is_alive():
+                try:
+                    self._conn.send(None)
+                    self._process.join(1)
+                except OSError:
+                    pass
+            self._stop()
+
+class SynthesisPool:
+    """
+    Warm pyttsx3 engines shared by every session, with a bounded wait queue.
+
+    Every worker process is started when the pool is created, so engines
+    are initialised before the first question needs them. Requests beyond
+    the idle workers wait for one, up to max_queued of them; further
+    requests are dropped with SynthesisOverloaded instead of piling up
+    behind slow syntheses.
+
+    Args:
+        workers: Engine processes
+        max_queued: Requests allowed to wait for a worker
+    """
+
+    def __init__(self, workers: int = TTS_WORKERS, max_queued: int = TTS_MAX_QUEUED):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pending = 0  # waiting or running
+        self._idle: "queue.Queue[SynthesisWorker]" = queue.Queue()
+        for _ in range(workers):
+            worker = SynthesisWorker()
+            worker.start()
+            self._idle.put(worker)
+        logger.info("Speech synthesis pool started with %d workers, %d queued requests max", workers, max_queued)
+
+    def synthesize(self, text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE,
+                   timeout: float = TTS_SYNTHESIS_TIMEOUT) -> bytes:
+        """
+        Synthesize text to WAV audio on the next free worker.
+
+        Args:
+            text: Text to speak
+            voice: pyttsx3 voice id, the engine's default if None
+            rate: Speech rate in words per minute
+            timeout: Seconds to wait in total, queueing included
+
+        Returns:
+            WAV bytes
+
+        Raises:
+            SynthesisOverloaded: If max_queued requests are already waiting
+            TimeoutError: If no worker finished the request in time
+            RuntimeError: If the engine failed
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queued:
+                self.dropped += 1
+                logger.warning("Dropping speech synthesis request: %d already pending", self._pending)
+                raise SynthesisOverloaded(f"{self._pending} speech synthesis requests are already pending")
+            self._pending += 1
+        try:
+            deadline = time.monotonic() + timeout
+            try:
+                worker = self._idle.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No speech synthesis worker was free within {timeout}s")
+            try:
+                return worker.synthesize(text, voice, rate, max(deadline - time.monotonic(), 0))
+            finally:
+                self._idle.put(worker)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def close(self) -> None:
+        """Stop the idle workers; busy ones are left to finish and exit with the process."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+_cache: Optional[AudioCache] = None
+_pool: Optional[SynthesisPool] = None
+_init_lock = threading.Lock()
+
+def get_audio_cache() -> AudioCache:
+    """Return the process-wide audio cache."""
+    global _cache
+    if _cache is None:
+        with _init_lock:
+            if _cache is None:
+                _cache = AudioCache()
+    return _cache
+
+def get_synthesis_pool() -> SynthesisPool:
+    """
+    Return the process-wide synthesis pool, starting its workers on first use.
+
+    Call this early, e.g. when an interview starts, so the engines are warm
+    by the time the first question is synthesized.
+
+    Returns:
+        Shared SynthesisPool instance
+    """
+    global _pool
+    if _pool is None:
+        with _init_lock:
+            if _pool is None:
+                _pool = SynthesisPool()
+    return _pool
+
+def synthesize(text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE,
+               timeout: float = TTS_SYNTHESIS_TIMEOUT) -> bytes:
+    """Synthesize text to WAV bytes on the shared pool; see SynthesisPool.synthesize()."""
+    return get_synthesis_pool().synthesize(text, voice, rate, timeout)
+
+def cached_question_audio(text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE) -> Optional[str]:
+    """Return the URL of the question's audio if it is already cached, without synthesizing."""
+    cache = get_audio_cache()
+    key = audio_cache_key(text, voice, rate)
+    if cache.get(key) is None:
+        return None
+    return f"{TTS_AUDIO_SUBDIR}/{cache.filename(key)}"
+
+def synthesize_question(text: str, voice: Optional[str] = None, rate: int = DEFAULT_TTS_RATE) -> str:
+    """
+    Return the URL of the question's audio, synthesizing it only on a cache miss.
+
+    Usage:
+        audio_url = synthesize_question("Tell me about yourself")
+        speak_question("Tell me about yourself", audio_url=audio_url)
+
+    Args:
+        text: Question text
+        voice: pyttsx3 voice id, the engine's default if None
+        rate: Speech rate in words per minute
+
+    Returns:
+        URL relative to the TTS component, e.g. "audio/<hash>.wav"
+
+    Raises:
+        SynthesisOverloaded: If the pool is dropping requests
+        TimeoutError, RuntimeError: If synthesis failed
+    """
+    cache = get_audio_cache()
+    key = audio_cache_key(text, voice, rate)
+    if cache.get(key) is None:
+        data = synthesize(text, voice, rate)
+        cache.put(key, data)
+        logger.info("Synthesized question audio %s: %d chars, %d bytes", key[:12], len(text), len(data))
+    return f"{TTS_AUDIO_SUBDIR}/{cache.filename(key)}"
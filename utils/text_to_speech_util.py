@@ -1,132 +1,106 @@
+import hashlib
+import os
+import shutil
+import uuid
+from typing import Any, Dict, Optional
 import streamlit as st
 import streamlit.components.v1 as components
-import time
-import uuid
+from .speech_synthesis import TTS_COMPONENT_DIR
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "tts")
+
+def _install_component(target_dir: str = TTS_COMPONENT_DIR) -> str:
+    """Copy the component's files to the directory it is served from, next to the audio cache."""
+    os.makedirs(target_dir, exist_ok=True)
+    for name in os.listdir(_FRONTEND_DIR):
+        source = os.path.join(_FRONTEND_DIR, name)
+        target = os.path.join(target_dir, name)
+        if not os.path.isfile(source):
+            continue
+        with open(source, "rb") as f:
+            data = f.read()
+        if os.path.exists(target):
+            with open(target, "rb") as f:
+                if f.read() == data:
+                    continue
+        shutil.copyfile(source, target)
+    return target_dir
+
+_tts = components.declare_component("tts", path=_install_component())
+
+def replay_question(key: str = "tts") -> None:
+    """
+    Have the speak_question() component with this key speak its question again.
+
+    Usable as a button on_click callback, so the new play reaches the
+    component in the same rerun as the click.
+
+    Args:
+        key (str): Key the question was rendered with
+    """
+    st.session_state[f"{key}_play_id"] = uuid.uuid4().hex
 
 def speak_question(question: str, 
                   voice_rate: float = 1.0, 
                   voice_volume: float = 0.9,
-                  display_duration: int = 3,
                   show_repeat_button: bool = True,
-                  auto_speak: bool = True) -> None:
+                  auto_speak: bool = True,
+                  key: str = "tts",
+                  audio_url: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
-    Display a question in Streamlit and speak it using browser-based text-to-speech.
+    Speak a question using browser-based text-to-speech.
     Works in Streamlit Cloud and other web deployments.
+
+    The browser reports when speech starts and ends, and the speaking
+    indicator follows those events, so the script run never waits for the
+    question to be read out. Render this on every run with the same key;
+    each play is spoken once, however often the page reruns.
+
+    The component's script is a static file the browser caches, so each
+    render sends only the text, rate, volume and play id. The frame itself is
+    recreated whenever a run does not render the component, e.g. while an
+    answer uploads; that is cheap with the script cached, and the play id
+    keeps a remounted frame from speaking again.
+
+    With audio_url the component plays that file instead of using the
+    browser's voices, e.g. audio from utils.speech_synthesis.synthesize_question.
+    Each file is loaded once per frame, so repeats play from memory.
     
     Usage:
         speak_question("What is your name?")
-        speak_question("How are you?", voice_rate=0.8, voice_volume=0.9)
+        speak_question("How are you?", voice_rate=0.8, voice_volume=0.9, key="tts_2")
     
     Args:
-        question (str): The question text to display and speak
+        question (str): The question text to speak
         voice_rate (float): Speech rate (0.1 to 10, default: 1.0)
         voice_volume (float): Voice volume (0.0 to 1.0, default: 0.9)
-        display_duration (int): How long to show speaking indicator (default: 3)
         show_repeat_button (bool): Whether to show the repeat button (default: True)
-        auto_speak (bool): Whether to automatically speak on load (default: True)
-    """
-    
-    # Sanitize the question text for JavaScript
-    clean_question = question.replace('"', '\\"').replace("'", "\\'").replace('\n', ' ')
-    
-    # Generate unique ID for this instance
-    component_id = f"tts_{uuid.uuid4().hex[:8]}"
-    
-    # Create the HTML/JavaScript component for browser TTS
-    tts_html = f"""
-    <div id="{component_id}" style="margin: 10px 0;">
-        <script>
-        (function() {{
-            let isCurrentlySpeaking = false;
-            
-            function speakText(text, rate, volume) {{
-                // Stop any current speech
-                if (window.speechSynthesis.speaking) {{
-                    window.speechSynthesis.cancel();
-                }}
-                
-                // Check if speech synthesis is supported
-                if (!('speechSynthesis' in window)) {{
-                    console.warn('Speech Synthesis not supported in this browser');
-                    return;
-                }}
-                
-                const utterance = new SpeechSynthesisUtterance(text);
-                utterance.rate = rate;
-                utterance.volume = volume;
-                utterance.lang = 'en-US';
-                
-                // Try to use a more natural voice if available
-                const voices = window.speechSynthesis.getVoices();
-                if (voices.length > 0) {{
-                    // Prefer English voices
-                    const englishVoice = voices.find(voice => 
-                        voice.lang.startsWith('en') && 
-                        (voice.name.includes('Google') || voice.name.includes('Microsoft'))
-                    );
-                    if (englishVoice) {{
-                        utterance.voice = englishVoice;
-                    }}
-                }}
-                
-                utterance.onstart = function() {{
-                    isCurrentlySpeaking = true;
-                    console.log('Speech started');
-                }};
-                
-                utterance.onend = function() {{
-                    isCurrentlySpeaking = false;
-                    console.log('Speech ended');
-                }};
-                
-                utterance.onerror = function(event) {{
-                    isCurrentlySpeaking = false;
-                    console.error('Speech error:', event.error);
-                }};
-                
-                window.speechSynthesis.speak(utterance);
-            }}
-            
-            // Auto-speak when component loads
-            {"speakText('" + clean_question + "', " + str(voice_rate) + ", " + str(voice_volume) + ");" if auto_speak else ""}
-            
-            // Make speak function globally available for repeat button
-            window.speakQuestion_{component_id} = function() {{
-                speakText('{clean_question}', {voice_rate}, {voice_volume});
-            }};
-        }})();
-        </script>
-    </div>
+        auto_speak (bool): Whether to speak the question when it is first rendered under
+            this key, including each time the question changes (default: True)
+        key (str): Component key, kept the same across questions (default: "tts")
+        audio_url (str): Audio of the question to play instead of browser speech
+
+    Returns:
+        Latest state reported by the browser, {"play_id", "state"} with state
+        "speaking", "done" or "error", or None before speech has started
     """
-    
-    # Render the TTS component
-    components.html(tts_html, height=0)
-    
-    # Show speaking indicator
-    if auto_speak:
-        with st.spinner('🔊 Speaking...'):
-            time.sleep(display_duration)
-    
+    play_key = f"{key}_play_id"
+    text_key = f"{key}_text_hash"
+    text_hash = hashlib.sha1(question.encode("utf-8")).hexdigest()
+    if auto_speak and st.session_state.get(text_key) != text_hash:
+        replay_question(key)
+    st.session_state[text_key] = text_hash
+    play_id = st.session_state.get(play_key)
+
+    status = _tts(text=question.replace('\n', ' '), rate=voice_rate, volume=voice_volume,
+                  play_id=play_id, audio_url=audio_url, key=key, default=None)
+
+    # Show speaking indicator until the browser reports the end of speech
+    if status and status.get("play_id") == play_id and status.get("state") == "speaking":
+        st.caption("🔊 Speaking...")
+
     # Show repeat button if enabled
     if show_repeat_button:
-        if st.button("🔄 Repeat Question", key=f"repeat_{component_id}"):
-            # Create repeat TTS component
-            repeat_html = f"""
-            <script>
-            if (typeof window.speakQuestion_{component_id} === 'function') {{
-                window.speakQuestion_{component_id}();
-            }} else {{
-                // Fallback if function not available
-                const utterance = new SpeechSynthesisUtterance('{clean_question}');
-                utterance.rate = {voice_rate};
-                utterance.volume = {voice_volume};
-                utterance.lang = 'en-US';
-                window.speechSynthesis.speak(utterance);
-            }}
-            </script>
-            """
-            components.html(repeat_html, height=0)
-            
-            # Show speaking indicator again
-            with st.spinner('🔊 Speaking...'):
-                time.sleep(display_duration)
+        st.button("🔄 Repeat Question", key=f"repeat_{key}", on_click=replay_question, args=(key,))
+
+    return status
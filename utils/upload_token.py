@@ -0,0 +1,120 @@
+# 📁 utils/upload_token.py
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from .logger import setup_logger
+
+# Setup logger
+logger = setup_logger("upload_token")
+
+# Secret shared with the backend, which verifies the tokens the browser sends
+# with direct uploads. Direct uploads are disabled while it is unset.
+UPLOAD_TOKEN_SECRET_ENV = "DIRECT_UPLOAD_SECRET"
+
+# Seconds a token stays valid; long enough for one answer plus its upload
+UPLOAD_TOKEN_TTL = 600
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _get_secret(secret: Optional[str] = None) -> Optional[bytes]:
+    secret = secret or os.environ.get(UPLOAD_TOKEN_SECRET_ENV)
+    return secret.encode("utf-8") if secret else None
+
+def direct_upload_enabled() -> bool:
+    """Whether a signing secret is configured for direct uploads."""
+    return _get_secret() is not None
+
+def create_upload_token(email: str, question: str, ttl: int = UPLOAD_TOKEN_TTL,
+                        upload_id: Optional[str] = None, secret: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Sign a short-lived token that lets the browser upload one answer itself.
+
+    The token is ``<payload>.<signature>``, both base64url encoded; the payload
+    is JSON with the upload id, candidate email, a hash of the question and the
+    expiry time, and the signature is HMAC-SHA256 over the encoded payload.
+
+    Usage:
+        token, upload_id = create_upload_token(email, question)
+
+    Args:
+        email: Candidate the upload belongs to
+        question: Question being answered
+        ttl: Seconds until the token expires
+        upload_id: Upload id to renew a token for, a new one by default
+        secret: Signing secret, read from DIRECT_UPLOAD_SECRET by default
+
+    Returns:
+        Tuple of (token, upload id)
+
+    Raises:
+        RuntimeError: If no signing secret is configured
+    """
+    key = _get_secret(secret)
+    if key is None:
+        raise RuntimeError(f"{UPLOAD_TOKEN_SECRET_ENV} is not set, direct uploads are disabled")
+
+    upload_id = upload_id or uuid.uuid4().hex
+    claims = {
+        "upload_id": upload_id,
+        "email": email,
+        "question_sha256": hashlib.sha256(question.encode("utf-8")).hexdigest(),
+        "exp": int(time.time()) + ttl,
+    }
+    payload = _b64encode(json.dumps(claims, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+    signature = _b64encode(hmac.new(key, payload.encode("ascii"), hashlib.sha256).digest())
+    logger.debug("Issued upload token %s for user %s, valid for %ss", upload_id, email, ttl)
+    return f"{payload}.{signature}", upload_id
+
+def verify_upload_token(token: str, secret: Optional[str] = None, now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Check a token's signature and expiry and return its claims.
+
+    This is the check the backend runs on every direct upload; it is kept here
+    so both sides agree on the format.
+
+    Args:
+        token: Token from create_upload_token
+        secret: Signing secret, read from DIRECT_UPLOAD_SECRET by default
+        now: Current Unix time, for testing
+
+    Returns:
+        Token claims
+
+    Raises:
+        ValueError: If the token is malformed, forged or expired
+        RuntimeError: If no signing secret is configured
+    """
+    key = _get_secret(secret)
+    if key is None:
+        raise RuntimeError(f"{UPLOAD_TOKEN_SECRET_ENV} is not set, direct uploads are disabled")
+
+    try:
+        payload, signature = token.split(".")
+        expected = hmac.new(key, payload.encode("ascii"), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            raise ValueError("bad signature")
+        claims = json.loads(_b64decode(payload))
+        if not isinstance(claims, dict):
+            raise ValueError("claims are not an object")
+        if not isinstance(claims.get("exp", 0), (int, float)):
+            raise ValueError("expiry is not a number")
+    except (ValueError, UnicodeError, TypeError) as e:
+        raise ValueError(f"Invalid upload token: {str(e)}") from e
+
+    if claims.get("exp", 0) < (time.time() if now is None else now):
+        raise ValueError(f"Upload token {claims.get('upload_id')} has expired")
+    return claims
+
+def question_matches(claims: Dict[str, Any], question: str) -> bool:
+    """Whether a verified token was issued for this question."""
+    return hmac.compare_digest(claims.get("question_sha256", ""),
+                               hashlib.sha256(question.encode("utf-8")).hexdigest())